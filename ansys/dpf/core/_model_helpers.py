@@ -17,6 +17,12 @@ class DataSourcesOrStreamsConnector:
             return self._metadata().time_freq_support
         return None
 
+    @property
+    def meshed_region(self):
+        if self._metadata():
+            return self._metadata().meshed_region
+        return None
+
     @property
     def mesh_provider(self):
         if self._metadata():
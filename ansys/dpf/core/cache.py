@@ -1,22 +1,63 @@
+import functools
+import sys
+from collections import OrderedDict
 from typing import NamedTuple
 
+import numpy as np
 
-def class_handling_cache(cls):
+
+def class_handling_cache(cls=None, max_entries=None, max_bytes=None):
     """Class decorator used to handle cache.
     To use it, add a ''_to_cache'' static attribute in the given class.
     This private dictionary should map class getters to their list of setters.
     At initialization, this decorator add a ''_cache'' property to the class.
     This new property is an instance of ''CacheHandler''.
 
+    The decorator can be used without arguments, or with the maximum number of
+    entries and the maximum size in bytes each instance's cache can hold, in
+    which case the least recently used entries are evicted first.
+
     .. note::
        The method must be used as a class decorator.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of results cached by each instance. The default is
+        ``None``, in which case the number of entries is not bounded.
+    max_bytes : int, optional
+        Maximum estimated size in bytes of the results cached by each instance.
+        The default is ``None``, in which case the size is not bounded.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core.cache import class_handling_cache
+    >>> @class_handling_cache(max_entries=16)
+    ... class Mesh:
+    ...     def get_unit(self):
+    ...         return "m"
+    ...     def set_unit(self, unit):
+    ...         pass
+    ...     _to_cache = {get_unit: [set_unit]}
+    >>> mesh = Mesh()
+    >>> mesh.get_unit()
+    'm'
+    >>> mesh.get_unit()
+    'm'
+    >>> mesh._cache.cache_info().hits
+    1
+
     """
+    if cls is None:
+        return functools.partial(
+            class_handling_cache, max_entries=max_entries, max_bytes=max_bytes
+        )
     if hasattr(cls, "_to_cache"):
         def get_handler(mesh):
             if hasattr(mesh, "__cache"):
                 return mesh.__cache
             else:
-                setattr(mesh, "__cache", CacheHandler(cls, cls._to_cache))
+                setattr(mesh, "__cache", CacheHandler(cls, cls._to_cache, max_entries, max_bytes))
             return mesh.__cache
         for getter, setters in cls._to_cache.items():
             if setters:
@@ -30,8 +71,8 @@ def class_handling_cache(cls):
 
 class MethodIdentifier(NamedTuple):
     method_name: str
-    args: list
-    kwargs: dict
+    args: tuple
+    kwargs: tuple
 
     def __eq__(self, other):
         if isinstance(other, str):
@@ -42,12 +83,29 @@ class MethodIdentifier(NamedTuple):
                    and self.kwargs == other.kwargs
 
     def __hash__(self):
-        hash = self.method_name.__hash__()
-        if self.args:
-            hash += self.args.__hash__()
-        if self.kwargs:
-            hash += self.kwargs.__hash__()
-        return hash
+        return hash((self.method_name, self.args, self.kwargs))
+
+    @classmethod
+    def from_call(cls, method_name, args, kwargs):
+        """Create an identifier from the arguments of a call.
+
+        Lists, dictionaries, sets and numpy arrays arguments are converted to
+        hashable values. A ``TypeError`` is raised for other unhashable arguments.
+        """
+        return cls(
+            method_name,
+            _hashable(args),
+            tuple(sorted((key, _hashable(value)) for key, value in kwargs.items())),
+        )
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+    bytes: int
+    max_bytes: int
 
 
 class CacheHandler:
@@ -59,6 +117,8 @@ class CacheHandler:
     with the same parameters, the data is directly recovered instead of reevaluated.
     When the setters associated to getters in the input dictionary are called,
     their associated getters' caches are cleared.
+    When a maximum number of entries or of bytes is given, the least recently
+    used results are evicted to respect it.
 
     Parameters
     ----------
@@ -67,8 +127,16 @@ class CacheHandler:
 
     getters_to_setters_dict : dict[function:list[function]]
         Map class getters to their list of setters which need to be cached
+
+    max_entries : int, optional
+        Maximum number of cached results. The default is ``None``, in which
+        case the number of entries is not bounded.
+
+    max_bytes : int, optional
+        Maximum estimated size in bytes of the cached results. The default is
+        ``None``, in which case the size is not bounded.
     """
-    def __init__(self, cls, getters_to_setters_dict):
+    def __init__(self, cls, getters_to_setters_dict, max_entries=None, max_bytes=None):
 
         self.getter_to_setters_name = {}
         for getter, setters in getters_to_setters_dict.items():
@@ -81,26 +149,110 @@ class CacheHandler:
         self.setter_to_getter_names = {}
         for getter, setters in self.getter_to_setters_name.items():
             for setter in setters:
-                self.setter_to_getter_names[setter] = getter
+                self.setter_to_getter_names.setdefault(setter, []).append(getter)
 
-        self.cached = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cached = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
 
     def handle(self, object, func, *args, **kwargs):
-        identifier = MethodIdentifier(func.__name__, args, kwargs)
-        if identifier in self.cached:
-            return self.cached[identifier]
-        elif func.__name__ in self.getter_to_setters_name:
-            self.cached[identifier] = func(object, *args, **kwargs)
-            setattr(func, "under_cache", False)
-            return self.cached[identifier]
+        name = func.__name__
+        if name in self.getter_to_setters_name:
+            try:
+                identifier = MethodIdentifier.from_call(name, args, kwargs)
+            except TypeError:
+                # arguments which cannot be hashed are not cached
+                self.misses += 1
+                return func(object, *args, **kwargs)
+            if identifier in self.cached:
+                self.hits += 1
+                self.cached.move_to_end(identifier)
+                return self.cached[identifier]
+            self.misses += 1
+            result = func(object, *args, **kwargs)
+            self._add(identifier, result)
+            return result
         else:
-            if func.__name__ in self.setter_to_getter_names \
-                    and self.setter_to_getter_names[func.__name__] in self.cached:
-                del self.cached[self.setter_to_getter_names[func.__name__]]
-            return func(object, *args, **kwargs)
+            try:
+                return func(object, *args, **kwargs)
+            finally:
+                if name in self.setter_to_getter_names:
+                    self.invalidate(*self.setter_to_getter_names[name])
+
+    def _add(self, identifier, result):
+        size = _estimate_size(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self.cached[identifier] = result
+        self._sizes[identifier] = size
+        self._bytes += size
+        while (
+                (self.max_entries is not None and len(self.cached) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self.cached)))
+
+    def _remove(self, identifier):
+        del self.cached[identifier]
+        self._bytes -= self._sizes.pop(identifier)
+
+    def invalidate(self, *getter_names):
+        """Remove the cached results of getters, whatever their arguments.
+
+        Parameters
+        ----------
+        *getter_names : str
+            Names of the getters.
+        """
+        for identifier in [key for key in self.cached if key.method_name in getter_names]:
+            self._remove(identifier)
+
+    def cache_info(self):
+        """Statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            Number of hits and misses, and current and maximum numbers of entries
+            and of bytes.
+        """
+        return CacheInfo(self.hits, self.misses, len(self.cached), self.max_entries,
+                         self._bytes, self.max_bytes)
 
     def clear(self):
-        self.cached = {}
+        self.cached = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+
+
+def _hashable(value):
+    """Convert a value to a hashable value, raise a ``TypeError`` if it is not possible."""
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_hashable(item) for item in value)
+    elif isinstance(value, dict):
+        return "dict", tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        return "set", frozenset(_hashable(item) for item in value)
+    elif isinstance(value, np.ndarray):
+        return "ndarray", value.dtype.str, value.shape, value.tobytes()
+    hash(value)
+    return value
+
+
+def _estimate_size(value):
+    """Estimate the memory used by a cached result, including its items or data."""
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (value.nbytes if value.base is not None else 0)
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(_estimate_size(key) + _estimate_size(item) for key, item in value.items())
+    return size
 
 
 def _handle_cache(func):
@@ -111,12 +263,13 @@ def _handle_cache(func):
        The method must be used as a decorator.
     """
 
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         """Call the original function"""
         if hasattr(self, "_cache"):
             return self._cache.handle(self, func, *args, **kwargs)
         else:
-            func(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
 
     return wrapper
 
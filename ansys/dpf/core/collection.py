@@ -27,6 +27,10 @@ from ansys.dpf.gate import (
 )
 
 
+#: Value of a label in the label table of a collection for entries without this label.
+_MISSING_LABEL_VALUE = np.iinfo(np.int64).min
+
+
 class Collection:
     """Represents a collection of entries ordered by labels and IDs.
 
@@ -62,6 +66,8 @@ class Collection:
             else:
                 self._internal_obj = collection
         self.owned = False
+        self._label_spaces = None
+        self._label_table = None
 
     @property
     def _server(self):
@@ -157,6 +163,7 @@ class Collection:
             self._api.collection_add_label_with_default_value(self, label, default_value)
         else:
             self._api.collection_add_label(self, label)
+        self._invalidate_label_spaces()
 
     def _get_labels(self):
         """Retrieve labels scoping the collection.
@@ -216,14 +223,23 @@ class Collection:
             Entries corresponding to the request.
         """
         if isinstance(label_space_or_index, dict):
-            client_label_space = self._create_client_label_space(label_space_or_index)
-            num = self._api.collection_get_num_obj_for_label_space(self, client_label_space)
-            out = []
-            for i in range(0, num):
-                out.append(self.create_subtype(
-                    self._api.collection_get_obj_by_index_for_label_space(
-                        self, client_label_space, i)))
-            return out
+            indices = self._find_indices(label_space_or_index)
+            if indices is None:
+                # labels unknown to the entries are matched by the server
+                client_label_space = self._create_client_label_space(label_space_or_index)
+                num = self._api.collection_get_num_obj_for_label_space(self, client_label_space)
+                return [
+                    self.create_subtype(
+                        self._api.collection_get_obj_by_index_for_label_space(
+                            self, client_label_space, i
+                        )
+                    )
+                    for i in range(num)
+                ]
+            return [
+                self.create_subtype(self._api.collection_get_obj_by_index(self, index))
+                for index in indices.tolist()
+            ]
         else:
             return self.create_subtype(
                 self._api.collection_get_obj_by_index(self, label_space_or_index)
@@ -268,9 +284,90 @@ class Collection:
             Scoping of the requested entry. For example,
             ``{"time": 1, "complex": 0}``.
         """
-        return self._create_dict_from_client_label_space(
-            self._api.collection_get_obj_label_space_by_index(self, index)
-        )
+        return dict(self._get_label_spaces()[index])
+
+    def _get_label_spaces(self):
+        """Retrieve the label spaces of all the entries.
+
+        The label spaces are requested once and cached in a table holding
+        one array of values per label. The cache is invalidated by every
+        method of this instance modifying the entries or the labels of the
+        collection, and rebuilt when the number of entries differs from the
+        cached one, which happens when the collection is modified through
+        another reference.
+
+        Returns
+        -------
+        label_spaces : list[dict(str:int)]
+        """
+        if self._label_spaces is None or len(self._label_spaces) != len(self):
+            self._label_spaces = self._fetch_label_spaces()
+            self._label_table = {}
+        return self._label_spaces
+
+    def _fetch_label_spaces(self):
+        """Request the label spaces of all the entries from the server.
+
+        On gRPC servers, all the entries are requested at once with an empty
+        label space, which every entry matches. Otherwise, or if the server
+        does not return every entry, the label spaces are requested by index.
+        """
+        size = len(self)
+        if size and self._api is collection_grpcapi.CollectionGRPCAPI:
+            entries = self._api._collection_get_entries(
+                self, self._create_client_label_space({})
+            )
+            if len(entries) == size:
+                return [dict(entry.label_space) for entry in entries]
+        return [
+            self._create_dict_from_client_label_space(
+                self._api.collection_get_obj_label_space_by_index(self, index)
+            )
+            for index in range(size)
+        ]
+
+    def _invalidate_label_spaces(self):
+        """Clear the cached label spaces after the collection is modified."""
+        self._label_spaces = None
+        self._label_table = None
+
+    def _get_label_values(self, label):
+        """Retrieve the value of a label for all the entries.
+
+        Entries without this label have the value ``_MISSING_LABEL_VALUE``.
+        """
+        label_spaces = self._get_label_spaces()
+        if label not in self._label_table:
+            self._label_table[label] = np.fromiter(
+                (label_space.get(label, _MISSING_LABEL_VALUE) for label_space in label_spaces),
+                dtype=np.int64,
+                count=len(label_spaces),
+            )
+        return self._label_table[label]
+
+    def _find_indices(self, label_space):
+        """Retrieve the indices of the entries matching all the labels of a label space.
+
+        Parameters
+        ----------
+        label_space : dict[str,int]
+            Label space to match. For example, ``{"time": 1}`` matches the
+            entries at time ``1`` whatever their other labels.
+
+        Returns
+        -------
+        indices : numpy.ndarray, None
+            ``None`` when a label of the label space is not a label of the
+            entries, in which case the matching is left to the server.
+        """
+        label_spaces = self._get_label_spaces()
+        known_labels = set().union(*label_spaces)
+        if any(label not in known_labels for label in label_space):
+            return None
+        mask = np.ones(len(label_spaces), dtype=bool)
+        for label, value in label_space.items():
+            mask &= self._get_label_values(label) == value
+        return np.flatnonzero(mask)
 
     def get_available_ids_for_label(self, label="time"):
         """Retrieve the IDs assigned to an input label.
@@ -379,6 +476,7 @@ class Collection:
         """
         client_label_space = self._create_client_label_space(label_space)
         self._api.collection_add_entry(self, client_label_space, entry)
+        self._invalidate_label_spaces()
 
     def _get_time_freq_support(self):
         """Retrieve time frequency support.
@@ -274,6 +274,17 @@ class DataSources:
                         response.append(path)
             return response
 
+    def _file_paths(self):
+        """List of ``(key, path)`` pairs of all the files contained in the data sources."""
+        response = []
+        num_keys = self._api.data_sources_get_num_keys(self)
+        for i_key in range(num_keys):
+            num_paths = integral_types.MutableInt32()
+            key = self._api.data_sources_get_key(self, i_key, num_paths)
+            for i_path in range(int(num_paths)):
+                response.append((key, self._api.data_sources_get_path(self, key, i_path)))
+        return response
+
     def __str__(self):
         """Describe the entity.
 
@@ -19,6 +19,7 @@ from ansys.dpf.core.mapping_types import types
 from ansys.dpf.core.common import types_enum_to_types
 from ansys.dpf.core.outputs import Output, Outputs, _Outputs
 from ansys.dpf.core import server as server_module
+from ansys.dpf.core import field_data_cache, misc
 from ansys.dpf.core.operator_specification import Specification
 from ansys.dpf.gate import operator_capi, operator_abstract_api, operator_grpcapi, \
     data_processing_capi, data_processing_grpcapi, collection_capi, collection_grpcapi, \
@@ -91,6 +92,9 @@ class Operator:
         self._internal_obj = None
         self._description = None
         self._inputs = None
+        # keys of the connected inputs used by the field data cache, ``None``
+        # when an input was connected while the cache was disabled
+        self._cache_keys = {} if misc.FIELD_DATA_CACHE is not None else None
 
         # step 1: get server
         self._server = server_module.get_or_create_server(server)
@@ -212,7 +216,12 @@ class Operator:
         """
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
-        elif isinstance(inpt, Operator):
+        if self._cache_keys is not None:
+            if misc.FIELD_DATA_CACHE is None:
+                self._cache_keys = None
+            else:
+                self._cache_keys[pin] = field_data_cache._input_key(inpt, pin_out)
+        if isinstance(inpt, Operator):
             self._api.operator_connect_operator_output(self, pin, inpt, pin_out)
         elif isinstance(inpt, Output):
             self._api.operator_connect_operator_output(self, pin, inpt._operator, inpt._pin)
@@ -327,7 +336,7 @@ class Operator:
             (Operator, self._api.operator_connect_operator_as_input),
         ]
 
-    def get_output(self, pin=0, output_type=None):
+    def get_output(self, pin=0, output_type=None, use_cache=False):
         """Retrieve the output of the operator on the pin number.
 
         To activate the progress bar for server version higher or equal to 3.0,
@@ -339,12 +348,21 @@ class Operator:
             Number of the output pin. The default is ``0``.
         output_type : :class:`ansys.dpf.core.common.types`, type,  optional
             Requested type of the output. The default is ``None``.
+        use_cache : bool, optional
+            Whether to look a field or fields container output up in the field
+            data cache enabled with
+            :func:`ansys.dpf.core.settings.enable_field_data_cache`, and store it
+            there on a miss. The outputs loaded from the cache are not supported
+            by meshed regions or time frequency supports. The default is
+            ``False``.
 
         Returns
         -------
         type
             Output of the operator.
         """
+        if use_cache:
+            return self._get_cached_output(pin, output_type)
         output_type = _write_output_type_to_type(output_type)
         if self._server.meet_version("3.0") and self.progress_bar:
             self._server._session.add_operator(self, pin, "operator")
@@ -398,6 +416,42 @@ class Operator:
         value : Config
         """
         self._api.operator_set_config(self, value)
+        if self._cache_keys is not None:
+            options = sorted(value.options.items())
+            self._cache_keys["config"] = lambda: options
+
+    def _get_cached_output(self, pin, output_type):
+        """Get a field or fields container output through the field data cache.
+
+        The output is evaluated and stored on a miss. The outputs loaded from
+        the cache are not supported by meshed regions, the callers must connect
+        the supports back, as :func:`ansys.dpf.core.results.Result.eval` does.
+        """
+        cache = misc.FIELD_DATA_CACHE
+        cached_types = (types_enum_to_types()[types.field],
+                        types_enum_to_types()[types.fields_container])
+        key = None
+        if cache is not None and _write_output_type_to_type(output_type) in cached_types:
+            key = self._cache_key(pin)
+        if key is None:
+            return self.get_output(pin, output_type)
+        out = cache.load(key, self._server)
+        if out is None or not isinstance(out, _write_output_type_to_type(output_type)):
+            out = self.get_output(pin, output_type)
+            cache.store(key, out)
+        return out
+
+    def _cache_key(self, pin=0):
+        """Key of an output in the field data cache, ``None`` if it cannot be cached."""
+        if self._cache_keys is None:
+            return None
+        inputs = []
+        for input_pin, input_key in self._cache_keys.items():
+            value = input_key() if input_key is not None else None
+            if value is None:
+                return None
+            inputs.append((str(input_pin), value))
+        return [self.name, pin, sorted(inputs)]
 
     @property
     def inputs(self):
@@ -4,6 +4,7 @@
 Elements
 ========
 """
+import functools
 from enum import Enum
 import numpy as np
 from ansys.dpf.core import nodes, scoping
@@ -172,9 +173,7 @@ class Element:
 
     def _get_type(self):
         """Retrieve the Ansys element type."""
-        type = integral_types.MutableInt32()
-        self._mesh._api.meshed_region_get_element_type(self._mesh, self.id, type, self.index)
-        return element_types(int(type))
+        return element_types(int(self._mesh.elements.types[self.index]))
 
     @property
     def shape(self) -> str:
@@ -251,6 +250,12 @@ class Elements:
         self._mesh = mesh
         self._server = mesh._server
         self._mapping_id_to_index = None
+        self._id_index = None
+        self._scoping_maps = scoping._ScopingMapCache()
+        self._ids = None
+        self._types = None
+        self._connectivity = None
+        self._offsets = None
 
     def __str__(self):
         return "DPF Elements object with %d elements" % len(self)
@@ -263,7 +268,7 @@ class Elements:
         return self.n_elements
 
     def __iter__(self):
-        for i in range(len(self)):
+        for i in range(len(self.ids)):
             yield self[i]
 
     def element_by_id(self, id) -> Element:
@@ -346,6 +351,7 @@ class Elements:
             self._mesh._api.meshed_region_add_element_by_shape(self._mesh, add.id,
                                                                len(add.connectivity),
                                                                add.connectivity, shape_id)
+            self._clear_cache()
 
     def add_solid_element(self, id, connectivity):
         """
@@ -421,6 +427,7 @@ class Elements:
         shape_id = _element_shapes[shape.upper()].value
         self._mesh._api.meshed_region_add_element_by_shape(self._mesh, id, len(connectivity),
                                                            connectivity, shape_id)
+        self._clear_cache()
 
     def __get_element(self, elementindex=None, elementid=None):
         """
@@ -438,35 +445,117 @@ class Elements:
         element : Element
         """
         if elementindex is None:
-            elementindex = self._mesh._api.meshed_region_get_element_index(self._mesh, elementid)
+            elementindex = self._get_id_index().index(elementid)
+            if elementindex < 0:
+                raise ValueError(f"Element with ID {elementid} is not in the mesh.")
         elif elementid is None:
-            elementid = self._mesh._api.meshed_region_get_element_id(self._mesh, elementindex)
-        nodesOut = []
-        num_nodes = self._mesh._api.meshed_region_get_num_nodes_of_element(self._mesh,
-                                                                           index=elementindex)
-        for i_node in range(num_nodes):
-            node_id = self._mesh._api.meshed_region_get_node_id_of_element(
-                self._mesh, elementindex, i_node
-            )
-            if node_id >= 0:
-                node_index = self._mesh._api.meshed_region_get_node_index(self._mesh, node_id)
-                node_coordinates = [self._mesh._api.meshed_region_get_node_coord(
-                    self._mesh,
-                    index=node_index,
-                    coordinate=0),
-                                    self._mesh._api.meshed_region_get_node_coord(
-                                        self._mesh,
-                                        index=node_index,
-                                        coordinate=1),
-                                    self._mesh._api.meshed_region_get_node_coord(
-                                        self._mesh,
-                                        index=node_index,
-                                        coordinate=2)]
-                nodesOut.append(
-                    nodes.Node(self._mesh, node_id, node_index, node_coordinates)
-                )
+            elementid = int(self.ids[elementindex])
+        connectivity, offsets = self._get_csr_connectivity()
+        node_indices = connectivity[offsets[elementindex]:offsets[elementindex + 1]]
+        mesh_nodes = self._mesh.nodes
+        node_ids = mesh_nodes.ids
+        coordinates = mesh_nodes.coordinates
+        nodesOut = [
+            nodes.Node(self._mesh, int(node_ids[node_index]), node_index,
+                       coordinates[node_index].tolist())
+            for node_index in node_indices.tolist()
+            if node_index >= 0
+        ]
         return Element(self._mesh, elementid, elementindex, nodesOut)
 
+    @property
+    def ids(self):
+        """
+        IDs of all the elements, ordered by index.
+
+        The IDs are requested from the server once and cached until elements
+        are added to the mesh or one of its property fields is set.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> element_ids = elements.ids
+
+        """
+        if self._ids is None:
+            self._ids = np.asarray(self.scoping.ids)
+        return self._ids
+
+    @property
+    def types(self):
+        """
+        Ansys element types of all the elements, ordered by index.
+
+        The types are requested from the server once and cached until elements
+        are added to the mesh or one of its property fields is set.
+
+        Returns
+        -------
+        types : numpy.ndarray
+            Values of :class:`ansys.dpf.core.elements.element_types`.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> print(elements.types)
+        [1 1 1 1 1 1 1 1]
+
+        """
+        if self._types is None:
+            self._types = np.asarray(self.element_types_field.data)
+        return self._types
+
+    def _get_csr_connectivity(self):
+        """Retrieve the node indices of all the elements in compressed sparse row format.
+
+        Returns
+        -------
+        connectivity : numpy.ndarray
+            Node indices of all the elements, concatenated.
+        offsets : numpy.ndarray
+            Position of the first node of each element in ``connectivity``,
+            followed by the size of ``connectivity``. The node indices of the
+            element ``i`` are ``connectivity[offsets[i]:offsets[i + 1]]``.
+        """
+        if self._connectivity is None:
+            field = self.connectivities_field
+            connectivity = np.asarray(field.data).ravel()
+            data_pointer = np.asarray(field._data_pointer)
+            if data_pointer.size == 0:
+                n_elements = len(self.ids)
+                nodes_per_element = connectivity.size // n_elements if n_elements else 0
+                data_pointer = np.arange(n_elements) * nodes_per_element
+            self._offsets = np.append(data_pointer, connectivity.size)
+            self._connectivity = connectivity
+        return self._connectivity, self._offsets
+
+    def _get_id_index(self):
+        """Retrieve the vectorized mapping between the IDs and indices of the elements."""
+        if self._id_index is None:
+            self._id_index = scoping._IdIndex(self.ids)
+        return self._id_index
+
+    def _clear_cache(self):
+        """Forget the arrays cached from the server when the elements change."""
+        self._mapping_id_to_index = None
+        self._id_index = None
+        self._scoping_maps = scoping._ScopingMapCache()
+        self._ids = None
+        self._types = None
+        self._connectivity = None
+        self._offsets = None
+        self._mesh._clear_grid_cache()
+
     @property
     def scoping(self) -> scoping.Scoping:
         """
@@ -608,7 +697,7 @@ class Elements:
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return {eid: i for i, eid in enumerate(self.ids.tolist())}
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -664,11 +753,14 @@ class Elements:
 
         """
         if external_scope.location in ["Nodal", "NodalElemental"]:
-            raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+            raise ValueError('Input scope location must be "Elemental"')
+        indices = self._get_id_index().indices(external_scope.ids)
+        mask = indices >= 0
+        return indices[mask], mask
+
+    def _map_scoping_cached(self, external_scope):
+        """Cached :func:`map_scoping`, shared by the scopings with the same IDs."""
+        return self._scoping_maps.map(self._get_id_index(), external_scope.ids)
 
     @property
     def has_shell_elements(self) -> bool:
@@ -924,6 +1016,7 @@ class element_types(Enum):
     Polyhedron = 34
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _descriptors():
         return {
             element_types.General: ElementDescriptor(
@@ -1304,6 +1397,132 @@ class element_types(Enum):
         descriptor = element_types._descriptors().get(element_type, None)
         return descriptor
 
+    @staticmethod
+    def shapes(element_types_array):
+        """
+        Retrieve the shapes of an array of element types.
+
+        Parameters
+        ----------
+        element_types_array : numpy.ndarray, list[int]
+            Types of elements, for example the data of
+            :func:`Elements.element_types_field`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Shapes of the elements. Options are ``"solid"``, ``"shell"``,
+            ``"beam"``, ``"point"`` and ``"unknown_shape"``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> dpf.element_types.shapes([1, 16, 18])
+        array(['solid', 'shell', 'beam'], dtype='<U13')
+
+        """
+        return _SHAPES[_type_indices(element_types_array)]
+
+    @staticmethod
+    def shape_codes(element_types_array):
+        """
+        Retrieve the shapes of an array of element types as the values of
+        the ``"elshape"`` label of fields containers.
+
+        Parameters
+        ----------
+        element_types_array : numpy.ndarray, list[int]
+            Types of elements.
+
+        Returns
+        -------
+        numpy.ndarray
+            Shapes of the elements: ``0`` for shells, ``1`` for solids, ``2`` for
+            beams and ``3`` for other elements.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> dpf.element_types.shape_codes([1, 16, 18, 9])
+        array([1, 0, 2, 3])
+
+        """
+        return _SHAPE_CODES[_type_indices(element_types_array)]
+
+    @staticmethod
+    def n_nodes(element_types_array):
+        """
+        Retrieve the numbers of nodes of an array of element types.
+
+        Parameters
+        ----------
+        element_types_array : numpy.ndarray, list[int]
+            Types of elements.
+
+        Returns
+        -------
+        numpy.ndarray
+            Numbers of nodes of the elements, ``-1`` when it is not fixed
+            or not known.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> dpf.element_types.n_nodes([1, 16, 33])
+        array([20,  4, -1])
+
+        """
+        return _N_NODES[_type_indices(element_types_array)]
+
+    @staticmethod
+    def n_corner_nodes(element_types_array):
+        """
+        Retrieve the numbers of corner nodes of an array of element types.
+
+        Parameters
+        ----------
+        element_types_array : numpy.ndarray, list[int]
+            Types of elements.
+
+        Returns
+        -------
+        numpy.ndarray
+            Numbers of corner nodes of the elements, ``-1`` when it is not fixed
+            or not known.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> dpf.element_types.n_corner_nodes([1, 16, 33])
+        array([ 8,  4, -1])
+
+        """
+        return _N_CORNER_NODES[_type_indices(element_types_array)]
+
+    @staticmethod
+    def is_quadratic(element_types_array):
+        """
+        Retrieve whether the elements of an array of element types are quadratic.
+
+        Parameters
+        ----------
+        element_types_array : numpy.ndarray, list[int]
+            Types of elements.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array, ``True`` for quadratic elements.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> dpf.element_types.is_quadratic([1, 16])
+        array([ True, False])
+
+        """
+        return _IS_QUADRATIC[_type_indices(element_types_array)]
+
 
 class _element_shapes(Enum):
     # NODAL = 0
@@ -1312,3 +1531,35 @@ class _element_shapes(Enum):
     SOLID = 1
     BEAM = 2
     UNKNOWN_SHAPE = 3
+
+
+def _lookup_table(get_value):
+    """Build an array of a property of the element descriptors indexed by element type."""
+    descriptors = element_types._descriptors()
+    return np.array([get_value(descriptors[element_types(i)]) for i in range(_N_TYPES)])
+
+
+def _shape_code(descriptor):
+    name = descriptor.shape.upper()
+    if name in _element_shapes.__members__:
+        return _element_shapes[name].value
+    return _element_shapes.UNKNOWN_SHAPE.value
+
+
+def _type_indices(element_types_array):
+    """Convert element types to indices of the lookup tables, unknown types to ``Unknown``."""
+    types = np.asarray(element_types_array, dtype=np.int64)
+    return np.where((types >= 0) & (types < _N_TYPES), types, element_types.Unknown.value)
+
+
+_N_TYPES = element_types.Polyhedron.value + 1
+_SHAPES = _lookup_table(lambda descriptor: descriptor.shape)
+_SHAPE_CODES = _lookup_table(_shape_code)
+_N_NODES = _lookup_table(
+    lambda descriptor: descriptor.n_nodes if descriptor.n_nodes is not None else -1
+)
+_N_CORNER_NODES = _lookup_table(
+    lambda descriptor: descriptor.n_corner_nodes
+    if descriptor.n_corner_nodes is not None else -1
+)
+_IS_QUADRATIC = _lookup_table(lambda descriptor: bool(descriptor.is_quadratic))
@@ -23,7 +23,7 @@ or the result at a defined sweeping phase before plotting.
 _FIELD_CONTAINER_PLOTTING_MSG = """"
 This fields_container contains multiple fields.  Only one time-step
 result can be plotted at a time. Extract a field with
-``fields_container[index]``.
+``fields_container[index]`` or animate the results with ``Plotter.animate``.
 """
 
 
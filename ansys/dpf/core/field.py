@@ -7,7 +7,7 @@ Field
 
 import numpy as np
 from ansys import dpf
-from ansys.dpf.core import errors, meshed_region, time_freq_support, scoping
+from ansys.dpf.core import errors, meshed_region, time_freq_support, scoping, misc
 from ansys.dpf.core import dimensionality
 from ansys.dpf.core.common import locations, natures, types, _get_size_of_list
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
@@ -111,6 +111,7 @@ class Field(_FieldBase):
         """Initialize the field either with an optional field message or
         by connecting to a stub.
         """
+        self._data_dtype = field._data_dtype if isinstance(field, Field) else None
         super().__init__(nentities, nature, location, field, server)
         self._field_definition = self._load_field_definition()
 
@@ -294,6 +295,7 @@ class Field(_FieldBase):
 
         except NotImplementedError:
             data = self._api.csfield_get_entity_data(self, index)
+        data = self._as_dtype(data)
         n_comp = self.component_count
         if n_comp != 1 and data.size != 0:
             data.shape = (data.size // n_comp, n_comp)
@@ -311,6 +313,7 @@ class Field(_FieldBase):
             if index < 0:
                 raise ValueError(f"The ID {id} must be greater than 0.")
             data = self.get_entity_data(index)
+        data = self._as_dtype(data)
         n_comp = self.component_count
         if n_comp != 1 and data.size != 0:
             data.shape = (data.size // n_comp, n_comp)
@@ -318,10 +321,155 @@ class Field(_FieldBase):
 
     def append(self, data, scopingid):
         if isinstance(data, list):
-            if isinstance(data[0], list):
+            if data and isinstance(data[0], list):
                 data = np.array(data)
         self._api.csfield_push_back(self, scopingid, _get_size_of_list(data), data)
 
+    def iter_chunks(self, n_entities):
+        """Iterate over the field's data by chunks of entities.
+
+        Only the data of one chunk is held by the client at a time, which allows
+        processing fields that do not fit in the client's memory. With a remote
+        server, each chunk is extracted on the server by a ``Rescope`` operator
+        and transferred in its own request, so that the size of each request is
+        bounded by the size of a chunk. With an in-process server, the chunks
+        are views on the field's data and no copy is made.
+
+        Parameters
+        ----------
+        n_entities : int
+            Maximum number of entities in each chunk.
+
+        Yields
+        ------
+        ids : numpy.ndarray
+            IDs of the entities in the chunk.
+        data : numpy.ndarray
+            Data of the entities in the chunk, shaped like the field's data.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> field = model.results.displacement().outputs.fields_container()[0]
+        >>> norms = [np.linalg.norm(data, axis=1) for ids, data in field.iter_chunks(10)]
+
+        """
+        if n_entities < 1:
+            raise ValueError("The number of entities per chunk must be positive.")
+        ids = np.asarray(self.scoping._get_ids(True), dtype=np.int32).ravel()
+        if not self._server.has_client():
+            data = self._get_data()
+            data_pointer = np.asarray(self._get_data_pointer(), dtype=np.int32).ravel()
+            if data_pointer.size:
+                # the data pointer counts values, and the data has one row per elementary data
+                rows = np.append(data_pointer, self.size) // self.component_count
+            for start in range(0, ids.size, n_entities):
+                stop = min(start + n_entities, ids.size)
+                if data_pointer.size:
+                    yield ids[start:stop], data[rows[start]:rows[stop]]
+                else:
+                    yield ids[start:stop], data[start:stop]
+            return
+
+        from ansys.dpf.core import dpf_operator
+
+        op = dpf_operator.Operator("Rescope", server=self._server)
+        op.connect(0, self)
+        for start in range(0, ids.size, n_entities):
+            chunk_ids = ids[start:start + n_entities]
+            chunk_scoping = scoping.Scoping(location=self.location, server=self._server)
+            chunk_scoping.ids = chunk_ids
+            op.connect(1, chunk_scoping)
+            chunk = op.get_output(0, types.field)
+            yield chunk_ids, self._as_dtype(chunk._get_data())
+
+    def write_chunks(self, chunks):
+        """Add data to the field chunk by chunk.
+
+        This method is the counterpart of :func:`Field.iter_chunks`. Each chunk is
+        sent to the server before the next one is requested from ``chunks``, so
+        that the data of the whole field never needs to be held by the client.
+        Chunks are added with :func:`append_many`, which leaves the data already
+        in the field untouched, so that each chunk costs only the size of its
+        own data.
+
+        Parameters
+        ----------
+        chunks : iterable
+            Chunks given as ``(ids, data)`` or ``(ids, data, data_pointer)``
+            tuples, with the same meaning as the arguments of
+            :func:`append_many`.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> field = model.results.displacement().outputs.fields_container()[0]
+        >>> copy = dpf.Field(nature=dpf.natures.vector)
+        >>> copy.write_chunks((ids, 2. * data) for ids, data in field.iter_chunks(10))
+
+        """
+        for chunk in chunks:
+            self.append_many(*chunk)
+
+    def to_mesh_array(self, mesh=None, fill=np.nan, out=None):
+        """Scatter the data of the field on the nodes or elements of a mesh.
+
+        The mapping of the field's scoping to the mesh is cached by the mesh
+        and reused by all the fields with the same scoping IDs.
+
+        Parameters
+        ----------
+        mesh : MeshedRegion, optional
+            Mesh to scatter the data on. The default is ``None``, in which case
+            the mesh supporting the field is used.
+        fill : float, optional
+            Value of the nodes or elements which are not in the field's scoping.
+            The default is ``numpy.nan``.
+        out : numpy.ndarray, optional
+            Array of shape ``(n_entities, n_components)``, or ``(n_entities,)``
+            for scalar fields, to write the data in. The values of the nodes or
+            elements which are not in the field's scoping are left unchanged.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data of the field ordered as the nodes or elements of the mesh.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> mesh = model.metadata.meshed_region
+        >>> disp = model.results.displacement().outputs.fields_container()[0]
+        >>> disp.to_mesh_array(mesh).shape
+        (81, 3)
+
+        """
+        if mesh is None:
+            mesh = self.meshed_region
+        if self.location == locations.nodal:
+            mesh_location = mesh.nodes
+        elif self.location == locations.elemental:
+            mesh_location = mesh.elements
+        else:
+            raise ValueError(
+                "Only fields with a nodal or elemental location can be scattered on a mesh."
+            )
+        data = self.data
+        if out is None:
+            n_comp = self.component_count
+            shape = (len(mesh_location), n_comp) if n_comp > 1 else (len(mesh_location),)
+            out = np.full(shape, fill, dtype=data.dtype)
+        indices, mask = mesh_location._map_scoping_cached(self.scoping)
+        out[indices] = data[mask]
+        return out
+
     def _get_data_pointer(self):
         try:
             vec = dpf_vector.DPFVectorInt(client=self._server.client)
@@ -345,6 +493,8 @@ class Field(_FieldBase):
             data = dpf_array.DPFArray(vec) if np_array else dpf_array.DPFArray(vec).tolist()
         except NotImplementedError:
             data = self._api.csfield_get_data(self, np_array)
+        if np_array:
+            data = self._as_dtype(data)
         n_comp = self.component_count
         if np_array and n_comp != 1 and data.size != 0:
             data.shape = (data.size // n_comp, n_comp)
@@ -367,12 +517,63 @@ class Field(_FieldBase):
                     f"shape {data.shape} was input"
                 )
             if data.dtype != np.float64:
-                copy = np.empty_like(data, shape=data.shape, dtype=np.float64)
-                copy[:] = data
-                data = copy
+                data = data.astype(np.float64)
         size = _get_size_of_list(data)
         return self._api.csfield_set_data(self, size, data)
 
+    def _set_entity_data(self, index, id, data):
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        return self._api.csfield_set_entity_data(self, index, id, data.size, data)
+
+    @property
+    def dtype(self):
+        """Type of the arrays returned by :attr:`data` and :func:`get_entity_data`.
+
+        Fields hold ``float64`` values on the server. When the type is
+        ``numpy.float32``, data is converted once when it is retrieved, and
+        local fields keep their data in ``float32`` buffers. The default is
+        given by :func:`ansys.dpf.core.settings.set_float32_fields`.
+
+        The ``float32`` arrays returned by :attr:`data` and
+        :func:`get_entity_data` are read-only copies. Modify the data with
+        :func:`data_view`, a local field or by setting :attr:`data`.
+
+        Returns
+        -------
+        dtype : type
+            ``numpy.float32`` or ``numpy.float64``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> field = dpf.fields_factory.create_scalar_field(2)
+        >>> field.data = [1., 2.]
+        >>> field.dtype = np.float32
+        >>> field.data.dtype
+        dtype('float32')
+
+        """
+        if self._data_dtype is None:
+            return np.float32 if misc.FLOAT32_FIELDS else np.float64
+        return self._data_dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        value = np.dtype(value).type
+        if value not in (np.float32, np.float64):
+            raise TypeError(f"Fields data can be numpy.float32 or numpy.float64, not {value}.")
+        self._data_dtype = value
+
+    def _as_dtype(self, data):
+        """Convert data retrieved from the server to :attr:`dtype`."""
+        if self.dtype is np.float32 and isinstance(data, np.ndarray) \
+                and data.dtype != np.float32:
+            data = np.array(data, dtype=np.float32)
+            # modifications of the copy would not be sent to the server
+            data.flags.writeable = False
+        return data
+
     def to_nodal(self):
         """Convert the field to one with a ``Nodal`` location.
 
@@ -738,7 +939,20 @@ class Field(_FieldBase):
         >>> deep_copy = field.deep_copy(server=other_server)
 
         """
+        f = self._deep_copy_data(server)
+        try:
+            f.meshed_region = self.meshed_region.deep_copy(server=server)
+        except:
+            pass
+        try:
+            f.time_freq_support = self.time_freq_support.deep_copy(server=server)
+        except:
+            pass
+
+        return f
 
+    def _deep_copy_data(self, server=None):
+        """Copy the scoping, data and definition of the field, without its supports."""
         f = Field(
             nentities=len(self.scoping),
             location=self.location,
@@ -754,15 +968,6 @@ class Field(_FieldBase):
             f._data_pointer = self._data_pointer
         except:
             pass
-        try:
-            f.meshed_region = self.meshed_region.deep_copy(server=server)
-        except:
-            pass
-        try:
-            f.time_freq_support = self.time_freq_support.deep_copy(server=server)
-        except:
-            pass
-
         return f
 
 
@@ -1,3 +1,4 @@
+import contextlib
 import traceback
 import warnings
 
@@ -372,6 +373,59 @@ class _FieldBase:
         """
         pass
 
+    def append_many(self, ids, data, data_pointer=None):
+        """Add the data of several entities to the existing data.
+
+        When the field is empty, its data, data pointer and scoping are set in
+        one request each. Otherwise, the new entities are appended one by one
+        so that the data already held by the field is neither retrieved nor
+        sent again, and the cost of each call depends only on its new data.
+
+        Parameters
+        ----------
+        ids : list of int or array
+            IDs of the scoping of the new entities.
+        data : list, array or list of arrays
+            Data of the new entities, either flat, shaped like the field's data,
+            or given as one array per entity when entities have different sizes.
+        data_pointer : list of int or array, optional
+            First index of each new entity in ``data``. Required only when a flat
+            ``data`` is given for entities of different sizes.
+
+        Examples
+        --------
+        >>> from ansys.dpf.core import fields_factory
+        >>> import numpy as np
+        >>> field = fields_factory.create_3d_vector_field(3)
+        >>> field.append_many([1, 2, 3], np.ones((3, 3)))
+        >>> field.data
+        array([[1., 1., 1.],
+               [1., 1., 1.],
+               [1., 1., 1.]])
+        >>> field.scoping.ids
+        <BLANKLINE>
+        ...[1, 2, 3]...
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).ravel()
+        n_comp = self.component_count
+        data, data_pointer = _bulk_entities_data(data, data_pointer, ids.size, n_comp)
+
+        scop = self._get_scoping()
+        if scop.size == 0 and self.size == 0:
+            self._set_data(data)
+            if data_pointer is not None:
+                self._set_data_pointer(data_pointer)
+            scop.ids = ids
+            self._set_scoping(scop)
+            return
+
+        if data_pointer is None:
+            data_pointer = np.arange(ids.size) * n_comp
+        bounds = np.append(data_pointer, data.size).tolist()
+        for i, entity_id in enumerate(ids.tolist()):
+            self.append(data[bounds[i]:bounds[i + 1]].tolist(), entity_id)
+
     @property
     def _data_pointer(self):
         """First index of each entity data.
@@ -482,12 +536,175 @@ class _FieldBase:
     def _set_data(self, data):
         pass
 
+    @abstractmethod
+    def _set_entity_data(self, index, id, data):
+        pass
+
+    def data_view(self):
+        """Writable view on the data of the field, to use in a ``with`` statement.
+
+        With an InProcess server, the view is the buffer owned by the server
+        and modifications are applied in place. With a remote server, the
+        data is downloaded once and, when the ``with`` block exits, only the
+        entities whose data changed are sent back. When more than
+        ``_DATA_VIEW_MAX_ENTITY_UPDATES`` entities changed, or when the server
+        cannot update single entities, the whole data is sent in one request.
+
+        Returns
+        -------
+        view : _DataView
+            Context manager returning the data as a ``numpy.ndarray``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.fields_factory.create_3d_vector_field(3)
+        >>> field.scoping.ids = [1, 2, 3]
+        >>> field.data = [[1., 2., 3.], [4., 5., 6.], [7., 8., 9.]]
+        >>> with field.data_view() as data:
+        ...     data[1] *= 2.
+        >>> print(field.data[1])
+        [ 8. 10. 12.]
+
+        """
+        return _DataView(self)
+
+
+#: Number of modified entities above which a data view sends the whole data
+#: back to the server instead of updating the modified entities one by one.
+_DATA_VIEW_MAX_ENTITY_UPDATES = 100
+
+
+class _DataView:
+    """Context manager giving write access to the data of a field.
+
+    Parameters
+    ----------
+    field : _FieldBase
+        Field whose data is viewed.
+    """
+
+    def __init__(self, field):
+        self._field = field
+        self._array = None
+        self._initial = None
+
+    def __enter__(self):
+        data = self._field._get_data(np_array=True)
+        vec = getattr(data, "vec", None)
+        if vec is not None and not vec._check_changes:
+            # the array is the buffer owned by the in-process server
+            self._array = data
+        else:
+            self._array = np.array(data)
+            self._initial = self._array.copy()
+        return self._array
+
+    def __exit__(self, type, value, tb):
+        if tb is None and self._initial is not None:
+            self._write_back()
+        self._array = None
+        self._initial = None
+
+    def _modified_entities(self):
+        """Indices of the entities whose data differs from the downloaded data."""
+        data = self._array.reshape(-1)
+        initial = self._initial.reshape(-1)
+        modified = data != initial
+        if np.issubdtype(data.dtype, np.floating):
+            modified &= ~(np.isnan(data) & np.isnan(initial))
+        positions = np.flatnonzero(modified)
+        if positions.size == 0:
+            return positions
+        data_pointer = np.asarray(self._field._data_pointer)
+        if data_pointer.size:
+            entities = np.searchsorted(data_pointer, positions, side="right") - 1
+        else:
+            entities = positions // self._field.component_count
+        return np.unique(entities)
+
+    def _write_back(self):
+        """Send the modified data to the server."""
+        entities = self._modified_entities()
+        if entities.size == 0:
+            return
+        if entities.size <= _DATA_VIEW_MAX_ENTITY_UPDATES:
+            data = self._array.reshape(-1)
+            data_pointer = np.asarray(self._field._data_pointer)
+            if data_pointer.size:
+                bounds = np.append(data_pointer, data.size)
+            else:
+                n_comp = self._field.component_count
+                bounds = np.arange(data.size // n_comp + 1) * n_comp
+            ids = self._field._get_scoping()._get_ids(True)
+            try:
+                for index in entities.tolist():
+                    self._field._set_entity_data(
+                        index, int(ids[index]),
+                        np.ascontiguousarray(data[bounds[index]:bounds[index + 1]])
+                    )
+                return
+            except NotImplementedError:
+                pass
+        self._field._set_data(self._array)
+
+
+def _bulk_entities_data(data, data_pointer, n_entities, n_comp):
+    """Return the flat data and the data pointer (``None`` if not needed)
+    of ``n_entities`` entities given in bulk.
+    """
+    if (
+            data_pointer is None
+            and isinstance(data, (list, tuple))
+            and len(data) == n_entities > 0
+            and np.ndim(data[0]) > 0
+    ):
+        sizes = np.array([np.size(entity_data) for entity_data in data])
+        if np.any(sizes != sizes[0]):
+            data_pointer = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            data = np.concatenate([np.ravel(entity_data) for entity_data in data])
+    data = np.ravel(np.asarray(data))
+    if data_pointer is None:
+        if data.size == n_entities * n_comp:
+            return data, None
+        if n_entities == 0 or data.size % n_entities:
+            raise ValueError(
+                f"Data of size {data.size} cannot be split into {n_entities} entities, "
+                f"a data pointer is required."
+            )
+        data_pointer = np.arange(n_entities) * (data.size // n_entities)
+    data_pointer = np.asarray(data_pointer, dtype=np.int32).ravel()
+    if data_pointer.size != n_entities:
+        raise ValueError(
+            f"A data pointer of size {n_entities} is expected and "
+            f"size {data_pointer.size} was input"
+        )
+    return data, data_pointer
+
+
+def _reserve(buffer, size, required):
+    """Return a buffer holding the first ``size`` values of ``buffer`` with
+    room for at least ``required`` values.
+
+    The capacity is doubled when the buffer is too small so that successive
+    appends have an amortized constant cost.
+    """
+    if required <= buffer.size:
+        return buffer
+    grown = np.empty(max(required, 2 * buffer.size), dtype=buffer.dtype)
+    grown[:size] = buffer[:size]
+    return grown
+
 
 class _LocalFieldBase(_FieldBase):
     """Caches the internal data of the field so that it can be modified locally.
 
     A single update request is sent to the server when the local field is deleted.
 
+    The data and the data pointer are kept in contiguous numpy buffers whose
+    capacity grows geometrically on :func:`append`. Only the first ``size``
+    values of these buffers are meaningful.
+
     Parameters
     ----------
     field : _FieldBase
@@ -498,18 +715,31 @@ class _LocalFieldBase(_FieldBase):
     def __init__(self, field):
         self.__cache_data__(field)
 
+    @property
+    def _dtype(self):
+        return np.int32 if self._is_property_field else self.dtype
+
     def __cache_data__(self, field):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
-        self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._get_data_pointer().tolist()
+        self._data_copy = np.array(super()._get_data(), dtype=self._dtype).ravel()
+        self._data_size = self._data_copy.size
+        self._data_pointer_copy = np.array(super()._get_data_pointer(), dtype=np.int32).ravel()
+        self._data_pointer_size = self._data_pointer_copy.size
         self._scoping_copy = super().scoping.as_local_scoping()
-        self._has_data_pointer = len(self._data_pointer_copy) > 0
+        self._has_data_pointer = self._data_pointer_size > 0
 
     @property
     def _num_entities(self):
         return len(self._scoping_copy)
 
+    @property
+    def _data_view(self):
+        return self._data_copy[: self._data_size]
+
+    @property
+    def _data_pointer_view(self):
+        return self._data_pointer_copy[: self._data_pointer_size]
+
     @property
     def size(self):
         """Length of the data vector.
@@ -522,7 +752,7 @@ class _LocalFieldBase(_FieldBase):
             Length of the data vector.
 
         """
-        return len(self._data_copy)
+        return self._data_size
 
     def get_entity_data(self, index):
         """Retrieve the elementary data of the scoping's index as an array.
@@ -567,19 +797,15 @@ class _LocalFieldBase(_FieldBase):
             )
         if self._has_data_pointer:
             first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) - 1:
+            if index < self._data_pointer_size - 1:
                 last_index = self._data_pointer_copy[index + 1] - 1
             else:
-                last_index = len(self._data_copy) - 1
+                last_index = self._data_size - 1
         else:
             first_index = self._ncomp * index
             last_index = self._ncomp * (index + 1) - 1
-        if self._is_property_field:
-            array = np.array(
-                self._data_copy[first_index: last_index + 1], dtype=np.int32
-            )
-        else:
-            array = np.array(self._data_copy[first_index: last_index + 1])
+        # copy, the local buffer is reallocated when data is appended
+        array = self._data_copy[first_index: last_index + 1].copy()
 
         if self._ncomp > 1:
             return array.reshape((array.size // self._ncomp, self._ncomp))
@@ -651,32 +877,100 @@ class _LocalFieldBase(_FieldBase):
         ...         f.append([[0.1*i,0.2*i, 0.3*i],[0.1*i,0.2*i, 0.3*i]],i)
 
         """
-        if self._is_property_field:
-            if isinstance(data[0], np.int64):
-                data = np.array(data, dtype=np.int32)
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        if (len(data) > 0 and isinstance(data, list)) or isinstance(
-                data, (np.ndarray, np.generic)
-        ):
-            data = np.array(data).flatten().tolist()
+        data = np.asarray(data)
+        if self._is_property_field and data.size and not np.issubdtype(data.dtype, np.integer):
+            raise errors.InvalidTypeError("data", "list of int")
+        data = data.astype(self._dtype, copy=False).ravel()
 
-        data_size = len(self._data_copy)
+        data_size = self._data_size
         self._scoping_copy.append(scopingid)
-        if len(self._data_pointer_copy) > 0:
-            self._data_pointer_copy.append(data_size)
+        if self._data_pointer_size > 0:
+            self._data_pointer_copy = _reserve(
+                self._data_pointer_copy, self._data_pointer_size, self._data_pointer_size + 1
+            )
+            self._data_pointer_copy[self._data_pointer_size] = data_size
+            self._data_pointer_size += 1
+
+        self._data_copy = _reserve(self._data_copy, data_size, data_size + data.size)
+        self._data_copy[data_size: data_size + data.size] = data
+        self._data_size = data_size + data.size
+        if self._has_data_pointer == False and data.size > self._ncomp:
+            self._data_pointer_copy = np.arange(
+                0, self._num_entities * self._ncomp, self._ncomp, dtype=np.int32
+            )
+            self._data_pointer_size = self._data_pointer_copy.size
+            self._has_data_pointer = True
 
-        self._data_copy.extend(data)
-        if self._has_data_pointer == False:
-            if isinstance(data, (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size = len(data)
-            if data_size > self._ncomp:
-                self._data_pointer_copy = [
-                    i * self._ncomp for i in range(0, self._num_entities)
-                ]
-                self._has_data_pointer = True
+    @_setter
+    def append_many(self, ids, data, data_pointer=None):
+        """Add the data of several entities to the existing data.
+
+        Parameters
+        ----------
+        ids : list of int or array
+            IDs of the scoping of the new entities.
+        data : list, array or list of arrays
+            Data of the new entities, either flat, shaped like the field's data,
+            or given as one array per entity when entities have different sizes.
+        data_pointer : list of int or array, optional
+            First index of each new entity in ``data``. Required only when a flat
+            ``data`` is given for entities of different sizes.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> num_entities = 100
+        >>> field_to_local = dpf.fields_factory.create_3d_vector_field(num_entities)
+        >>> with field_to_local.as_local_field() as f:
+        ...     f.append_many(np.arange(1, num_entities + 1), np.ones((num_entities, 3)))
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).ravel()
+        data, data_pointer = _bulk_entities_data(data, data_pointer, ids.size, self._ncomp)
+        if self._is_property_field and data.size and not np.issubdtype(data.dtype, np.integer):
+            raise errors.InvalidTypeError("data", "list of int")
+
+        n_entities = self._num_entities
+        data_size = self._data_size
+        self.scoping_ids = np.concatenate(
+            (np.asarray(self.scoping_ids, dtype=np.int32), ids)
+        )
+        self._data_copy = _reserve(self._data_copy, data_size, data_size + data.size)
+        self._data_copy[data_size: data_size + data.size] = data
+        self._data_size = data_size + data.size
+
+        if data_pointer is not None and not self._has_data_pointer:
+            self._data_pointer_copy = np.arange(
+                0, n_entities * self._ncomp, self._ncomp, dtype=np.int32
+            )
+            self._data_pointer_size = n_entities
+            self._has_data_pointer = True
+        if self._has_data_pointer:
+            if data_pointer is None:
+                data_pointer = np.arange(ids.size, dtype=np.int32) * self._ncomp
+            pointer_size = self._data_pointer_size
+            self._data_pointer_copy = _reserve(
+                self._data_pointer_copy, pointer_size, pointer_size + ids.size
+            )
+            self._data_pointer_copy[pointer_size: pointer_size + ids.size] = \
+                data_pointer + data_size
+            self._data_pointer_size = pointer_size + ids.size
+
+    @_setter
+    def data_view(self):
+        """Writable view on the local data of the field, to use in a ``with`` statement.
+
+        The local data is modified in place and sent to the server when the
+        local field is released. The view must not be used after data is
+        appended to the field, which can reallocate the local data.
+
+        Returns
+        -------
+        view : contextlib.nullcontext
+            Context manager returning the data as a ``numpy.ndarray``.
+        """
+        return contextlib.nullcontext(self._shaped_data_view())
 
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
@@ -699,7 +993,7 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
 
         """
-        return self._data_copy
+        return self._data_view.tolist()
 
     @property
     def data(self):
@@ -729,19 +1023,14 @@ class _LocalFieldBase(_FieldBase):
          [ 1.03542516e-02 -3.53018374e-03 -3.98914380e-05]]
 
         """
-
-        if self._ncomp > 1:
-            return np.array(self._data_copy).reshape(
-                len(self._data_copy) // self._ncomp, self._ncomp
-            )
-        else:
-            return np.array(self._data_copy)
+        # copy, the local buffer is reallocated when data is appended
+        return self._shaped_data_view().copy()
 
     @data.setter
     @_setter
     def data(self, data):
         if self._is_property_field:
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
+            if not np.issubdtype(np.asarray(data).dtype, np.integer):
                 raise errors.InvalidTypeError("data", "list of int")
         else:
             if isinstance(data, (np.ndarray, np.generic)):
@@ -750,12 +1039,15 @@ class _LocalFieldBase(_FieldBase):
                         f"An array of shape {self.shape} is expected and "
                         f"shape {data.shape} was input"
                     )
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data) > 0 and isinstance(data, list):
-            self._data_copy = np.array(data).flatten().tolist()
+        self._data_copy = np.array(data, dtype=self._dtype).ravel()
+        self._data_size = self._data_copy.size
+
+    def _shaped_data_view(self):
+        """View on the local data, shaped like the data of the field."""
+        if self._ncomp > 1:
+            return self._data_view.reshape(self._data_size // self._ncomp, self._ncomp)
         else:
-            self._data_copy = data
+            return self._data_view
 
     @property
     def elementary_data_count(self):
@@ -768,7 +1060,7 @@ class _LocalFieldBase(_FieldBase):
 
         """
         if hasattr(self, "_data_copy"):
-            return len(self._data_copy) / self._ncomp
+            return self._data_size // self._ncomp
         else:
             return super().elementary_data_count
 
@@ -793,7 +1085,7 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_view
 
     @property
     def _data_pointer_as_list(self):
@@ -804,16 +1096,14 @@ class _LocalFieldBase(_FieldBase):
         List
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_view.tolist()
 
     @_data_pointer.setter
     @_setter
     def _data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
-        if self._has_data_pointer == False and len(data) > 0:
+        self._data_pointer_copy = np.array(data, dtype=np.int32).ravel()
+        self._data_pointer_size = self._data_pointer_copy.size
+        if self._has_data_pointer == False and self._data_pointer_size > 0:
             self._has_data_pointer = True
 
     @property
@@ -854,8 +1144,8 @@ class _LocalFieldBase(_FieldBase):
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_data(self._data_copy)
-            super()._set_data_pointer(self._data_pointer_copy)
+            super()._set_data(self._data_view)
+            super()._set_data_pointer(self._data_pointer_view)
             super()._set_scoping(self._scoping_copy)
             self._scoping_copy = None
 
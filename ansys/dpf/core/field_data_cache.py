@@ -0,0 +1,344 @@
+"""
+.. _ref_field_data_cache:
+
+FieldDataCache
+==============
+Client-side cache, stored on disk, of the fields and fields containers
+evaluated by operators.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+
+_METADATA_FILE = "metadata.json"
+
+
+class FieldDataCache:
+    """Cache the data of the fields evaluated by operators in ``.npy`` files.
+
+    When the fields container of a result is requested with
+    :func:`ansys.dpf.core.results.Result.eval`, or when an output is requested
+    with ``Operator.get_output(pin, output_type, use_cache=True)``, the cache is
+    looked up with a key made of the operator's name, its requested output pin
+    and the inputs connected to it: the paths of the files of the data sources
+    with their modification times, the values of the time and mesh scopings or
+    of any other scalar or list input, and the keys of the upstream operators.
+    These are read when the output is requested. On a hit, the fields are
+    rebuilt from the memory-mapped files instead of being evaluated and fetched
+    again. On a miss, the output is evaluated and its data, scoping IDs and data
+    pointers are written to disk.
+
+    The least recently used entries are removed when the size of the cache
+    exceeds ``max_size``.
+
+    Only the operators whose inputs were all connected while the cache was
+    enabled are cached. Outputs depending on fields, meshes or other entities
+    connected as inputs, or on data sources whose files cannot be read by the
+    client, such as files only available on a remote server, are not cached.
+    The meshed regions supporting the cached fields are not stored:
+    :func:`ansys.dpf.core.results.Result.eval` connects the model's mesh and
+    time frequency support back to the fields containers it returns, and the
+    callers of ``Operator.get_output`` must do the same. Results split by body
+    or by element shape are not cached.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory where the cache is stored. The default is ``None``, in which
+        case the ``ansys_dpf/field_data`` directory of the user's cache directory
+        is used. Directories created by the cache are only accessible to their
+        owner.
+    max_size : int, optional
+        Maximum size of the cache in bytes. The default is 1 GB.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> cache = dpf.settings.enable_field_data_cache(max_size=2**28)
+    >>> model = dpf.Model(examples.static_rst)
+    >>> fc = model.results.displacement.eval()
+    >>> fc = model.results.displacement.eval()
+    >>> cache.hits
+    1
+    >>> dpf.settings.disable_field_data_cache()
+
+    """
+
+    def __init__(self, path=None, max_size=2**30):
+        if path is None:
+            path = _default_cache_path()
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        self._path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self):
+        """Directory where the cache is stored.
+
+        Returns
+        -------
+        str
+        """
+        return self._path
+
+    @property
+    def size(self):
+        """Size of the cache on disk in bytes.
+
+        Returns
+        -------
+        int
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        for entry, _, _ in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def load(self, key, server=None):
+        """Rebuild the output stored for a key.
+
+        Parameters
+        ----------
+        key : list
+            Key of the operator's output, as returned by ``Operator._cache_key()``.
+        server : ansys.dpf.core.server, optional
+            Server on which the output is rebuilt.
+
+        Returns
+        -------
+        output : FieldsContainer, Field, None
+            ``None`` when the key is not in the cache.
+        """
+        entry = self._entry_path(key)
+        metadata_path = os.path.join(entry, _METADATA_FILE)
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            fields = [
+                _load_field(entry, i, field_metadata, server)
+                for i, field_metadata in enumerate(metadata["fields"])
+            ]
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        os.utime(metadata_path)
+        self.hits += 1
+        if metadata["type"] == "field":
+            output = fields[0]
+        else:
+            from ansys.dpf.core.fields_container import FieldsContainer
+
+            output = FieldsContainer(server=server)
+            output.labels = metadata["labels"]
+            for field_metadata, field in zip(metadata["fields"], fields):
+                output.add_field(field_metadata["label_space"], field)
+            if "time_frequencies" in metadata:
+                from ansys.dpf.core.time_freq_support import TimeFreqSupport
+
+                support = TimeFreqSupport(server=server)
+                support.time_frequencies = _load_field(
+                    entry, "time_frequencies", metadata["time_frequencies"], server
+                )
+                output.time_freq_support = support
+        output._from_field_data_cache = True
+        return output
+
+    def store(self, key, output):
+        """Write the data of an output on disk and evict the least recently used entries.
+
+        Parameters
+        ----------
+        key : list
+            Key of the operator's output, as returned by ``Operator._cache_key()``.
+        output : FieldsContainer, Field
+            Output to store.
+        """
+        from ansys.dpf.core.field import Field
+
+        entry = self._entry_path(key)
+        if isinstance(output, Field):
+            metadata = {"type": "field", "fields": [{}]}
+            fields = [output]
+        else:
+            metadata = {"type": "fields_container", "labels": output.labels, "fields": []}
+            fields = list(output)
+            metadata["fields"] = [{"label_space": output.get_label_space(i)}
+                                  for i in range(len(fields))]
+        tmp = tempfile.mkdtemp(dir=self._path, prefix=".tmp")
+        try:
+            for i, field in enumerate(fields):
+                metadata["fields"][i].update(_save_field(tmp, i, field))
+            if metadata["type"] == "fields_container":
+                try:
+                    time_frequencies = output.time_freq_support.time_frequencies
+                except Exception:
+                    time_frequencies = None
+                if time_frequencies is not None:
+                    metadata["time_frequencies"] = _save_field(
+                        tmp, "time_frequencies", time_frequencies
+                    )
+            with open(os.path.join(tmp, _METADATA_FILE), "w") as f:
+                json.dump(metadata, f)
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp, entry)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self._evict()
+
+    def _entry_path(self, key):
+        digest = hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()
+        return os.path.join(self._path, digest)
+
+    def _entries(self):
+        """List the ``(path, last use time, size)`` of the entries of the cache."""
+        entries = []
+        for entry in os.scandir(self._path):
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            try:
+                last_use = os.path.getmtime(os.path.join(entry.path, _METADATA_FILE))
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+            except OSError:
+                continue
+            entries.append((entry.path, last_use, size))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry[2] for entry in entries)
+        for path, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            size -= entry_size
+
+
+def _default_cache_path():
+    """Directory of the cache in the user's cache directory, only accessible to the user."""
+    if os.name == "nt":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local")
+        )
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+            os.path.join("~", ".cache")
+        )
+    path = os.path.join(root, "ansys_dpf", "field_data")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if os.name != "nt":
+        if os.stat(path).st_uid != os.getuid():
+            raise PermissionError(
+                f"The field data cache directory {path} is not owned by the user."
+            )
+        os.chmod(path, 0o700)
+    return path
+
+
+def _save_field(path, index, field):
+    """Write the data, scoping IDs and data pointer of a field, and return its metadata."""
+    np.save(os.path.join(path, f"{index}_data.npy"), np.asarray(field._get_data()))
+    scoping = field.scoping
+    np.save(os.path.join(path, f"{index}_ids.npy"),
+            np.asarray(scoping._get_ids(True), dtype=np.int32))
+    data_pointer = np.asarray(field._get_data_pointer(), dtype=np.int32)
+    if data_pointer.size:
+        np.save(os.path.join(path, f"{index}_data_pointer.npy"), data_pointer)
+    dimensionality = field.field_definition.dimensionality
+    return {
+        "location": field.location,
+        "scoping_location": scoping.location,
+        "unit": field.unit,
+        "nature": dimensionality.nature.name,
+        "dim": dimensionality.dim,
+        "data_pointer": bool(data_pointer.size),
+    }
+
+
+def _load_field(path, index, metadata, server=None):
+    """Rebuild a field from the memory-mapped files written by ``_save_field``."""
+    from ansys.dpf.core.common import natures
+    from ansys.dpf.core.dimensionality import Dimensionality
+    from ansys.dpf.core.field import Field
+    from ansys.dpf.core.scoping import Scoping
+
+    ids = np.load(os.path.join(path, f"{index}_ids.npy"), mmap_mode="r")
+    nature = natures[metadata["nature"]]
+    field = Field(nentities=ids.size, nature=nature, location=metadata["location"],
+                  server=server)
+    dimensionality = Dimensionality(metadata["dim"], nature)
+    if dimensionality.dim != Dimensionality(None, nature).dim:
+        field.dimensionality = dimensionality
+    scoping = Scoping(location=metadata["scoping_location"], server=server)
+    scoping.ids = ids
+    field.scoping = scoping
+    field.data = np.load(os.path.join(path, f"{index}_data.npy"), mmap_mode="r")
+    if metadata["data_pointer"]:
+        field._data_pointer = np.load(
+            os.path.join(path, f"{index}_data_pointer.npy"), mmap_mode="r"
+        )
+    if metadata["unit"]:
+        field.unit = metadata["unit"]
+    return field
+
+
+def _input_key(inpt, pin_out=0):
+    """Return a function computing the cache key of an operator's input.
+
+    Returns ``None`` when outputs depending on the input cannot be cached.
+    """
+    from ansys.dpf.core.data_sources import DataSources
+    from ansys.dpf.core.dpf_operator import Operator
+    from ansys.dpf.core.outputs import Output
+    from ansys.dpf.core.scoping import Scoping
+
+    if isinstance(inpt, os.PathLike):
+        inpt = str(inpt)
+    if isinstance(inpt, (bool, int, float, str)):
+        return lambda: inpt
+    elif isinstance(inpt, (list, tuple)):
+        if not all(isinstance(x, (bool, int, float, str)) for x in inpt):
+            return None
+        value = list(inpt)
+        return lambda: value
+    elif isinstance(inpt, Scoping):
+        # the scoping can be modified after being connected, its IDs are hashed
+        # when the key is computed
+        def key():
+            ids = np.ascontiguousarray(inpt._get_ids(True), dtype=np.int32)
+            return ("Scoping", inpt.location, ids.size, hashlib.sha256(ids.tobytes()).hexdigest())
+
+        return key
+    elif isinstance(inpt, DataSources):
+        paths = inpt._file_paths()
+
+        def key():
+            try:
+                return ("DataSources", [
+                    (path_key, path, os.path.getmtime(path)) for path_key, path in paths
+                ])
+            except OSError:
+                # the changes of files not readable by the client cannot be detected
+                return None
+
+        return key
+    elif isinstance(inpt, (Operator, Output)):
+        if isinstance(inpt, Output):
+            inpt, pin_out = inpt._operator, inpt._pin
+        operator = weakref.ref(inpt)
+
+        def key():
+            op = operator()
+            return op._cache_key(pin_out) if op is not None else None
+
+        return key
+    return None
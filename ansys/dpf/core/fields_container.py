@@ -5,10 +5,16 @@ FieldsContainer
 ===============
 Contains classes associated with the DPF FieldsContainer.
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 from ansys import dpf
 from ansys.dpf.core.collection import Collection
 from ansys.dpf.core import errors as dpf_errors
-from ansys.dpf.core import field
+from ansys.dpf.core import field, server_types
+from ansys.dpf.core.scoping import Scoping, _IdIndex
 
 class FieldsContainer(Collection):
     """Represents a fields container, which contains fields belonging to a common result.
@@ -439,10 +445,14 @@ class FieldsContainer(Collection):
     def time_freq_support(self, value):
         return super()._set_time_freq_support(value)
 
-    def deep_copy(self, server=None):
+    def deep_copy(self, server=None, max_workers=None):
         """Create a deep copy of the fields container's data (and its fields) on a given server.
 
         This method is useful for passing data from one server instance to another.
+        Supports shared by several fields, such as a common meshed region or time
+        frequency support, are copied once and shared by the copied fields. Legacy
+        gRPC servers cannot tell whether two references hold the same data, so
+        the supports of each field are copied separately with them.
 
         Parameters
         ----------
@@ -450,6 +460,13 @@ class FieldsContainer(Collection):
             Server with the channel connected to the remote or local instance.
             The default is ``None``, in which case an attempt is made to use the
             global server.
+        max_workers : int, optional
+            Maximum number of threads transferring the fields' data when both
+            the source and the target servers are legacy gRPC servers. The
+            default is ``None``, in which case the default of
+            :class:`concurrent.futures.ThreadPoolExecutor` is used. Other servers
+            go through the DPF C API, whose concurrent use is not known to be
+            thread-safe, and the fields are always copied sequentially with them.
 
         Returns
         -------
@@ -470,14 +487,46 @@ class FieldsContainer(Collection):
         """
         fc = FieldsContainer(server=server)
         fc.labels = self.labels
-        for i, f in enumerate(self):
-            fc.add_field(self.get_label_space(i), f.deep_copy(server))
-        try:
-            fc.time_freq_support = self.time_freq_support.deep_copy(server)
-        except:
-            pass
+        if not isinstance(self._server, server_types.LegacyGrpcServer) \
+                or not isinstance(fc._server, server_types.LegacyGrpcServer):
+            # in-process and gRPC servers go through the C API, not known to be thread-safe
+            max_workers = 1
+        fields = list(self)
+        meshes = _SupportCopies(self._holds_same_data, server)
+        time_freq_supports = _SupportCopies(self._holds_same_data, server)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            copies = [executor.submit(f._deep_copy_data, server) for f in fields]
+            # supports are deduplicated and copied while the data is transferred
+            supports = [
+                (meshes.get(lambda: f.meshed_region),
+                 time_freq_supports.get(lambda: f.time_freq_support))
+                for f in fields
+            ]
+            for i, (copy, (mesh, time_freq_support)) in enumerate(zip(copies, supports)):
+                f = copy.result()
+                if mesh is not None:
+                    f.meshed_region = mesh
+                if time_freq_support is not None:
+                    f.time_freq_support = time_freq_support
+                fc.add_field(self.get_label_space(i), f)
+        time_freq_support = time_freq_supports.get(lambda: self.time_freq_support)
+        if time_freq_support is not None:
+            fc.time_freq_support = time_freq_support
         return fc
 
+    def _holds_same_data(self, obj, other):
+        """Whether two DPF objects are references to the same server data.
+
+        Servers which cannot tell, such as legacy gRPC servers, where each
+        reference has its own ID, never consider two objects the same.
+        """
+        try:
+            return self._data_processing_core_api.data_processing_objects_holds_same_data(
+                obj, other
+            )
+        except NotImplementedError:
+            return False
+
     def get_time_scoping(self):
         """Retrieves the time scoping containing the time sets.
 
@@ -488,6 +537,166 @@ class FieldsContainer(Collection):
         """
         return self.get_label_scoping("time")
 
+    def lazy_view(self, cache_size=8):
+        """Create a view of the fields container whose entries are lightweight handles.
+
+        The handles carry the label space and the index of their field. The
+        field itself, and its data, scoping or field definition, are only
+        requested when they are accessed. The most recently requested fields
+        and data are kept in a bounded cache so that loops going over the same
+        fields several times do not request them again.
+
+        Parameters
+        ----------
+        cache_size : int, optional
+            Maximum number of fields kept in the cache. The default is ``8``.
+
+        Returns
+        -------
+        view : LazyFieldsContainer
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> transient = examples.download_transient_result()
+        >>> model = dpf.Model(transient)
+        >>> fields_container = model.results.displacement.on_all_time_freqs.eval()
+        >>> view = fields_container.lazy_view()
+        >>> handle = view.get_fields({"time": 5})[0]
+        >>> handle.label_space
+        {'time': 5}
+        >>> data = handle.data
+
+        """
+        return LazyFieldsContainer(self, cache_size=cache_size)
+
+    def to_array(self, labels=None, align_on=None):
+        """Stack the data of the fields into a single array.
+
+        Each field is requested once, with its data and scoping, and its data
+        is placed on the row of its entities in a common scoping. Values of
+        entities missing in a field are ``NaN``.
+
+        Parameters
+        ----------
+        labels : dict[str,int], optional
+            Label space selecting the fields to stack. For example,
+            ``{"complex": 0}``. The default is ``None``, in which case all
+            the fields are stacked in the order of the fields container.
+        align_on : Scoping, list[int], numpy.ndarray, optional
+            Entity IDs defining the rows of the array. The default is ``None``,
+            in which case the IDs of all the fields are used, in the order in
+            which they first appear.
+
+        Returns
+        -------
+        array : numpy.ndarray
+            Array of shape ``(n_fields, n_entities, n_components)``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> transient = examples.download_transient_result()
+        >>> model = dpf.Model(transient)
+        >>> disp = model.results.displacement()
+        >>> disp.inputs.time_scoping.connect([1,5])
+        >>> fields_container = disp.outputs.fields_container()
+        >>> fields_container.to_array().shape
+        (2, 3820, 3)
+
+        """
+        if labels is None:
+            fields = list(self)
+        else:
+            fields = self.get_fields(labels)
+        datas = []
+        ids = []
+        for f in fields:
+            data = np.asarray(f.data)
+            field_ids = np.asarray(f.scoping.ids)
+            n_comp = f.component_count
+            if n_comp * len(field_ids) != data.size:
+                raise ValueError(
+                    "Fields with several elementary data per entity cannot be stacked."
+                )
+            datas.append(data.reshape(len(field_ids), n_comp))
+            ids.append(field_ids)
+        n_comp = max([data.shape[1] for data in datas], default=1)
+        dtype = np.result_type(np.float32, *[data.dtype for data in datas])
+
+        if align_on is None:
+            all_ids = np.concatenate(ids) if ids else np.empty(0, dtype=np.int32)
+            _, first = np.unique(all_ids, return_index=True)
+            align_on = all_ids[np.sort(first)]
+        elif isinstance(align_on, Scoping):
+            align_on = align_on.ids
+        id_index = _IdIndex(align_on)
+
+        out = np.full((len(datas), len(id_index), n_comp), np.nan, dtype=dtype)
+        for i, (data, field_ids) in enumerate(zip(datas, ids)):
+            if data.shape[1] != n_comp:
+                raise ValueError(
+                    f"Fields with {data.shape[1]} and {n_comp} components cannot be stacked."
+                )
+            rows = id_index.indices(field_ids)
+            mask = rows >= 0
+            out[i, rows[mask]] = data[mask]
+        return out
+
+    def to_mesh_array(self, mesh=None, fill=np.nan, labels=None):
+        """Scatter the data of the fields on the nodes or elements of a mesh.
+
+        The mapping of the fields' scopings to the mesh is cached by the mesh
+        and computed once for all the fields with the same scoping IDs.
+
+        Parameters
+        ----------
+        mesh : MeshedRegion, optional
+            Mesh to scatter the data on. The default is ``None``, in which case
+            the mesh supporting the first field is used.
+        fill : float, optional
+            Value of the nodes or elements which are not in a field's scoping.
+            The default is ``numpy.nan``.
+        labels : dict[str,int], optional
+            Label space selecting the fields to scatter. The default is ``None``,
+            in which case all the fields are scattered in the order of the
+            fields container.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_fields, n_entities, n_components)``, or
+            ``(n_fields, n_entities)`` for scalar fields.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> mesh = model.metadata.meshed_region
+        >>> disp = model.results.displacement().outputs.fields_container()
+        >>> disp.to_mesh_array(mesh).shape
+        (1, 81, 3)
+
+        """
+        if labels is None:
+            fields = list(self)
+        else:
+            fields = self.get_fields(labels)
+        if not fields:
+            return np.empty(0)
+        if mesh is None:
+            mesh = fields[0].meshed_region
+        first = fields[0].to_mesh_array(mesh, fill)
+        out = np.empty((len(fields),) + first.shape, dtype=first.dtype)
+        out[0] = first
+        for i, f in enumerate(fields[1:], 1):
+            out[i] = fill
+            f.to_mesh_array(mesh, out=out[i])
+        return out
+
     def __add__(self, fields_b):
         """Add two fields or two fields containers.
 
@@ -559,3 +768,210 @@ class FieldsContainer(Collection):
         op.connect(0, self)
         op.connect(1, value)
         return op
+
+
+class FieldHandle:
+    """Lightweight handle on a field of a :class:`LazyFieldsContainer`.
+
+    The field is only requested when one of its properties is accessed.
+
+    Parameters
+    ----------
+    view : LazyFieldsContainer
+        View holding the field.
+    index : int
+        Index of the field in the fields container.
+    label_space : dict[str,int]
+        Label space of the field.
+    """
+
+    def __init__(self, view, index, label_space):
+        self._view = view
+        self._index = index
+        self._label_space = label_space
+
+    @property
+    def index(self):
+        """Index of the field in the fields container."""
+        return self._index
+
+    @property
+    def label_space(self):
+        """Label space of the field, for example ``{"time": 1, "complex": 0}``."""
+        return dict(self._label_space)
+
+    @property
+    def field(self):
+        """Field of the handle, requested from the server on first access.
+
+        Returns
+        -------
+        field : Field
+        """
+        return self._view._get_cached(self._index)["field"]
+
+    @property
+    def data(self):
+        """Data of the field, requested from the server on first access.
+
+        Returns
+        -------
+        data : numpy.ndarray
+        """
+        cached = self._view._get_cached(self._index)
+        if "data" not in cached:
+            cached["data"] = cached["field"].data
+        return cached["data"]
+
+    @property
+    def scoping(self):
+        """Scoping of the field, requested from the server on first access.
+
+        Returns
+        -------
+        scoping : Scoping
+        """
+        cached = self._view._get_cached(self._index)
+        if "scoping" not in cached:
+            cached["scoping"] = cached["field"].scoping
+        return cached["scoping"]
+
+    @property
+    def field_definition(self):
+        """Field definition of the field, requested from the server on first access.
+
+        Returns
+        -------
+        field_definition : FieldDefinition
+        """
+        return self.field.field_definition
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.field, name)
+
+    def __repr__(self):
+        return f"FieldHandle(index={self._index}, label_space={self._label_space})"
+
+
+class LazyFieldsContainer:
+    """View of a fields container whose entries are :class:`FieldHandle` objects.
+
+    Use :func:`FieldsContainer.lazy_view` to create it.
+
+    Parameters
+    ----------
+    fields_container : FieldsContainer
+        Fields container to view.
+    cache_size : int, optional
+        Maximum number of fields kept in the cache. The default is ``8``.
+    """
+
+    def __init__(self, fields_container, cache_size=8):
+        self._fields_container = fields_container
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+
+    @property
+    def fields_container(self):
+        """Fields container of the view."""
+        return self._fields_container
+
+    @property
+    def labels(self):
+        """Labels of the fields container."""
+        return self._fields_container.labels
+
+    def __len__(self):
+        return len(self._fields_container._get_label_spaces())
+
+    def __getitem__(self, index):
+        label_spaces = self._fields_container._get_label_spaces()
+        if index < 0:
+            index += len(label_spaces)
+        return FieldHandle(self, index, label_spaces[index])
+
+    def __iter__(self):
+        for index, label_space in enumerate(self._fields_container._get_label_spaces()):
+            yield FieldHandle(self, index, label_space)
+
+    def get_fields(self, label_space):
+        """Retrieve the handles of the fields matching a label space.
+
+        Parameters
+        ----------
+        label_space : dict[str,int]
+            Label space of the requested fields. For example, ``{"time": 1}``.
+            Labels that the fields do not have match no field.
+
+        Returns
+        -------
+        handles : list[FieldHandle]
+        """
+        label_spaces = self._fields_container._get_label_spaces()
+        indices = self._fields_container._find_indices(label_space)
+        if indices is None:
+            return []
+        return [FieldHandle(self, index, label_spaces[index]) for index in indices.tolist()]
+
+    def _get_cached(self, index):
+        """Retrieve the cache entry of a field, requesting the field when needed."""
+        if index in self._cache:
+            self._cache.move_to_end(index)
+        else:
+            self._cache[index] = {"field": self._fields_container._get_entries(index)}
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return self._cache[index]
+
+    def clear_cache(self):
+        """Forget the fields and data kept in the cache."""
+        self._cache.clear()
+
+
+class _SupportCopies:
+    """Deep copies of supports, each distinct support being copied once.
+
+    Parameters
+    ----------
+    holds_same_data : callable
+        Function telling whether two supports reference the same data.
+    server : ansys.dpf.core.server, optional
+        Server on which the supports are copied.
+    """
+
+    def __init__(self, holds_same_data, server=None):
+        self._holds_same_data = holds_same_data
+        self._server = server
+        self._copies = []
+
+    def get(self, get_support):
+        """Retrieve the copy of a support, copying it if it was not copied yet.
+
+        Parameters
+        ----------
+        get_support : callable
+            Function returning the support to copy.
+
+        Returns
+        -------
+        copy : MeshedRegion, TimeFreqSupport, None
+            ``None`` when the support cannot be retrieved or copied.
+        """
+        try:
+            support = get_support()
+        except (dpf_errors.DPFServerException, dpf_errors.DPFServerNullObject):
+            return None
+        for source, copy in self._copies:
+            try:
+                if self._holds_same_data(source, support):
+                    return copy
+            except dpf_errors.DPFServerException:
+                pass
+        try:
+            copy = support.deep_copy(server=self._server)
+        except (dpf_errors.DPFServerException, dpf_errors.DPFServerNullObject):
+            return None
+        self._copies.append((support, copy))
+        return copy
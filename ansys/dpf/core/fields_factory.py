@@ -20,6 +20,8 @@ def field_from_array(arr, server=None):
     ----------
     arr : np.ndarray or List
         Numpy array or Python list containing either 1 or 3 dimensions.
+        The data of a field created from a ``float32`` array is returned as
+        ``float32`` arrays, see :attr:`ansys.dpf.core.field.Field.dtype`.
 
     server : ansys.dpf.core.server, optional
         Server with the channel connected to the remote or local instance.
@@ -59,6 +61,8 @@ def field_from_array(arr, server=None):
 
     n_entities = arr.shape[0]
     field = Field(nentities=n_entities, nature=nature, server=server)
+    if arr.dtype == np.float32:
+        field.dtype = np.float32
     field.data = arr
     field.scoping.ids = np.arange(1, n_entities + 1)
     return field
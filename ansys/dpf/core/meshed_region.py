@@ -5,9 +5,13 @@ MeshedRegion
 import traceback
 import warnings
 
-from ansys.dpf.core import scoping, field, property_field
+import numpy as np
+
+from ansys.dpf.core import scoping, field, property_field, errors
 from ansys.dpf.core.check_version import server_meet_version, version_requires
-from ansys.dpf.core.common import locations, types, nodal_properties
+from ansys.dpf.core.common import (
+    locations, natures, types, nodal_properties, elemental_properties
+)
 from ansys.dpf.core.elements import Elements, element_types
 from ansys.dpf.core.nodes import Nodes
 from ansys.dpf.core.plotter import DpfPlotter, Plotter
@@ -89,6 +93,8 @@ class MeshedRegion:
                 self._internal_obj = self._api.meshed_region_new()
 
         self._full_grid = None
+        self._vtk_topology = {}
+        self._skin = None
         self._elements = None
         self._nodes = None
 
@@ -133,7 +139,9 @@ class MeshedRegion:
         DPF Elements object with 8 elements
 
         """
-        return Elements(self)
+        if self._elements is None:
+            self._elements = Elements(self)
+        return self._elements
 
     @property
     def nodes(self):
@@ -156,7 +164,9 @@ class MeshedRegion:
         81
 
         """
-        return Nodes(self)
+        if self._nodes is None:
+            self._nodes = Nodes(self)
+        return self._nodes
 
     @property
     def unit(self):
@@ -259,6 +269,8 @@ class MeshedRegion:
             self.set_coordinates_field(value)
         else:
             self._api.meshed_region_set_property_field(self, property_name, value)
+            if self._elements is not None:
+                self._elements._clear_cache()
 
     @version_requires("3.0")
     def set_coordinates_field(self, coordinates_field):
@@ -270,6 +282,8 @@ class MeshedRegion:
         coordinates_field : PropertyField or Field
         """
         self._api.meshed_region_set_coordinates_field(self, coordinates_field)
+        if self._nodes is not None:
+            self._nodes._clear_cache()
 
     @property
     def available_named_selections(self):
@@ -372,23 +386,85 @@ class MeshedRegion:
     #     if not os.path.isfile(filename):
     #         raise FileNotFoundError('VTK mesh not written to disk')
 
-    # @property
-    # def skin(self):
-    #     """Surface of the meshed region."""
-    #     mesh = self._model.operator("mapdl::rst::MeshProvider")
-    #     mesh.connect(4, self._model.data_sources)
+    @property
+    def skin(self):
+        """
+        Skin of the meshed region, made of the external faces of its elements.
+
+        The skin is computed once with the :class:`skin
+        <ansys.dpf.core.operators.mesh.skin>` operator and cached, along with
+        the mapping of its nodes and elements to the ones of this mesh.
+
+        Returns
+        -------
+        MeshedRegion
+            Skin of the meshed region.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> meshed_region = model.metadata.meshed_region
+        >>> skin = meshed_region.skin
 
-    #     skin = self._model.operator("meshed_skin_sector")
-    #     skin.connect(0, mesh, 0)
-    #     # skin.connect(4, self)
+        """
+        return self._get_skin()[0]
 
-    #     skin.get_output(0, types.meshed_region)
+    def _get_skin(self):
+        """Skin of the mesh, with the indices of its nodes in this mesh and the
+        indices of the elements of this mesh its elements are extracted from."""
+        if self._skin is None:
+            from ansys.dpf.core.operators.mesh import skin
 
-    #     name = None
-    #     if self._name:
-    #         name = 'Skin of %s' % self._name
-    #     self._internal_obj = skin.get_output(0, types.meshed_region)
-    #     return MeshedRegion(self._server.channel, skin, self._model, name)
+            skin_op = skin(mesh=self, server=self._server)
+            skin_mesh = skin_op.outputs.mesh()
+            # scoping: IDs of the skin elements, data: indices of the elements of this mesh
+            new_elements_to_old = skin_op.outputs.property_field_new_elements_to_old()
+            node_indices = self.nodes._get_id_index().indices(skin_mesh.nodes.scoping.ids)
+            positions = scoping._IdIndex(new_elements_to_old.scoping.ids).indices(
+                skin_mesh.elements.scoping.ids
+            )
+            if np.any(positions < 0):
+                raise errors.DpfValueError(
+                    "The skin operator does not give the elements of all the skin elements."
+                )
+            old_elements = np.asarray(new_elements_to_old.data, dtype=np.int64)[positions]
+            element_indices = self._skin_element_indices(skin_mesh, node_indices, old_elements)
+            self._skin = (skin_mesh, node_indices, element_indices)
+        return self._skin
+
+    def _skin_element_indices(self, skin_mesh, node_indices, old_elements):
+        """Indices of the elements of this mesh the elements of the skin are extracted from.
+
+        For each skin element ID in its scoping, the data of the skin operator's
+        ``property_field_new_elements_to_old`` output is the index, in this mesh,
+        of the element the skin element is extracted from. The nodes of each
+        skin element are checked to belong to its element.
+
+        Raises
+        ------
+        DpfValueError
+            If a skin element is not extracted from the element given by the
+            skin operator.
+        """
+        connectivity, offsets = self.elements._get_csr_connectivity()
+        skin_connectivity, skin_offsets = skin_mesh.elements._get_csr_connectivity()
+        element_indices = np.asarray(old_elements, dtype=np.int64)
+        skin_nodes = node_indices[skin_connectivity]
+        skin_elements = np.repeat(element_indices, np.diff(skin_offsets))
+        if (
+                np.any((element_indices < 0) | (element_indices >= offsets.size - 1))
+                or np.any(skin_nodes < 0)
+                or not np.all(_elements_contain_nodes(
+                    connectivity, offsets, skin_elements, skin_nodes
+                ))
+        ):
+            raise errors.DpfValueError(
+                "The elements given by the skin operator are not the elements of the mesh "
+                "the skin elements are extracted from."
+            )
+        return element_indices
 
     def deform_by(self, deform_by, scale_factor=1.0):
         """
@@ -414,24 +490,40 @@ class MeshedRegion:
         ).eval()
 
     def _as_vtk(self, coordinates=None, as_linear=True, include_ids=False):
-        """Convert DPF mesh to a PyVista unstructured grid."""
+        """Convert DPF mesh to a PyVista unstructured grid.
+
+        The cells of the grid are computed once and cached, the grids returned
+        by the later calls share them and only set their points.
+        """
         # Quick fix required to hold onto the data as PyVista does not make a copy.
         # All of those now return DPFArrays
         if not coordinates:
             self._tmpnodes = self.nodes.coordinates_field.data
         else:
             self._tmpnodes = coordinates.data
-        etypes = self.elements.element_types_field.data
-        conn = self.elements.connectivities_field.data
-        try:
-            from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "To use plotting capabilities, please install pyvista "
-                "with :\n pip install pyvista>=0.24.0"
-            )
+        if not self._tmpnodes.flags.writeable:
+            # float32 fields return read-only copies
+            self._tmpnodes = np.array(self._tmpnodes)
+        if as_linear not in self._vtk_topology:
+            etypes = self.elements.element_types_field.data
+            conn = self.elements.connectivities_field.data
+            try:
+                from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+            except ModuleNotFoundError:
+                raise ModuleNotFoundError(
+                    "To use plotting capabilities, please install pyvista "
+                    "with :\n pip install pyvista>=0.24.0"
+                )
+            has_null_nodes = bool(np.any(conn == -1))
+            topology = dpf_mesh_to_vtk(self._tmpnodes, etypes, conn, as_linear)
+            self._vtk_topology[as_linear] = (topology, has_null_nodes)
+        else:
+            topology, has_null_nodes = self._vtk_topology[as_linear]
+            if has_null_nodes:
+                self._tmpnodes[0] = np.nan
 
-        grid = dpf_mesh_to_vtk(self._tmpnodes, etypes, conn, as_linear)
+        grid = topology.copy(deep=False)
+        grid.points = self._tmpnodes
 
         # consider adding this when scoping request is faster
         if include_ids:
@@ -442,6 +534,14 @@ class MeshedRegion:
 
         return grid
 
+    def _clear_grid_cache(self, topology=True):
+        """Forget the VTK grid and the skin of the mesh and, if ``topology``,
+        the cells of its grids."""
+        self._full_grid = None
+        self._skin = None
+        if topology:
+            self._vtk_topology = {}
+
     @property
     def grid(self):
         """
@@ -479,6 +579,7 @@ class MeshedRegion:
         shell_layers=None,
         deform_by=None,
         scale_factor=1.0,
+        skin_only=False,
         **kwargs,
     ):
         """
@@ -495,6 +596,9 @@ class MeshedRegion:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        skin_only : bool, optional
+            Whether to plot only the :attr:`skin` of the mesh, on which the
+            field is mapped on the client side. The default is ``False``.
         **kwargs : optional
             Additional keyword arguments for the plotter. For additional keyword
             arguments, see ``help(pyvista.plot)``.
@@ -510,6 +614,10 @@ class MeshedRegion:
         >>> field = disp.outputs.fields_container()[0]
         >>> model.metadata.meshed_region.plot(field)
 
+        Plot it on the external surface of the mesh only.
+
+        >>> model.metadata.meshed_region.plot(field, skin_only=True)
+
         """
         if field_or_fields_container is not None:
             pl = Plotter(self, **kwargs)
@@ -519,6 +627,7 @@ class MeshedRegion:
                 show_axes=kwargs.pop("show_axes", True),
                 deform_by=deform_by,
                 scale_factor=scale_factor,
+                skin_only=skin_only,
                 **kwargs,
             )
 
@@ -528,6 +637,7 @@ class MeshedRegion:
             self,
             deform_by=deform_by,
             scale_factor=scale_factor,
+            skin_only=skin_only,
             show_axes=kwargs.pop("show_axes", True),
             **kwargs,
         )
@@ -538,11 +648,14 @@ class MeshedRegion:
         Create a deep copy of the meshed region's data on a given server.
 
         This method is useful for passing data from one server instance to another.
+        Nodes coordinates, elements connectivity and types, the other available
+        property fields, the named selections and the unit are copied.
+        Each of them is transferred as a whole array.
 
         .. warning::
-           Only nodes scoping and coordinates and elements scoping, connectivity,
-           and types are copied. The eventual property field for elemental properties
-           and named selection will not be copied.
+           For server versions lower than 3.0, only nodes scoping and coordinates
+           and elements scoping, connectivity, and types are copied, node by node
+           and element by element.
 
         Parameters
         ----------
@@ -570,19 +683,66 @@ class MeshedRegion:
         mesh = MeshedRegion(
             num_nodes=len(node_ids), num_elements=len(element_ids), server=server
         )
-        with self.nodes.coordinates_field.as_local_field() as coord:
-            for i, node in enumerate(mesh.nodes.add_nodes(len(node_ids))):
-                node.id = node_ids[i]
-                node.coordinates = coord.get_entity_data(i)
-        with self.elements.connectivities_field.as_local_field() as connect:
-            with self.elements.element_types_field.as_local_field() as types:
-                for i, elem in enumerate(mesh.elements.add_elements(len(element_ids))):
-                    elem.id = element_ids[i]
-                    elem.connectivity = connect.get_entity_data(i)
-                    elem.shape = element_types.shape(types.get_entity_data(i)[0])
+        if not server_meet_version("3.0", self._server) \
+                or not server_meet_version("3.0", mesh._server):
+            self._deep_copy_by_entity(mesh, node_ids, element_ids)
+            mesh.unit = self.unit
+            return mesh
+
+        coordinates = self.nodes.coordinates_field
+        coordinates_copy = field.Field(
+            nentities=len(node_ids),
+            nature=natures.vector,
+            location=locations.nodal,
+            server=mesh._server,
+        )
+        coordinates_copy.scoping = coordinates.scoping.deep_copy(mesh._server)
+        coordinates_copy.data = coordinates.data
+        mesh.set_coordinates_field(coordinates_copy)
+
+        # the elements of the copy are defined by the scoping of these property fields
+        elements_scoping = scoping.Scoping(
+            ids=element_ids, location=locations.elemental, server=mesh._server
+        )
+        element_properties = [elemental_properties.element_type, elemental_properties.connectivity]
+        for property_name in element_properties:
+            property_field_copy = self.property_field(property_name).deep_copy(mesh._server)
+            property_field_copy.scoping = elements_scoping
+            mesh.set_property_field(property_name, property_field_copy)
+
+        for property_name in self.available_property_fields:
+            if property_name in [nodal_properties.coordinates,
+                                 nodal_properties.nodal_connectivity] + element_properties:
+                continue
+            mesh.set_property_field(
+                property_name, self.property_field(property_name).deep_copy(mesh._server)
+            )
+
+        for named_selection in self.available_named_selections:
+            mesh.set_named_selection_scoping(
+                named_selection,
+                self.named_selection(named_selection).deep_copy(mesh._server),
+            )
         mesh.unit = self.unit
         return mesh
 
+    def _deep_copy_by_entity(self, mesh, node_ids, element_ids):
+        """Fill ``mesh`` node by node and element by element for servers
+        that cannot set property fields."""
+        coordinates = self.nodes.coordinates_field.data
+        for i, node in enumerate(mesh.nodes.add_nodes(len(node_ids))):
+            node.id = node_ids[i]
+            node.coordinates = coordinates[i]
+        connectivities = self.elements.connectivities_field
+        connectivity = connectivities.data
+        data_pointer = np.append(connectivities._data_pointer, len(connectivity))
+        types = self.elements.element_types_field.data
+        shapes = element_types.shapes(types)
+        for i, elem in enumerate(mesh.elements.add_elements(len(element_ids))):
+            elem.id = element_ids[i]
+            elem.connectivity = connectivity[data_pointer[i]:data_pointer[i + 1]]
+            elem.shape = shapes[i]
+
     def field_of_properties(self, property_name):
         """
         Returns the ``Field`` or ``PropertyField`` associated
@@ -626,3 +786,15 @@ class MeshedRegion:
                     # Not sure we go through here since the only datatype not int is coordinates,
                     # which is already dealt with previously.
                     return field.Field(server=self._server, field=field_out)
+
+
+def _elements_contain_nodes(connectivity, offsets, element_indices, node_indices):
+    """Whether each element, given by index, has the node at the same position in
+    ``node_indices`` in its connectivity."""
+    starts = offsets[element_indices]
+    sizes = offsets[element_indices + 1] - starts
+    owners = np.repeat(np.arange(element_indices.size), sizes)
+    positions = np.arange(owners.size) + np.repeat(starts - (np.cumsum(sizes) - sizes), sizes)
+    found = np.zeros(element_indices.size, dtype=bool)
+    found[owners[connectivity[positions] == node_indices[owners]]] = True
+    return found
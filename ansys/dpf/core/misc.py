@@ -11,6 +11,8 @@ from ansys.dpf.core._version import (
 DEFAULT_FILE_CHUNK_SIZE = 524288
 DYNAMIC_RESULTS = True
 RETURN_ARRAYS = True
+FLOAT32_FIELDS = False
+FIELD_DATA_CACHE = None
 
 RUNTIME_CLIENT_CONFIG = None
 
@@ -7,7 +7,7 @@ Nodes
 import numpy as np
 from ansys.dpf.core.common import nodal_properties, locations
 from ansys.dpf.core.check_version import version_requires
-from ansys.dpf.core.check_version import version_requires
+from ansys.dpf.core.scoping import _IdIndex, _ScopingMapCache
 
 
 class Node:
@@ -121,6 +121,10 @@ class Nodes:
         self._mesh = mesh
         self._server = mesh._server
         self._mapping_id_to_index = None
+        self._id_index = None
+        self._scoping_maps = _ScopingMapCache()
+        self._ids = None
+        self._coordinates = None
 
     def __str__(self):
         return f"DPF Node collection with {len(self)} nodes\n"
@@ -133,8 +137,10 @@ class Nodes:
         return self.n_nodes
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        ids = self.ids
+        coordinates = self.coordinates
+        for i in range(len(ids)):
+            yield Node(self._mesh, int(ids[i]), i, coordinates[i].tolist())
 
     def node_by_id(self, id):
         """Array of node coordinates ordered by ID."""
@@ -161,19 +167,79 @@ class Nodes:
             Requested node
         """
         if nodeindex is None:
-            nodeindex = self._mesh._api.meshed_region_get_node_index(self._mesh, nodeid)
+            nodeindex = self._get_id_index().index(nodeid)
+            if nodeindex < 0:
+                raise ValueError(f"Node with ID {nodeid} is not in the mesh.")
         elif nodeid is None:
-            nodeid = self._mesh._api.meshed_region_get_node_id(self._mesh, nodeindex)
-        node_coordinates = [self._mesh._api.meshed_region_get_node_coord(self._mesh,
-                                                                         index=nodeindex,
-                                                                         coordinate=0),
-                            self._mesh._api.meshed_region_get_node_coord(self._mesh,
-                                                                         index=nodeindex,
-                                                                         coordinate=1),
-                            self._mesh._api.meshed_region_get_node_coord(self._mesh,
-                                                                         index=nodeindex,
-                                                                         coordinate=2)]
-        return Node(self._mesh, nodeid, nodeindex, node_coordinates)
+            nodeid = int(self.ids[nodeindex])
+        return Node(self._mesh, nodeid, nodeindex, self.coordinates[nodeindex].tolist())
+
+    @property
+    def ids(self):
+        """
+        IDs of all the nodes, ordered by index.
+
+        The IDs are requested from the server once and cached until nodes
+        are added to the mesh or its coordinates field is set.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> nodes.ids[2]
+        3
+
+        """
+        if self._ids is None:
+            self._ids = np.asarray(self.scoping.ids)
+        return self._ids
+
+    @property
+    def coordinates(self):
+        """
+        Coordinates of all the nodes as a ``(n_nodes, 3)`` array, ordered by index.
+
+        The coordinates are requested from the server once and cached until
+        nodes are added to the mesh or its coordinates field is set.
+
+        Returns
+        -------
+        coordinates : numpy.ndarray
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> nodes.coordinates[2]
+        array([0.015, 0.045, 0.03 ])
+
+        """
+        if self._coordinates is None:
+            self._coordinates = np.asarray(self.coordinates_field.data).reshape(-1, 3)
+        return self._coordinates
+
+    def _get_id_index(self):
+        """Retrieve the vectorized mapping between the IDs and indices of the nodes."""
+        if self._id_index is None:
+            self._id_index = _IdIndex(self.ids)
+        return self._id_index
+
+    def _clear_cache(self):
+        """Forget the arrays cached from the server when the nodes change."""
+        self._mapping_id_to_index = None
+        self._id_index = None
+        self._scoping_maps = _ScopingMapCache()
+        self._ids = None
+        self._coordinates = None
+        self._mesh._clear_grid_cache(topology=False)
 
     @property
     def scoping(self):
@@ -277,7 +343,7 @@ class Nodes:
 
     def _build_mapping_id_to_index(self):
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return {eid: i for i, eid in enumerate(self.ids.tolist())}
 
     @property
     def mapping_id_to_index(self):
@@ -324,10 +390,13 @@ class Nodes:
         """
         if external_scope.location in ["Elemental", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        indices = self._get_id_index().indices(external_scope.ids)
+        mask = indices >= 0
+        return indices[mask], mask
+
+    def _map_scoping_cached(self, external_scope):
+        """Cached :func:`map_scoping`, shared by the scopings with the same IDs."""
+        return self._scoping_maps.map(self._get_id_index(), external_scope.ids)
 
     def add_node(self, id, coordinates):
         """
@@ -342,6 +411,7 @@ class Nodes:
             List of ``[x, y, z]`` coordinates for the node.
         """
         self._mesh._api.meshed_region_add_node(self._mesh, coordinates, id)
+        self._clear_cache()
 
     def add_nodes(self, num):
         """
@@ -372,6 +442,7 @@ class Nodes:
             add = NodeAdder()
             yield add
             self._mesh._api.meshed_region_add_node(self._mesh, add.coordinates, add.id)
+            self._clear_cache()
 
 
 class NodeAdder:
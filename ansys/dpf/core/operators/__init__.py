@@ -5,17 +5,26 @@ Operators
 ---------
 """
 
-from . import result
-from . import math
-from . import utility
-from . import min_max
-from . import scoping
-from . import metadata
-from . import logic
-from . import mesh
-from . import filter
-from . import serialization
-from . import geo
-from . import averaging
-from . import invariant
-from . import mapping
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+# the categories, and the operators they contain, are imported on first access
+_lazy_package(
+    __name__,
+    [
+        "result",
+        "math",
+        "utility",
+        "min_max",
+        "scoping",
+        "metadata",
+        "logic",
+        "mesh",
+        "filter",
+        "serialization",
+        "geo",
+        "averaging",
+        "invariant",
+        "mapping",
+    ],
+    classes=False,
+)
@@ -0,0 +1,54 @@
+"""Import the generated operators' modules on first access."""
+import importlib
+import sys
+import types
+
+
+class _LazyPackage(types.ModuleType):
+    """Package whose submodules are imported when they are first accessed.
+
+    In the packages of operators, the attribute named after a submodule is the
+    operator class of this submodule rather than the submodule itself, as with
+    ``from .displacement import displacement``.
+    """
+
+    def __getattr__(self, name):
+        if name not in self.__dict__.get("_lazy_names", ()):
+            raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+        module = importlib.import_module(f"{self.__name__}.{name}")
+        setattr(self, name, module)
+        return self.__dict__[name]
+
+    def __setattr__(self, name, value):
+        # the import system sets the submodule as an attribute of its package
+        # once imported, which must not replace the operator class
+        if (
+                self.__dict__.get("_lazy_classes")
+                and isinstance(value, types.ModuleType)
+                and name in self.__dict__.get("_lazy_names", ())
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._lazy_names))
+
+
+def _lazy_package(name, submodules, classes=True):
+    """Make a package import its submodules on first access.
+
+    Parameters
+    ----------
+    name : str
+        Name of the package, ``__name__`` in its ``__init__.py``.
+    submodules : list[str]
+        Names of the submodules of the package.
+    classes : bool, optional
+        Whether accessing a submodule returns the class of the same name that it
+        defines. The default is ``True``.
+    """
+    package = sys.modules[name]
+    package._lazy_names = frozenset(submodules)
+    package._lazy_classes = classes
+    package.__all__ = sorted(submodules)
+    package.__class__ = _LazyPackage
@@ -1,25 +1,33 @@
-from .elemental_difference import elemental_difference 
-from .elemental_nodal_to_nodal import elemental_nodal_to_nodal 
-from .elemental_nodal_to_nodal_fc import elemental_nodal_to_nodal_fc 
-from .elemental_to_nodal import elemental_to_nodal 
-from .elemental_to_nodal_fc import elemental_to_nodal_fc 
-from .elemental_to_elemental_nodal import elemental_to_elemental_nodal 
-from .nodal_difference import nodal_difference 
-from .elemental_to_elemental_nodal_fc import elemental_to_elemental_nodal_fc 
-from .nodal_difference_fc import nodal_difference_fc 
-from .elemental_difference_fc import elemental_difference_fc 
-from .nodal_fraction_fc import nodal_fraction_fc 
-from .elemental_nodal_to_nodal_elemental_fc import elemental_nodal_to_nodal_elemental_fc 
-from .elemental_fraction_fc import elemental_fraction_fc 
-from .to_nodal import to_nodal 
-from .to_nodal_fc import to_nodal_fc 
-from .elemental_nodal_to_nodal_elemental import elemental_nodal_to_nodal_elemental 
-from .extend_to_mid_nodes import extend_to_mid_nodes 
-from .extend_to_mid_nodes_fc import extend_to_mid_nodes_fc 
-from .elemental_mean import elemental_mean 
-from .elemental_mean_fc import elemental_mean_fc 
-from .to_elemental_fc import to_elemental_fc 
-from .gauss_to_node_fc import gauss_to_node_fc 
-from .nodal_to_elemental import nodal_to_elemental 
-from .nodal_to_elemental_fc import nodal_to_elemental_fc 
-from .to_elemental_nodal_fc import to_elemental_nodal_fc 
+"""Operators of the ``averaging`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "elemental_difference",
+        "elemental_difference_fc",
+        "elemental_fraction_fc",
+        "elemental_mean",
+        "elemental_mean_fc",
+        "elemental_nodal_to_nodal",
+        "elemental_nodal_to_nodal_elemental",
+        "elemental_nodal_to_nodal_elemental_fc",
+        "elemental_nodal_to_nodal_fc",
+        "elemental_to_elemental_nodal",
+        "elemental_to_elemental_nodal_fc",
+        "elemental_to_nodal",
+        "elemental_to_nodal_fc",
+        "extend_to_mid_nodes",
+        "extend_to_mid_nodes_fc",
+        "gauss_to_node_fc",
+        "nodal_difference",
+        "nodal_difference_fc",
+        "nodal_fraction_fc",
+        "nodal_to_elemental",
+        "nodal_to_elemental_fc",
+        "to_elemental_fc",
+        "to_elemental_nodal_fc",
+        "to_nodal",
+        "to_nodal_fc",
+    ],
+)
@@ -163,6 +163,36 @@ def build_operator(
     return black.format_str(cls, mode=black.FileMode())
 
 
+def build_category_init(category_path):
+    """Write the ``__init__.py`` of a category of operators.
+
+    The operators' modules are listed in an index so that they are only imported
+    when they are first accessed.
+    """
+    category = os.path.basename(os.path.normpath(category_path))
+    module_names = []
+    for file_name in sorted(os.listdir(category_path)):
+        if not file_name.endswith(".py") or file_name.startswith("_"):
+            continue
+        # only list the modules defining an operator class named after them
+        with open(os.path.join(category_path, file_name), "r") as f:
+            if f"\nclass {file_name[:-3]}(Operator):" in f.read():
+                module_names.append(file_name[:-3])
+    index = "".join(f'        "{module_name}",\n' for module_name in module_names)
+    with open(os.path.join(category_path, "__init__.py"), "w") as f:
+        f.write(
+            f'"""Operators of the ``{category}`` category, imported on first access."""\n'
+            "from ansys.dpf.core.operators._lazy_loader import _lazy_package\n"
+            "\n"
+            "_lazy_package(\n"
+            "    __name__,\n"
+            "    [\n"
+            f"{index}"
+            "    ],\n"
+            ")\n"
+        )
+
+
 if __name__ == "__main__":
     this_path = os.path.dirname(os.path.abspath(__file__))
 
@@ -217,5 +247,10 @@ if __name__ == "__main__":
                     error_file.write(f"Class: {operator_str}")
                 print(error_message)
 
+    for category in os.listdir(this_path):
+        category_path = os.path.join(this_path, category)
+        if os.path.exists(os.path.join(category_path, "__init__.py")):
+            build_category_init(category_path)
+
     print(f"Generated {succeeded} out of {len(available_operators)}")
     dpf.SERVER.shutdown()
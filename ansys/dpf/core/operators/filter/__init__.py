@@ -1,9 +1,17 @@
-from .field_band_pass_fc import field_band_pass_fc 
-from .scoping_low_pass import scoping_low_pass 
-from .field_high_pass import field_high_pass 
-from .scoping_high_pass import scoping_high_pass 
-from .field_high_pass_fc import field_high_pass_fc 
-from .field_low_pass import field_low_pass 
-from .field_low_pass_fc import field_low_pass_fc 
-from .field_band_pass import field_band_pass 
-from .scoping_band_pass import scoping_band_pass 
+"""Operators of the ``filter`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "field_band_pass",
+        "field_band_pass_fc",
+        "field_high_pass",
+        "field_high_pass_fc",
+        "field_low_pass",
+        "field_low_pass_fc",
+        "scoping_band_pass",
+        "scoping_high_pass",
+        "scoping_low_pass",
+    ],
+)
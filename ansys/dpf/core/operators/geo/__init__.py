@@ -1,17 +1,25 @@
-from .normals_provider_nl import normals_provider_nl 
-from .rotate_in_cylindrical_cs_fc import rotate_in_cylindrical_cs_fc 
-from .rotate_in_cylindrical_cs import rotate_in_cylindrical_cs 
-from .rotate import rotate 
-from .rotate_fc import rotate_fc 
-from .to_polar_coordinates import to_polar_coordinates 
-from .elements_volumes_over_time import elements_volumes_over_time 
-from .gauss_to_node import gauss_to_node 
-from .elements_facets_surfaces_over_time import elements_facets_surfaces_over_time 
-from .elements_volume import elements_volume 
-from .element_nodal_contribution import element_nodal_contribution 
-from .center_of_gravity import center_of_gravity 
-from .integrate_over_elements import integrate_over_elements 
-from .mass import mass 
-from .moment_of_inertia import moment_of_inertia 
-from .normals import normals 
-from .prepare_mapping_workflow import prepare_mapping_workflow 
+"""Operators of the ``geo`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "center_of_gravity",
+        "element_nodal_contribution",
+        "elements_facets_surfaces_over_time",
+        "elements_volume",
+        "elements_volumes_over_time",
+        "gauss_to_node",
+        "integrate_over_elements",
+        "mass",
+        "moment_of_inertia",
+        "normals",
+        "normals_provider_nl",
+        "prepare_mapping_workflow",
+        "rotate",
+        "rotate_fc",
+        "rotate_in_cylindrical_cs",
+        "rotate_in_cylindrical_cs_fc",
+        "to_polar_coordinates",
+    ],
+)
@@ -1,12 +1,20 @@
-from .eigen_values import eigen_values 
-from .principal_invariants import principal_invariants 
-from .von_mises_eqv import von_mises_eqv 
-from .segalman_von_mises_eqv import segalman_von_mises_eqv 
-from .von_mises_eqv_fc import von_mises_eqv_fc 
-from .segalman_von_mises_eqv_fc import segalman_von_mises_eqv_fc 
-from .invariants import invariants 
-from .eigen_values_fc import eigen_values_fc 
-from .invariants_fc import invariants_fc 
-from .principal_invariants_fc import principal_invariants_fc 
-from .eigen_vectors_fc import eigen_vectors_fc 
-from .eigen_vectors import eigen_vectors 
+"""Operators of the ``invariant`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "eigen_values",
+        "eigen_values_fc",
+        "eigen_vectors",
+        "eigen_vectors_fc",
+        "invariants",
+        "invariants_fc",
+        "principal_invariants",
+        "principal_invariants_fc",
+        "segalman_von_mises_eqv",
+        "segalman_von_mises_eqv_fc",
+        "von_mises_eqv",
+        "von_mises_eqv_fc",
+    ],
+)
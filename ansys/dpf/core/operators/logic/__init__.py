@@ -1,13 +1,21 @@
-from .ascending_sort import ascending_sort 
-from .identical_meshes import identical_meshes 
-from .component_selector_fc import component_selector_fc 
-from .component_selector import component_selector 
-from .identical_property_fields import identical_property_fields 
-from .solid_shell_fields import solid_shell_fields 
-from .identical_fields import identical_fields 
-from .included_fields import included_fields 
-from .identical_fc import identical_fc 
-from .enrich_materials import enrich_materials 
-from .descending_sort import descending_sort 
-from .ascending_sort_fc import ascending_sort_fc 
-from .descending_sort_fc import descending_sort_fc 
+"""Operators of the ``logic`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "ascending_sort",
+        "ascending_sort_fc",
+        "component_selector",
+        "component_selector_fc",
+        "descending_sort",
+        "descending_sort_fc",
+        "enrich_materials",
+        "identical_fc",
+        "identical_fields",
+        "identical_meshes",
+        "identical_property_fields",
+        "included_fields",
+        "solid_shell_fields",
+    ],
+)
@@ -1,5 +1,13 @@
-from .find_reduced_coordinates import find_reduced_coordinates 
-from .on_reduced_coordinates import on_reduced_coordinates 
-from .on_coordinates import on_coordinates 
-from .scoping_on_coordinates import scoping_on_coordinates 
-from .solid_to_skin import solid_to_skin 
+"""Operators of the ``mapping`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "find_reduced_coordinates",
+        "on_coordinates",
+        "on_reduced_coordinates",
+        "scoping_on_coordinates",
+        "solid_to_skin",
+    ],
+)
@@ -1,24 +1,32 @@
-from .node_coordinates import node_coordinates 
-from .from_field import from_field 
-from .mesh_provider import mesh_provider 
-from .meshes_provider import meshes_provider 
-from .beam_properties import beam_properties 
-from .split_mesh import split_mesh 
-from .from_scoping import from_scoping 
-from .split_fields import split_fields 
-from .points_from_coordinates import points_from_coordinates 
-from .mesh_clip import mesh_clip 
-from .make_sphere_levelset import make_sphere_levelset 
-from .tri_mesh_skin import tri_mesh_skin 
-from .mesh_cut import mesh_cut 
-from .combine_levelset import combine_levelset 
-from .external_layer import external_layer 
-from .skin import skin 
-from .stl_export import stl_export 
-from .mesh_plan_clip import mesh_plan_clip 
-from .mesh_to_graphics import mesh_to_graphics 
-from .acmo_mesh_provider import acmo_mesh_provider 
-from .mesh_to_graphics_edges import mesh_to_graphics_edges 
-from .make_plane_levelset import make_plane_levelset 
-from .exclude_levelset import exclude_levelset 
-from .point_cloud_search import point_cloud_search 
+"""Operators of the ``mesh`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "acmo_mesh_provider",
+        "beam_properties",
+        "combine_levelset",
+        "exclude_levelset",
+        "external_layer",
+        "from_field",
+        "from_scoping",
+        "make_plane_levelset",
+        "make_sphere_levelset",
+        "mesh_clip",
+        "mesh_cut",
+        "mesh_plan_clip",
+        "mesh_provider",
+        "mesh_to_graphics",
+        "mesh_to_graphics_edges",
+        "meshes_provider",
+        "node_coordinates",
+        "point_cloud_search",
+        "points_from_coordinates",
+        "skin",
+        "split_fields",
+        "split_mesh",
+        "stl_export",
+        "tri_mesh_skin",
+    ],
+)
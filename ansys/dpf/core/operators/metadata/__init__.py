@@ -1,11 +1,19 @@
-from .mesh_support_provider import mesh_support_provider 
-from .result_info_provider import result_info_provider 
-from .time_freq_provider import time_freq_provider 
-from .material_provider import material_provider 
-from .streams_provider import streams_provider 
-from .mesh_selection_manager_provider import mesh_selection_manager_provider 
-from .boundary_condition_provider import boundary_condition_provider 
-from .is_cyclic import is_cyclic 
-from .material_support_provider import material_support_provider 
-from .cyclic_mesh_expansion import cyclic_mesh_expansion 
-from .cyclic_support_provider import cyclic_support_provider 
+"""Operators of the ``metadata`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "boundary_condition_provider",
+        "cyclic_mesh_expansion",
+        "cyclic_support_provider",
+        "is_cyclic",
+        "material_provider",
+        "material_support_provider",
+        "mesh_selection_manager_provider",
+        "mesh_support_provider",
+        "result_info_provider",
+        "streams_provider",
+        "time_freq_provider",
+    ],
+)
@@ -1,16 +1,24 @@
-from .min_max_by_time import min_max_by_time 
-from .phase_of_max import phase_of_max 
-from .time_of_max_by_entity import time_of_max_by_entity 
-from .min_max_by_entity import min_max_by_entity 
-from .min_max_over_time_by_entity import min_max_over_time_by_entity 
-from .max_over_time_by_entity import max_over_time_by_entity 
-from .min_over_time_by_entity import min_over_time_by_entity 
-from .time_of_min_by_entity import time_of_min_by_entity 
-from .max_over_phase import max_over_phase 
-from .min_max import min_max 
-from .min_max_fc import min_max_fc 
-from .min_max_over_label_fc import min_max_over_label_fc 
-from .min_by_component import min_by_component 
-from .max_by_component import max_by_component 
-from .min_max_fc_inc import min_max_fc_inc 
-from .min_max_inc import min_max_inc 
+"""Operators of the ``min_max`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "max_by_component",
+        "max_over_phase",
+        "max_over_time_by_entity",
+        "min_by_component",
+        "min_max",
+        "min_max_by_entity",
+        "min_max_by_time",
+        "min_max_fc",
+        "min_max_fc_inc",
+        "min_max_inc",
+        "min_max_over_label_fc",
+        "min_max_over_time_by_entity",
+        "min_over_time_by_entity",
+        "phase_of_max",
+        "time_of_max_by_entity",
+        "time_of_min_by_entity",
+    ],
+)
@@ -1,13 +1,21 @@
-from .elemental_from_mesh import elemental_from_mesh 
-from .intersect import intersect 
-from .connectivity_ids import connectivity_ids 
-from .on_property import on_property 
-from .transpose import transpose 
-from .rescope_fc import rescope_fc 
-from .rescope import rescope 
-from .split_on_property_type import split_on_property_type 
-from .on_named_selection import on_named_selection 
-from .nodal_from_mesh import nodal_from_mesh 
-from .change_fc import change_fc 
-from .on_mesh_property import on_mesh_property 
-from .from_mesh import from_mesh 
+"""Operators of the ``scoping`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "change_fc",
+        "connectivity_ids",
+        "elemental_from_mesh",
+        "from_mesh",
+        "intersect",
+        "nodal_from_mesh",
+        "on_mesh_property",
+        "on_named_selection",
+        "on_property",
+        "rescope",
+        "rescope_fc",
+        "split_on_property_type",
+        "transpose",
+    ],
+)
@@ -1,15 +1,23 @@
-from .mechanical_csv_to_field import mechanical_csv_to_field 
-from .serializer import serializer 
-from .field_to_csv import field_to_csv 
-from .csv_to_field import csv_to_field 
-from .txt_to_data_tree import txt_to_data_tree 
-from .data_tree_to_txt import data_tree_to_txt 
-from .deserializer import deserializer 
-from .serializer_to_string import serializer_to_string 
-from .string_deserializer import string_deserializer 
-from .data_tree_to_json import data_tree_to_json 
-from .json_to_data_tree import json_to_data_tree 
-from .vtk_export import vtk_export 
-from .vtk_to_fields import vtk_to_fields 
-from .migrate_file_to_vtk import migrate_file_to_vtk 
-from .serialize_to_hdf5 import serialize_to_hdf5 
+"""Operators of the ``serialization`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "csv_to_field",
+        "data_tree_to_json",
+        "data_tree_to_txt",
+        "deserializer",
+        "field_to_csv",
+        "json_to_data_tree",
+        "mechanical_csv_to_field",
+        "migrate_file_to_vtk",
+        "serialize_to_hdf5",
+        "serializer",
+        "serializer_to_string",
+        "string_deserializer",
+        "txt_to_data_tree",
+        "vtk_export",
+        "vtk_to_fields",
+    ],
+)
@@ -1,34 +1,42 @@
-from .merge_result_infos import merge_result_infos 
-from .field_to_fc import field_to_fc 
-from .html_doc import html_doc 
-from .unitary_field import unitary_field 
-from .extract_field import extract_field 
-from .bind_support import bind_support 
-from .scalars_to_field import scalars_to_field 
-from .change_location import change_location 
-from .strain_from_voigt import strain_from_voigt 
-from .set_property import set_property 
-from .forward_field import forward_field 
-from .forward_fields_container import forward_fields_container 
-from .forward_meshes_container import forward_meshes_container 
-from .forward import forward 
-from .txt_file_to_dpf import txt_file_to_dpf 
-from .bind_support_fc import bind_support_fc 
-from .default_value import default_value 
-from .extract_time_freq import extract_time_freq 
-from .python_generator import python_generator 
-from .make_overall import make_overall 
-from .merge_fields_containers import merge_fields_containers 
-from .merge_scopings import merge_scopings 
-from .merge_materials import merge_materials 
-from .merge_scopings_containers import merge_scopings_containers 
-from .merge_property_fields import merge_property_fields 
-from .remote_workflow_instantiate import remote_workflow_instantiate 
-from .remote_operator_instantiate import remote_operator_instantiate 
-from .merge_time_freq_supports import merge_time_freq_supports 
-from .merge_fields_by_label import merge_fields_by_label 
-from .merge_meshes import merge_meshes 
-from .merge_fields import merge_fields 
-from .merge_supports import merge_supports 
-from .merge_meshes_containers import merge_meshes_containers 
-from .change_shell_layers import change_shell_layers 
+"""Operators of the ``utility`` category, imported on first access."""
+from ansys.dpf.core.operators._lazy_loader import _lazy_package
+
+_lazy_package(
+    __name__,
+    [
+        "bind_support",
+        "bind_support_fc",
+        "change_location",
+        "change_shell_layers",
+        "default_value",
+        "extract_field",
+        "extract_time_freq",
+        "field_to_fc",
+        "forward",
+        "forward_field",
+        "forward_fields_container",
+        "forward_meshes_container",
+        "html_doc",
+        "make_overall",
+        "merge_fields",
+        "merge_fields_by_label",
+        "merge_fields_containers",
+        "merge_materials",
+        "merge_meshes",
+        "merge_meshes_containers",
+        "merge_property_fields",
+        "merge_result_infos",
+        "merge_scopings",
+        "merge_scopings_containers",
+        "merge_supports",
+        "merge_time_freq_supports",
+        "python_generator",
+        "remote_operator_instantiate",
+        "remote_workflow_instantiate",
+        "scalars_to_field",
+        "set_property",
+        "strain_from_voigt",
+        "txt_file_to_dpf",
+        "unitary_field",
+    ],
+)
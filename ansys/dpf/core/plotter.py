@@ -12,6 +12,7 @@ import sys
 import numpy as np
 import inspect
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from ansys import dpf
 from ansys.dpf import core
@@ -45,6 +46,60 @@ def _sort_supported_kwargs(bound_method, **kwargs):
     return kwargs_in
 
 
+def _fields_data_on_mesh(fields, mesh, mesh_location, component_count):
+    """Merge the data of fields into an array ordered as the nodes or elements of a mesh."""
+    if component_count > 1:
+        overall_data = np.full((len(mesh_location), component_count), np.nan)
+    else:
+        overall_data = np.full(len(mesh_location), np.nan)
+    for field in fields:
+        field.to_mesh_array(mesh, out=overall_data)
+    return overall_data
+
+
+def _skin_grid(mesh, deform_by=None, scale_factor=1.0):
+    """VTK grid of the cached skin of a mesh, deformed on the client side."""
+    skin_mesh, node_indices, _ = mesh._get_skin()
+    if not deform_by:
+        return skin_mesh.grid
+    grid = skin_mesh._as_vtk()
+    coordinates = mesh.deform_by(deform_by, scale_factor)
+    # hold onto the data as PyVista does not make a copy
+    skin_mesh._tmpnodes = coordinates.to_mesh_array(mesh)[node_indices]
+    grid.points = skin_mesh._tmpnodes
+    return grid
+
+
+def _skin_data(mesh, overall_data, location):
+    """Restrict an array ordered as the nodes or elements of a mesh to its skin."""
+    _, node_indices, element_indices = mesh._get_skin()
+    if location == locations.nodal:
+        return overall_data[node_indices]
+    return overall_data[element_indices]
+
+
+def _change_shell_layers(fields_container, shell_layers=None):
+    """Keep a single shell layer when the fields are defined on several ones."""
+    for field in fields_container:
+        shell_layer_check = field.shell_layers
+        if shell_layer_check in [
+            eshell_layers.topbottom,
+            eshell_layers.topbottommid,
+        ]:
+            changeOp = core.Operator("change_shellLayers", server=fields_container._server)
+            changeOp.inputs.fields_container.connect(fields_container)
+            sl = eshell_layers.top
+            if shell_layers is not None:
+                if not isinstance(shell_layers, eshell_layers):
+                    raise TypeError(
+                        "shell_layer attribute must be a core.shell_layers instance."
+                    )
+                sl = shell_layers
+            changeOp.inputs.e_shell_layer.connect(sl.value)  # top layers taken
+            return changeOp.get_output(0, core.types.fields_container)
+    return fields_container
+
+
 class _InternalPlotterFactory:
     """
     Factory for _InternalPlotter based on the backend."""
@@ -79,7 +134,8 @@ class _PyVistaPlotter:
         self._plotter.add_text(f"Scale factor: {scale_factor}", position='upper_right',
                                font_size=12, **kwargs_in)
 
-    def add_mesh(self, meshed_region, deform_by=None, scale_factor=1.0, **kwargs):
+    def add_mesh(self, meshed_region, deform_by=None, scale_factor=1.0, skin_only=False,
+                 **kwargs):
 
         kwargs = self._set_scalar_bar_title(kwargs)
 
@@ -100,7 +156,9 @@ class _PyVistaPlotter:
         # Have to remove any active scalar field from the pre-existing grid object,
         # otherwise we get two scalar bars when calling several plot_contour on the same mesh
         # but not for the same field. The PyVista UnstructuredGrid keeps memory of it.
-        if not deform_by:
+        if skin_only:
+            grid = _skin_grid(meshed_region, deform_by, scale_factor)
+        elif not deform_by:
             grid = meshed_region.grid
         else:
             grid = meshed_region._as_vtk(
@@ -160,7 +218,7 @@ class _PyVistaPlotter:
 
     def add_field(self, field, meshed_region=None, show_max=False, show_min=False,
                   label_text_size=30, label_point_size=20, deform_by=None, scale_factor=1.0,
-                  **kwargs):
+                  skin_only=False, **kwargs):
         # Get the field name
         name = field.name.split("_")[0]
         unit = field.unit
@@ -193,13 +251,8 @@ class _PyVistaPlotter:
             raise ValueError(
                 "Only elemental or nodal location are supported for plotting."
             )
-        component_count = field.component_count
-        if component_count > 1:
-            overall_data = np.full((len(mesh_location), component_count), np.nan)
-        else:
-            overall_data = np.full(len(mesh_location), np.nan)
-        ind, mask = mesh_location.map_scoping(field.scoping)
-        overall_data[ind] = field.data[mask]
+        overall_data = _fields_data_on_mesh([field], meshed_region, mesh_location,
+                                            field.component_count)
 
         # Filter kwargs for add_mesh
         kwargs_in = _sort_supported_kwargs(
@@ -209,7 +262,10 @@ class _PyVistaPlotter:
         # Have to remove any active scalar field from the pre-existing grid object,
         # otherwise we get two scalar bars when calling several plot_contour on the same mesh
         # but not for the same field. The PyVista UnstructuredGrid keeps memory of it.
-        if not deform_by:
+        if skin_only:
+            grid = _skin_grid(meshed_region, deform_by, scale_factor)
+            overall_data = _skin_data(meshed_region, overall_data, location)
+        elif not deform_by:
             grid = meshed_region.grid
         else:
             grid = meshed_region._as_vtk(
@@ -360,7 +416,8 @@ class DpfPlotter:
                                                                     labels=labels,
                                                                     **kwargs))
 
-    def add_mesh(self, meshed_region, deform_by=None, scale_factor=1.0, **kwargs):
+    def add_mesh(self, meshed_region, deform_by=None, scale_factor=1.0, skin_only=False,
+                 **kwargs):
         """Add a mesh to plot.
 
         Parameters
@@ -372,6 +429,9 @@ class DpfPlotter:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        skin_only : bool, optional
+            Whether to plot only the skin of the mesh, which is computed once
+            and cached by the mesh. The default is ``False``.
         **kwargs : optional
             Additional keyword arguments for the plotter. More information
             are available at :func:`pyvista.plot`.
@@ -390,11 +450,12 @@ class DpfPlotter:
         self._internal_plotter.add_mesh(meshed_region=meshed_region,
                                         deform_by=deform_by,
                                         scale_factor=scale_factor,
+                                        skin_only=skin_only,
                                         **kwargs)
 
     def add_field(self, field, meshed_region=None, show_max=False, show_min=False,
                   label_text_size=30, label_point_size=20,
-                  deform_by=None, scale_factor=1.0,
+                  deform_by=None, scale_factor=1.0, skin_only=False,
                   **kwargs):
         """Add a field containing data to the plotter.
 
@@ -418,6 +479,10 @@ class DpfPlotter:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        skin_only : bool, optional
+            Whether to plot only the skin of the mesh, which is computed once
+            and cached by the mesh. The default is ``False``.
+            The field is mapped onto the skin on the client side.
         **kwargs : optional
             Additional keyword arguments for the plotter. More information
             are available at :func:`pyvista.plot`.
@@ -442,6 +507,7 @@ class DpfPlotter:
                                          label_point_size=label_point_size,
                                          deform_by=deform_by,
                                          scale_factor=scale_factor,
+                                         skin_only=skin_only,
                                          **kwargs)
 
     def show_figure(self, **kwargs):
@@ -618,12 +684,13 @@ class Plotter:
             meshed_region=None,
             deform_by=None,
             scale_factor=1.0,
+            skin_only=False,
             **kwargs
     ):
         """Plot the contour result on its mesh support.
 
         You cannot plot a fields container containing results at several
-        time steps.
+        time steps, use :func:`animate` instead.
 
         Parameters
         ----------
@@ -637,6 +704,9 @@ class Plotter:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        skin_only : bool, optional
+            Whether to plot only the skin of the mesh, which is computed once
+            and cached by the mesh. The default is ``False``.
         **kwargs : optional
             Additional keyword arguments for the plotter. For more information,
             see ``help(pyvista.plot)``.
@@ -702,35 +772,12 @@ class Plotter:
                 "Only elemental or nodal location are supported for plotting."
             )
 
-        # pre-loop: check if shell layers for each field, if yes, set the shell layers
-        changeOp = core.Operator("change_shellLayers")
-        for field in fields_container:
-            shell_layer_check = field.shell_layers
-            if shell_layer_check in [
-                eshell_layers.topbottom,
-                eshell_layers.topbottommid,
-            ]:
-                changeOp.inputs.fields_container.connect(fields_container)
-                sl = eshell_layers.top
-                if shell_layers is not None:
-                    if not isinstance(shell_layers, eshell_layers):
-                        raise TypeError(
-                            "shell_layer attribute must be a core.shell_layers instance."
-                        )
-                    sl = shell_layers
-                changeOp.inputs.e_shell_layer.connect(sl.value)  # top layers taken
-                fields_container = changeOp.get_output(0, core.types.fields_container)
-                break
+        # check if shell layers for each field, if yes, set the shell layers
+        fields_container = _change_shell_layers(fields_container, shell_layers)
 
         # Merge field data into a single array
-        if component_count > 1:
-            overall_data = np.full((len(mesh_location), component_count), np.nan)
-        else:
-            overall_data = np.full(len(mesh_location), np.nan)
-
-        for field in fields_container:
-            ind, mask = mesh_location.map_scoping(field.scoping)
-            overall_data[ind] = field.data[mask]
+        overall_data = _fields_data_on_mesh(fields_container, mesh, mesh_location,
+                                            component_count)
 
         # create the plotter and add the meshes
 
@@ -758,11 +805,15 @@ class Plotter:
             bound_method=self._internal_plotter._plotter.add_mesh,
             **kwargs
             )
-        if deform_by:
+        if skin_only:
+            grid = _skin_grid(mesh, deform_by, scale_factor)
+            overall_data = _skin_data(mesh, overall_data, location)
+        elif deform_by:
             grid = mesh._as_vtk(mesh.deform_by(deform_by, scale_factor))
-            self._internal_plotter.add_scale_factor_legend(scale_factor, **kwargs)
         else:
             grid = mesh.grid
+        if deform_by:
+            self._internal_plotter.add_scale_factor_legend(scale_factor, **kwargs)
         self._internal_plotter._plotter.add_mesh(grid, scalars=overall_data, **kwargs_in)
 
         background = kwargs.pop("background", None)
@@ -779,6 +830,193 @@ class Plotter:
             **kwargs)
         return self._internal_plotter._plotter.show(**kwargs_in)
 
+    def animate(
+            self,
+            fields_container,
+            deform_by=None,
+            scale_factor=1.0,
+            save_as=None,
+            off_screen=None,
+            framerate=10,
+            shell_layers=None,
+            meshed_region=None,
+            **kwargs
+    ):
+        """Animate the results of a fields container over its time steps.
+
+        The grid of the mesh is built once. Each frame only updates the
+        scalars and, when deformed by a different field per time step, the
+        points of the grid. The data of the next frame is fetched in a
+        background thread while the current frame is rendered.
+
+        Parameters
+        ----------
+        fields_container : dpf.core.FieldsContainer
+            Fields container with the results to animate. The fields with the
+            same ``"time"`` label make a frame. Each field makes a frame when the
+            fields container has no ``"time"`` label.
+        deform_by : FieldsContainer, Field, Result, Operator, optional
+            Used to deform the plotted mesh. A fields container with several
+            3D vector fields gives the deformation of each time step with its
+            ``"time"`` label. Otherwise, the deformation is the same for all the
+            frames. Defaults to None.
+        scale_factor : float, optional
+            Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        save_as : str, os.PathLike, optional
+            Path of the ``.gif`` or movie, such as ``.mp4``, file to save the
+            animation to. Defaults to None.
+        off_screen : bool, optional
+            Whether to render the frames off screen. Defaults to ``True`` when
+            ``save_as`` is given.
+        framerate : int, optional
+            Number of frames per second of the saved animation. Defaults to 10.
+        shell_layers : core.shell_layers, optional
+            Enum used to set the shell layers if the model to plot
+            contains shell elements.
+        meshed_region : dpf.core.MeshedRegion, optional
+            Mesh to plot the results on. Defaults to the mesh of the plotter.
+        **kwargs : optional
+            Additional keyword arguments for the plotter. For more information,
+            see ``help(pyvista.plot)``. The color range is given by ``clim`` and
+            defaults to the range of the results over all the frames.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> disp = model.results.displacement.on_all_time_freqs.eval()
+        >>> plotter = dpf.plotter.Plotter(model.metadata.meshed_region)
+        >>> plotter.animate(disp, deform_by=disp, save_as="displacement.gif")
+
+        """
+        if not sys.warnoptions:
+            import warnings
+
+            warnings.simplefilter("ignore")
+
+        if not isinstance(fields_container, dpf.core.FieldsContainer):
+            raise TypeError("Only a fields_container can be animated.")
+        if DefinitionLabels.complex in fields_container.labels:
+            raise dpf_errors.ComplexPlottingError
+        if off_screen is None:
+            off_screen = save_as is not None
+        mesh = meshed_region if meshed_region is not None else self._mesh
+
+        # group the fields by time step
+        frames = {}
+        for i in range(len(fields_container)):
+            label_space = fields_container.get_label_space(i)
+            frames.setdefault(label_space.get(DefinitionLabels.time, i), []).append(i)
+        frames = list(frames.items())
+
+        fields_container = _change_shell_layers(fields_container, shell_layers)
+        field = fields_container[frames[0][1][0]]
+        location = field.location
+        component_count = field.component_count
+        name = field.name.split("_")[0]
+        if location == locations.nodal:
+            mesh_location = mesh.nodes
+        elif location == locations.elemental:
+            mesh_location = mesh.elements
+        else:
+            raise ValueError(
+                "Only elemental or nodal location are supported for plotting."
+            )
+
+        if "clim" not in kwargs:
+            # range over all the time steps, computed on the server
+            range_input = fields_container
+            if component_count > 1:
+                norm_op = dpf.core.Operator("norm_fc", server=fields_container._server)
+                norm_op.inputs.fields_container.connect(fields_container)
+                range_input = norm_op.outputs
+            min_max_op = dpf.core.Operator("min_max_fc", server=fields_container._server)
+            min_max_op.inputs.connect(range_input)
+            kwargs["clim"] = [
+                np.min(min_max_op.outputs.field_min().data),
+                np.max(min_max_op.outputs.field_max().data),
+            ]
+
+        deform_by_frame = (
+                isinstance(deform_by, dpf.core.FieldsContainer) and len(deform_by) > 1
+        )
+
+        def load_frame(frame):
+            time, indices = frame
+            data = _fields_data_on_mesh(
+                [fields_container[i] for i in indices], mesh, mesh_location, component_count
+            )
+            if component_count > 1:
+                data = np.linalg.norm(data, axis=1)
+            points = None
+            if deform_by_frame:
+                deformation = deform_by.get_field({DefinitionLabels.time: time})
+                points = np.array(mesh.deform_by(deformation, scale_factor).data)
+            return data, points
+
+        if deform_by and not deform_by_frame:
+            grid = mesh._as_vtk(mesh.deform_by(deform_by, scale_factor))
+        else:
+            grid = mesh._as_vtk()
+        if location == locations.nodal:
+            grid_data = grid.point_data
+            kwargs.setdefault("preference", "point")
+        else:
+            grid_data = grid.cell_data
+            kwargs.setdefault("preference", "cell")
+
+        plotter = _InternalPlotterFactory.get_plotter_class()(
+            mesh=mesh, off_screen=off_screen, **kwargs
+        )
+        kwargs.setdefault("stitle", f"{name} ({field.unit})")
+        kwargs = plotter._set_scalar_bar_title(kwargs)
+        kwargs.setdefault("show_edges", True)
+        kwargs.setdefault("nan_color", "grey")
+        if deform_by:
+            plotter.add_scale_factor_legend(scale_factor, **kwargs)
+        show_axes = kwargs.pop("show_axes", None)
+        if show_axes:
+            plotter._plotter.add_axes()
+        background = kwargs.pop("background", None)
+        if background is not None:
+            plotter._plotter.set_background(background)
+        cpos = kwargs.pop("cpos", None)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_frame = executor.submit(load_frame, frames[0])
+            for i_frame in range(len(frames)):
+                data, points = next_frame.result()
+                if i_frame + 1 < len(frames):
+                    next_frame = executor.submit(load_frame, frames[i_frame + 1])
+                grid_data[name] = data
+                if points is not None:
+                    grid.points = points
+                if i_frame == 0:
+                    kwargs_in = _sort_supported_kwargs(
+                        bound_method=plotter._plotter.add_mesh, **kwargs
+                    )
+                    plotter._plotter.add_mesh(grid, scalars=name, **kwargs_in)
+                    if cpos is not None:
+                        plotter._plotter.camera_position = cpos
+                    if save_as is not None:
+                        if os.path.splitext(str(save_as))[1].lower() == ".gif":
+                            plotter._plotter.open_gif(
+                                str(save_as),
+                                **_sort_supported_kwargs(
+                                    bound_method=plotter._plotter.open_gif, fps=framerate
+                                ),
+                            )
+                        else:
+                            plotter._plotter.open_movie(str(save_as), framerate=framerate)
+                    if not off_screen:
+                        plotter._plotter.show(auto_close=False, interactive_update=True)
+                if save_as is not None:
+                    plotter._plotter.write_frame()
+                else:
+                    plotter._plotter.update()
+        plotter._plotter.close()
+
     def _plot_contour_using_vtk_file(self, fields_container, notebook=None):
         """Plot the contour result on its mesh support.
 
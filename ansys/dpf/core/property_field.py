@@ -245,6 +245,11 @@ class PropertyField(_FieldBase):
                 data = copy
         return self._api.csproperty_field_set_data(self, _get_size_of_list(data), data)
 
+    def _set_entity_data(self, index, id, data):
+        return self._api.csproperty_field_set_entity_data(
+            self, index, id, _get_size_of_list(data), data
+        )
+
     def as_local_field(self):
         """Create a deep copy of the field locally.
 
@@ -282,6 +287,41 @@ class PropertyField(_FieldBase):
         """
         return _LocalPropertyField(self)
 
+    def deep_copy(self, server=None):
+        """Create a deep copy of the property field's data on a given server.
+
+        The scoping, data and data pointer are each transferred in one request.
+
+        Parameters
+        ----------
+        server : :class:`ansys.dpf.core.server`, optional
+            Server with the channel connected to the remote or local instance. The
+            default is ``None``, in which case an attempt is made to use the global
+            server.
+
+        Returns
+        -------
+        property_field_copy : PropertyField
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> connectivities = model.metadata.meshed_region.elements.connectivities_field
+        >>> other_server = dpf.start_local_server(as_global=False)
+        >>> deep_copy = connectivities.deep_copy(server=other_server)
+
+        """
+        nature = natures.scalar if self.component_count == 1 else natures.vector
+        f = PropertyField(nentities=len(self.scoping), nature=nature, server=server)
+        f.scoping = self.scoping.deep_copy(server)
+        f.data = self.data
+        data_pointer = self._data_pointer
+        if len(data_pointer) > 0:
+            f._data_pointer = data_pointer
+        return f
+
 
 class _LocalPropertyField(_LocalFieldBase, PropertyField):
     """Caches the internal data of a field so that it can be modified locally.
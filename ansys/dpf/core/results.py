@@ -9,6 +9,7 @@ import functools
 
 from ansys.dpf.core import Operator
 from ansys.dpf.core import errors
+from ansys.dpf.core.common import types
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.custom_fields_container import (
     ElShapeFieldsContainer,
@@ -265,7 +266,21 @@ class Result:
         >>> fc = disp.on_all_time_freqs.eval()
 
         """
-        fc = self.__call__().outputs.fields_container()
+        output = self.__call__().outputs.fields_container
+        if self._specific_fc_type is None:
+            fc = output._operator._get_cached_output(output._pin, types.fields_container)
+        else:
+            # fields split by body or shape are supported by sub-meshes, which are not cached
+            fc = output()
+        if getattr(fc, "_from_field_data_cache", False):
+            # the supports are not stored in the cache
+            mesh = self._connector.meshed_region
+            if mesh is not None:
+                for field in fc:
+                    field.meshed_region = mesh
+            time_freq_support = self._connector.time_freq_support
+            if time_freq_support is not None:
+                fc.time_freq_support = time_freq_support
         if self._specific_fc_type == "shape":
             fc = ElShapeFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
         elif self._specific_fc_type == "body":
@@ -5,8 +5,10 @@ Scoping
 =======
 """
 
+import hashlib
 import traceback
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 
@@ -26,6 +28,18 @@ from ansys.dpf.gate import (
 )
 
 
+#: Number of IDs above which set operations between two remote scopings are
+#: computed by the server instead of transferring the IDs to the client.
+_SERVER_SET_OPERATIONS_MIN_SIZE = 5_000_000
+
+
+def _ids_as_array(ids):
+    """Retrieve the IDs of a scoping, a list or an array as a numpy array."""
+    if isinstance(ids, Scoping):
+        return ids._ids_array()
+    return np.asarray(ids, dtype=np.int32).ravel()
+
+
 class Scoping:
     """Represents a scoping, which is a subset of a model support.
 
@@ -246,6 +260,229 @@ class Scoping:
         """
         return self._get_index(id)
 
+    def index_many(self, ids):
+        """Retrieve the indices of several IDs, ``-1`` for IDs not in the scoping.
+
+        The IDs of the scoping are requested once and searched locally.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs for the indices to retrieve.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 4, 9])
+        >>> scoping.index_many([9, 2, 1])
+        array([ 2, -1,  0])
+
+        """
+        return _IdIndex(self._get_ids(True)).indices(ids)
+
+    def id_many(self, indices):
+        """Retrieve the IDs at several indices.
+
+        Parameters
+        ----------
+        indices : list of int, numpy.ndarray
+            Indices for the IDs to retrieve.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 4, 9])
+        >>> print(scoping.id_many([2, 0]))
+        [9 1]
+
+        """
+        return np.asarray(self._get_ids(True))[np.asarray(indices, dtype=np.int64)]
+
+    def _ids_array(self):
+        """IDs of the scoping, retrieved for a single set operation.
+
+        The IDs are not kept between operations since the scoping can be
+        modified on the server through other objects referencing it.
+        """
+        return np.asarray(self._get_ids(True), dtype=np.int32).ravel()
+
+    def _uses_server_for(self, other):
+        """Whether a set operation with ``other`` should be computed by the server.
+
+        Only scopings which are both held by the same remote server and hold
+        more than ``_SERVER_SET_OPERATIONS_MIN_SIZE`` IDs together avoid
+        transferring their IDs to the client.
+        """
+        return (
+            isinstance(other, Scoping)
+            and not isinstance(self, _LocalScoping)
+            and not isinstance(other, _LocalScoping)
+            and other._server is self._server
+            and self._server.has_client()
+            and len(self) + len(other) > _SERVER_SET_OPERATIONS_MIN_SIZE
+        )
+
+    def _from_ids(self, ids):
+        """Create a scoping with the given IDs and the location of this scoping."""
+        scop = Scoping(server=self._server, location=self.location)
+        scop.ids = ids
+        return scop
+
+    def _server_set_operation(self, op_name, other, pin):
+        """Compute a set operation with ``other`` with a server operator."""
+        from ansys.dpf.core import dpf_operator
+        from ansys.dpf.core.common import types
+
+        op = dpf_operator.Operator(op_name, server=self._server)
+        op.connect(0, self)
+        op.connect(1, other)
+        return op.get_output(pin, types.scoping)
+
+    def isin(self, ids):
+        """Check which IDs of the scoping are in a set of IDs.
+
+        Parameters
+        ----------
+        ids : Scoping, list of int, numpy.ndarray
+            IDs to test against.
+
+        Returns
+        -------
+        mask : numpy.ndarray
+            Boolean mask over the IDs of this scoping.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 4, 9])
+        >>> scoping.isin([9, 2, 1])
+        array([ True, False,  True])
+
+        """
+        return np.isin(self._ids_array(), _ids_as_array(ids))
+
+    def unique(self):
+        """Create a scoping without repeated IDs.
+
+        The first occurrence of each ID is kept, in the order of this scoping.
+
+        Returns
+        -------
+        scoping : Scoping
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 1, 4, 9, 1])
+        >>> print(scoping.unique().ids)
+        [4 1 9]
+
+        """
+        ids = self._ids_array()
+        _, first = np.unique(ids, return_index=True)
+        return self._from_ids(ids[np.sort(first)])
+
+    def intersection(self, other):
+        """Create a scoping with the IDs of this scoping which are also in ``other``.
+
+        The IDs keep the order of this scoping. When both scopings are held
+        by the same remote server and are large, the ``scoping::intersect``
+        operator computes the intersection on the server and the order of
+        the IDs is defined by the server.
+
+        Parameters
+        ----------
+        other : Scoping, list of int, numpy.ndarray
+            IDs to intersect with.
+
+        Returns
+        -------
+        scoping : Scoping
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 4, 9])
+        >>> print(scoping.intersection(dpf.Scoping(ids=[9, 2, 1])).ids)
+        [1 9]
+
+        """
+        if self._uses_server_for(other):
+            return self._server_set_operation("scoping::intersect", other, 0)
+        ids = self._ids_array()
+        return self._from_ids(ids[np.isin(ids, _ids_as_array(other))])
+
+    def difference(self, other):
+        """Create a scoping with the IDs of this scoping which are not in ``other``.
+
+        The IDs keep the order of this scoping. When both scopings are held
+        by the same remote server and are large, the ``scoping::intersect``
+        operator computes the difference on the server and the order of
+        the IDs is defined by the server.
+
+        Parameters
+        ----------
+        other : Scoping, list of int, numpy.ndarray
+            IDs to remove.
+
+        Returns
+        -------
+        scoping : Scoping
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 4, 9])
+        >>> print(scoping.difference([9, 2]).ids)
+        [1 4]
+
+        """
+        if self._uses_server_for(other):
+            return self._server_set_operation("scoping::intersect", other, 1)
+        ids = self._ids_array()
+        return self._from_ids(ids[np.isin(ids, _ids_as_array(other), invert=True)])
+
+    def union(self, other):
+        """Create a scoping with the IDs of this scoping followed by the IDs of
+        ``other`` which are not in this scoping.
+
+        When both scopings are held by the same remote server and are large,
+        the ``merge::scoping`` operator computes the union on the server and
+        the order of the IDs is defined by the server.
+
+        Parameters
+        ----------
+        other : Scoping, list of int, numpy.ndarray
+            IDs to add.
+
+        Returns
+        -------
+        scoping : Scoping
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 4, 9])
+        >>> print(scoping.union([9, 2]).ids)
+        [1 4 9 2]
+
+        """
+        if self._uses_server_for(other):
+            return self._server_set_operation("merge::scoping", other, 0)
+        ids = self._ids_array()
+        other_ids = _ids_as_array(other)
+        other_ids = other_ids[np.isin(other_ids, ids, invert=True)]
+        _, first = np.unique(other_ids, return_index=True)
+        return self._from_ids(np.concatenate((ids, other_ids[np.sort(first)])))
+
     @property
     def ids(self):
         """Retrieve a list of IDs in the scoping.
@@ -382,10 +619,126 @@ class Scoping:
         return _LocalScoping(self)
 
 
+class _IdIndex:
+    """Maps entity IDs to their indices with vectorized lookups.
+
+    Compact IDs are looked up in a dense table indexed by ID, other IDs are
+    looked up by binary search in a sorted copy.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray or list
+        IDs of the entities, ordered by index.
+    """
+
+    def __init__(self, ids):
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        self._size = ids.size
+        self._table = None
+        self._sorted_ids = None
+        self._order = None
+        self._min_id = 0
+        if ids.size == 0:
+            self._sorted_ids = ids
+            self._order = ids
+            return
+        self._min_id = int(ids.min())
+        span = int(ids.max()) - self._min_id + 1
+        if span <= 2 * ids.size + 1024:
+            self._table = np.full(span, -1, dtype=np.int64)
+            self._table[ids - self._min_id] = np.arange(ids.size)
+        else:
+            self._order = np.argsort(ids, kind="stable")
+            self._sorted_ids = ids[self._order]
+
+    def __len__(self):
+        return self._size
+
+    def indices(self, ids):
+        """Indices of the given IDs, ``-1`` for IDs which are not mapped.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray or list
+            IDs to look up.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+        """
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        if self._table is not None:
+            positions = ids - self._min_id
+            found = (positions >= 0) & (positions < self._table.size)
+            out = np.full(ids.size, -1, dtype=np.int64)
+            out[found] = self._table[positions[found]]
+            return out
+        positions = np.searchsorted(self._sorted_ids, ids, side="right") - 1
+        found = positions >= 0
+        found[found] = self._sorted_ids[positions[found]] == ids[found]
+        out = np.full(ids.size, -1, dtype=np.int64)
+        out[found] = self._order[positions[found]]
+        return out
+
+    def index(self, id):
+        """Index of the given ID, ``-1`` if it is not mapped."""
+        return int(self.indices([id])[0])
+
+
+class _ScopingMapCache:
+    """Caches the mapping of scopings to the entities of a mesh.
+
+    The mappings are keyed by a hash of the IDs of the scopings, so that all
+    the fields with the same scoping IDs share a mapping. The least recently
+    used mappings are evicted first.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of cached mappings. The default is ``16``.
+    """
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._maps = OrderedDict()
+
+    def map(self, id_index, ids):
+        """Indices of the mapped IDs and mask of the IDs which are mapped.
+
+        Parameters
+        ----------
+        id_index : _IdIndex
+            Mapping between the IDs and indices of the entities of the mesh.
+        ids : numpy.ndarray or list
+            IDs of the scoping.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+        mask : numpy.ndarray
+        """
+        ids = np.ascontiguousarray(ids)
+        key = (ids.dtype.str, ids.size, hashlib.sha256(ids.tobytes()).hexdigest())
+        if key in self._maps:
+            self._maps.move_to_end(key)
+            return self._maps[key]
+        indices = id_index.indices(ids)
+        mask = indices >= 0
+        indices = indices[mask]
+        indices.flags.writeable = False
+        mask.flags.writeable = False
+        self._maps[key] = (indices, mask)
+        if len(self._maps) > self.max_entries:
+            self._maps.popitem(last=False)
+        return indices, mask
+
+
 class _LocalScoping(Scoping):
     """Caches the internal data of the scoping so that it can be modified locally.
 
     A single update request is sent to the server when the local scoping is deleted.
+    The IDs are stored in a growable ``int32`` array and the reverse mapping from
+    IDs to indices is only built when an index is requested.
 
     Parameters
     ----------
@@ -399,12 +752,43 @@ class _LocalScoping(Scoping):
         self.__cache_data__(scoping)
 
     def __cache_data__(self, owner_scoping):
-        self._scoping_ids_copy = owner_scoping._get_ids(False)
         self._location = owner_scoping.location
+        self.__init_ids__(owner_scoping._get_ids(True))
+
+    def __init_ids__(self, ids):
+        self._scoping_ids_copy = np.array(ids, dtype=np.int32).ravel()
+        self._ids_size = self._scoping_ids_copy.size
         self.__init_map__()
 
     def __init_map__(self):
-        self._mapper = dict(zip(self._scoping_ids_copy, np.arange(self._count())))
+        self._id_index = None
+        self._modified_indices = {}
+
+    @property
+    def _ids_view(self):
+        return self._scoping_ids_copy[:self._ids_size]
+
+    def _resize(self, size):
+        """Grow the IDs buffer to hold ``size`` IDs, filling new IDs with ``-1``."""
+        if size > self._scoping_ids_copy.size:
+            buffer = np.empty(max(size, 2 * self._scoping_ids_copy.size), dtype=np.int32)
+            buffer[:self._ids_size] = self._ids_view
+            self._scoping_ids_copy = buffer
+        if size > self._ids_size:
+            self._scoping_ids_copy[self._ids_size:size] = -1
+            self._ids_size = size
+
+    def _ids_array(self):
+        """IDs of the scoping, held locally."""
+        return self._get_ids(True)
+
+    def _get_id_index(self):
+        """Retrieve the mapping from IDs to indices, merging the IDs set since it was built."""
+        if self._id_index is None \
+                or len(self._modified_indices) > max(1024, self._ids_size // 4):
+            self._id_index = _IdIndex(self._ids_view)
+            self._modified_indices = {}
+        return self._id_index
 
     def _count(self):
         """
@@ -413,7 +797,7 @@ class _LocalScoping(Scoping):
         count : int
             Number of scoping IDs.
         """
-        return len(self._scoping_ids_copy)
+        return self._ids_size
 
     def _get_location(self):
         """Retrieve the location of the IDs.
@@ -449,14 +833,9 @@ class _LocalScoping(Scoping):
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
         if isinstance(ids, range):
-            ids = list(ids)
-        elif isinstance(ids, (np.ndarray, np.generic)):
-            ids = ids.tolist()
-
-        self._scoping_ids_copy = ids
-        self.__init_map__()
+            ids = np.arange(ids.start, ids.stop, ids.step)
+        self.__init_ids__(ids)
 
     def _get_ids(self, np_array=False):
         """
@@ -470,9 +849,12 @@ class _LocalScoping(Scoping):
         Print a progress bar.
         """
         if np_array:
-            return np.ndarray(self._scoping_ids_copy, dtype=np.int32)
+            # read-only, the IDs must be set through the scoping to update its index
+            ids = self._ids_view
+            ids.flags.writeable = False
+            return ids
         else:
-            return self._scoping_ids_copy
+            return self._ids_view.tolist()
 
     @_setter
     def set_id(self, index, scopingid):
@@ -485,17 +867,13 @@ class _LocalScoping(Scoping):
         scopingid : int
             ID of the scoping.
         """
-        init_size = self._count()
-        if init_size <= index:
-            for i in range(init_size, index+1):
-                self._scoping_ids_copy.append(-1)
+        self._resize(max(self._ids_size, index + 1))
         self._scoping_ids_copy[index] = scopingid
-        self._mapper[scopingid] = index
+        self._modified_indices[scopingid] = index
 
     @_setter
     def append(self, id):
-        self._scoping_ids_copy.append(id)
-        self._mapper[id] = len(self)-1
+        self.set_id(self._ids_size, id)
 
     def _get_id(self, index):
         """Retrieve the index that the scoping ID is located on.
@@ -510,7 +888,7 @@ class _LocalScoping(Scoping):
         id : int
             ID of the scoping's index.
         """
-        return self._scoping_ids_copy[index]
+        return int(self._ids_view[index])
 
     def _get_index(self, scopingid):
         """Retrieve an ID corresponding to an ID in the scoping.
@@ -525,12 +903,66 @@ class _LocalScoping(Scoping):
         index : int
             Index of the ID.
         """
-        return self._mapper[scopingid]
+        index = self.index_many([scopingid])[0]
+        if index < 0:
+            raise KeyError(scopingid)
+        return int(index)
+
+    def index_many(self, ids):
+        """Retrieve the indices of several IDs, ``-1`` for IDs not in the scoping.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs to retrieve.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+        """
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        indices = self._valid_indices(ids, self._get_id_index().indices(ids))
+        if self._modified_indices:
+            if ids.size < len(self._modified_indices):
+                # few IDs are looked up in the dictionary of the IDs set since the index was built
+                modified = np.array(
+                    [self._modified_indices.get(id, -1) for id in ids.tolist()], dtype=np.int64
+                )
+            else:
+                modified_ids = np.fromiter(self._modified_indices.keys(), dtype=np.int64)
+                modified_indices = np.fromiter(self._modified_indices.values(), dtype=np.int64)
+                positions = _IdIndex(modified_ids).indices(ids)
+                modified = np.full(ids.size, -1, dtype=np.int64)
+                modified[positions >= 0] = modified_indices[positions[positions >= 0]]
+            modified = self._valid_indices(ids, modified)
+            indices = np.where(modified >= 0, modified, indices)
+        return indices
+
+    def _valid_indices(self, ids, indices):
+        """Drop the indices whose ID was overwritten since they were mapped."""
+        found = indices >= 0
+        found[found] = self._ids_view[indices[found]] == ids[found]
+        indices[~found] = -1
+        return indices
+
+    def id_many(self, indices):
+        """Retrieve the IDs at several indices.
+
+        Parameters
+        ----------
+        indices : list of int, numpy.ndarray
+            Indices of the IDs.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+        """
+        return self._ids_view[np.asarray(indices, dtype=np.int64)]
 
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_ids(self._scoping_ids_copy)
+            super()._set_ids(self._ids_view)
             super()._set_location(self._location)
 
     def __enter__(self):
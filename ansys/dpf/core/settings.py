@@ -80,6 +80,83 @@ def set_dynamic_available_results_capability(value) -> None:
     misc.DYNAMIC_RESULTS = value
 
 
+def set_float32_fields(value=True) -> None:
+    """Make fields return and cache their data as ``float32`` arrays by default.
+
+    This halves the memory used by the data of fields on the client side, for
+    example for visualization workflows. Each field can override this setting
+    with :attr:`ansys.dpf.core.field.Field.dtype`. To also halve the size of the
+    data streamed with a gRPC server, see
+    :attr:`ansys.dpf.core.runtime_config.RuntimeClientConfig.stream_floats_instead_of_doubles`.
+
+    Parameters
+    ----------
+    value : bool, optional
+        With ``True``, fields use ``float32`` arrays, with ``False``, they use
+        ``float64`` arrays. The default is ``True``.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_float32_fields(True)
+    >>> dpf.settings.set_float32_fields(False)
+
+    """
+    misc.FLOAT32_FIELDS = value
+
+
+def enable_field_data_cache(path=None, max_size=2**30):
+    """Cache on disk the fields containers evaluated by results.
+
+    Models must be created after this call for the fields containers returned
+    by :func:`ansys.dpf.core.results.Result.eval` to be cached. See
+    :class:`ansys.dpf.core.field_data_cache.FieldDataCache`.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory where the cache is stored. The default is ``None``, in which
+        case the ``ansys_dpf/field_data`` directory of the user's cache directory
+        is used.
+    max_size : int, optional
+        Maximum size of the cache in bytes. The default is 1 GB.
+
+    Returns
+    -------
+    cache : FieldDataCache
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.settings.enable_field_data_cache(max_size=2**28)
+    >>> dpf.settings.disable_field_data_cache()
+
+    """
+    from ansys.dpf.core.field_data_cache import FieldDataCache
+
+    misc.FIELD_DATA_CACHE = FieldDataCache(path, max_size)
+    return misc.FIELD_DATA_CACHE
+
+
+def disable_field_data_cache() -> None:
+    """Stop caching the fields containers evaluated by results on disk.
+
+    The files already written are kept and reused if the cache is enabled
+    again with the same path.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.settings.enable_field_data_cache()
+    >>> dpf.settings.disable_field_data_cache()
+
+    """
+    misc.FIELD_DATA_CACHE = None
+
+
 def _forward_to_gate():
     from ansys.dpf.gate import settings
     from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
@@ -0,0 +1,46 @@
+"""Fixtures of the benchmarks.
+
+The benchmarks use pytest-benchmark and are not collected with the unit tests.
+They run against servers started locally, one per type of server, in place of
+the global server of the unit tests.
+"""
+import pytest
+
+from ansys.dpf import core
+from ansys.dpf.core.check_version import meets_version, get_server_version
+from ansys.dpf.core.server_factory import ServerConfig, CommunicationProtocols
+
+BENCHMARK_CONFIGS = [
+    ServerConfig(protocol=CommunicationProtocols.gRPC, legacy=True),
+    ServerConfig(protocol=CommunicationProtocols.gRPC, legacy=False),
+    ServerConfig(protocol=CommunicationProtocols.InProcess, legacy=False),
+]
+BENCHMARK_CONFIG_IDS = ["ansys-grpc-dpf", "gRPC CLayer", "in Process CLayer"]
+
+
+@pytest.fixture(scope="session", params=BENCHMARK_CONFIGS, ids=BENCHMARK_CONFIG_IDS)
+def benchmark_config(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def benchmark_server(benchmark_config):
+    """Local server standing in for the server of a user's session.
+
+    The CLayer servers are only benchmarked with servers of version 4.0 or
+    above, read from the started server.
+    """
+    server = core.start_local_server(config=benchmark_config, as_global=False)
+    if not benchmark_config.legacy and not meets_version(get_server_version(server), "4.0"):
+        server.shutdown()
+        pytest.skip("CLayer servers require a server of version 4.0 or above.")
+    yield server
+    server.shutdown()
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Add the number of entities processed per second to the JSON report."""
+    for bench in output_json["benchmarks"]:
+        n_entities = bench["extra_info"].get("n_entities")
+        if n_entities and bench["stats"]["mean"]:
+            bench["extra_info"]["throughput"] = n_entities / bench["stats"]["mean"]
@@ -0,0 +1,147 @@
+"""Benchmarks of the client-side APIs called in loops on fields, scopings and meshes.
+
+The number of entities processed by a call is stored in the ``n_entities``
+extra information of the benchmarks, from which the throughput of the report is
+computed.
+"""
+import numpy as np
+import pytest
+
+from ansys.dpf import core
+from ansys.dpf.core import examples, fields_factory, misc
+from ansys.dpf.core.collection import IntCollection
+
+N_ENTITIES = [1000, 100000]
+
+
+@pytest.fixture(scope="module", params=N_ENTITIES)
+def n_entities(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def vector_field(benchmark_server, n_entities):
+    field = fields_factory.create_3d_vector_field(n_entities, server=benchmark_server)
+    field.scoping.ids = np.arange(1, n_entities + 1)
+    field.data = np.random.rand(n_entities, 3)
+    return field
+
+
+@pytest.fixture(scope="module", params=[examples.static_rst, examples.multishells_rst],
+                ids=["static", "multishells"])
+def mesh(benchmark_server, request):
+    return core.Model(request.param, server=benchmark_server).metadata.meshed_region
+
+
+def test_field_data(benchmark, vector_field, n_entities):
+    benchmark.extra_info["n_entities"] = n_entities
+    data = benchmark(lambda: vector_field.data)
+    assert data.shape == (n_entities, 3)
+
+
+def test_field_append(benchmark, benchmark_server):
+    n_entities = 1000
+    benchmark.extra_info["n_entities"] = n_entities
+    entity_data = [1.0, 2.0, 3.0]
+
+    def setup():
+        return (fields_factory.create_3d_vector_field(n_entities, server=benchmark_server),), {}
+
+    def append(field):
+        for i in range(1, n_entities + 1):
+            field.append(entity_data, i)
+
+    benchmark.pedantic(append, setup=setup, rounds=5, iterations=1)
+
+
+def test_scoping_get_ids(benchmark, vector_field, n_entities):
+    benchmark.extra_info["n_entities"] = n_entities
+    ids = benchmark(lambda: vector_field.scoping.ids)
+    assert len(ids) == n_entities
+
+
+def test_scoping_set_ids(benchmark, benchmark_server, n_entities):
+    benchmark.extra_info["n_entities"] = n_entities
+    scoping = core.Scoping(server=benchmark_server)
+    ids = np.arange(1, n_entities + 1)
+
+    def set_ids():
+        scoping.ids = ids
+
+    benchmark(set_ids)
+
+
+def test_local_field_round_trip(benchmark, vector_field, n_entities):
+    benchmark.extra_info["n_entities"] = n_entities
+
+    def round_trip():
+        with vector_field.as_local_field() as local_field:
+            local_field.data = local_field.data * 1.0
+
+    benchmark.pedantic(round_trip, rounds=5, iterations=1)
+
+
+def test_nodes_iter(benchmark, mesh):
+    benchmark.extra_info["n_entities"] = mesh.nodes.n_nodes
+    n_nodes = benchmark.pedantic(lambda: sum(1 for _ in mesh.nodes), rounds=3, iterations=1)
+    assert n_nodes == mesh.nodes.n_nodes
+
+
+def test_elements_map_scoping(benchmark, mesh):
+    ids = np.flip(mesh.elements.scoping.ids)
+    benchmark.extra_info["n_entities"] = len(ids)
+    scoping = core.Scoping(ids=ids, location=core.locations.elemental, server=mesh._server)
+    indices, mask = benchmark(mesh.elements.map_scoping, scoping)
+    assert mask.all()
+
+
+@pytest.mark.skipif(not misc.module_exists("pyvista"), reason="Requires pyvista")
+def test_meshed_region_grid(benchmark, mesh):
+    benchmark.extra_info["n_entities"] = mesh.elements.n_elements
+
+    def setup():
+        # the grid and its cells are cached by the mesh once built
+        mesh._clear_grid_cache()
+
+    grid = benchmark.pedantic(lambda: mesh.grid, setup=setup, rounds=5, iterations=1)
+    assert grid.n_cells == mesh.elements.n_elements
+
+
+@pytest.mark.skipif(not misc.module_exists("pyvista"), reason="Requires pyvista")
+def test_meshed_region_grid_cached_cells(benchmark, mesh):
+    benchmark.extra_info["n_entities"] = mesh.elements.n_elements
+    mesh.grid
+
+    def setup():
+        # only the cells of the grid stay cached
+        mesh._clear_grid_cache(topology=False)
+
+    grid = benchmark.pedantic(lambda: mesh.grid, setup=setup, rounds=5, iterations=1)
+    assert grid.n_cells == mesh.elements.n_elements
+
+
+@pytest.mark.parametrize("n_fields", [10, 100])
+def test_collection_getitem(benchmark, benchmark_server, n_fields):
+    benchmark.extra_info["n_entities"] = n_fields
+    fc = core.FieldsContainer(server=benchmark_server)
+    fc.labels = ["time"]
+    for i in range(1, n_fields + 1):
+        fc.add_field({"time": i}, core.Field(nentities=10, server=benchmark_server))
+
+    fields = benchmark(lambda: [fc[i] for i in range(n_fields)])
+    assert len(fields) == n_fields
+
+
+def test_integral_collection_round_trip(benchmark, benchmark_server, n_entities):
+    benchmark.extra_info["n_entities"] = n_entities
+    values = np.arange(n_entities, dtype=np.int32)
+    try:
+        IntCollection([0], server=benchmark_server)
+    except NotImplementedError:
+        pytest.skip("Collections of integers are not supported by this server.")
+
+    def round_trip():
+        return IntCollection(values, server=benchmark_server).get_integral_entries()
+
+    entries = benchmark(round_trip)
+    assert len(entries) == n_entities
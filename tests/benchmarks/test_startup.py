@@ -0,0 +1,65 @@
+"""Benchmarks of the costs paid before the first result is available."""
+import subprocess
+import sys
+
+from ansys.dpf import core
+from ansys.dpf.core import examples
+
+
+def _run_python(code):
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_python_startup(benchmark):
+    # baseline to subtract from the import benchmarks
+    benchmark.pedantic(_run_python, args=("pass",), rounds=5, iterations=1)
+
+
+def test_import_dpf_core(benchmark):
+    benchmark.pedantic(
+        _run_python, args=("import ansys.dpf.core",), rounds=5, iterations=1
+    )
+
+
+def test_import_dpf_core_operator(benchmark):
+    benchmark.pedantic(
+        _run_python,
+        args=("from ansys.dpf import core; core.operators.result.displacement",),
+        rounds=5,
+        iterations=1,
+    )
+
+
+def test_start_local_server(benchmark, benchmark_config, benchmark_server):
+    # benchmark_server skips the configurations not supported by the installed server
+    servers = []
+
+    def setup():
+        while servers:
+            servers.pop().shutdown()
+
+    def start():
+        servers.append(core.start_local_server(config=benchmark_config, as_global=False))
+
+    benchmark.pedantic(start, setup=setup, rounds=3, iterations=1)
+    setup()
+
+
+def test_model_construction(benchmark, benchmark_server):
+    # streams the result file's metadata in Metadata._cache_streams_provider
+    model = benchmark.pedantic(
+        core.Model, args=(examples.static_rst,), kwargs={"server": benchmark_server},
+        rounds=5, iterations=1,
+    )
+    assert model.metadata.result_info is not None
+
+
+def test_first_displacement_eval(benchmark, benchmark_server):
+    def setup():
+        return (core.Model(examples.static_rst, server=benchmark_server),), {}
+
+    def first_eval(model):
+        return model.results.displacement().eval()
+
+    fc = benchmark.pedantic(first_eval, setup=setup, rounds=5, iterations=1)
+    assert len(fc) == 1
@@ -1,3 +1,6 @@
+import numpy as np
+
+from ansys.dpf.core.cache import class_handling_cache
 # from ansys.dpf import core as dpf
 # from ansys.dpf.core.check_version import server_meet_version
 
@@ -60,3 +63,70 @@
 #         assert len(res_info._cache.cached) == 2
 #     else:
 #         assert len(res_info._cache.cached) == 1
+
+
+def _cached_class(**kwargs):
+    @class_handling_cache(**kwargs)
+    class Cached:
+        def __init__(self):
+            self.calls = 0
+            self.unit = "m"
+
+        def get_unit(self):
+            self.calls += 1
+            return self.unit
+
+        def get_values(self, ids):
+            self.calls += 1
+            return np.asarray(ids, dtype=float) * 2.
+
+        def set_unit(self, unit):
+            self.unit = unit
+
+        _to_cache = {get_unit: [set_unit], get_values: [set_unit]}
+
+    return Cached()
+
+
+def test_unhashable_args_and_stats_cache():
+    obj = _cached_class()
+    assert np.allclose(obj.get_values([1, 2]), [2., 4.])
+    assert np.allclose(obj.get_values([1, 2]), [2., 4.])
+    assert np.allclose(obj.get_values(ids=np.array([1, 2])), [2., 4.])
+    assert obj.calls == 2
+    info = obj._cache.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.entries == 2
+
+
+def test_setter_invalidates_all_getters_cache():
+    obj = _cached_class()
+    obj.get_unit()
+    obj.get_values([1])
+    obj.get_values([2])
+    assert obj._cache.cache_info().entries == 3
+    obj.set_unit("cm")
+    assert obj._cache.cache_info().entries == 0
+    assert obj.get_unit() == "cm"
+
+
+def test_lru_eviction_cache():
+    obj = _cached_class(max_entries=2)
+    obj.get_values([1])
+    obj.get_values([2])
+    obj.get_values([1])
+    obj.get_values([3])
+    assert obj._cache.cache_info().entries == 2
+    calls = obj.calls
+    obj.get_values([1])
+    assert obj.calls == calls
+    obj.get_values([2])
+    assert obj.calls == calls + 1
+
+    obj = _cached_class(max_bytes=2000)
+    for i in range(10):
+        obj.get_values(list(range(i * 10, i * 10 + 50)))
+    info = obj._cache.cache_info()
+    assert 0 < info.bytes <= 2000
+    assert info.entries < 10
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from ansys.dpf import core as dpf
@@ -806,3 +807,24 @@ def test_polyhedron():
         False,
         None,
     )
+
+
+def test_vectorized_element_types_lookups():
+    types = np.array([t.value for t in element_types] + [99], dtype=np.int32)
+    shapes = element_types.shapes(types)
+    n_nodes = element_types.n_nodes(types)
+    n_corner_nodes = element_types.n_corner_nodes(types)
+    is_quadratic = element_types.is_quadratic(types)
+    for i, element_type in enumerate(types[:-1]):
+        descriptor = element_types.descriptor(element_types(element_type))
+        if element_type < 0:
+            descriptor = element_types.descriptor(element_types.Unknown)
+        assert shapes[i] == descriptor.shape
+        assert n_nodes[i] == (descriptor.n_nodes if descriptor.n_nodes is not None else -1)
+        assert n_corner_nodes[i] == (
+            descriptor.n_corner_nodes if descriptor.n_corner_nodes is not None else -1
+        )
+        assert is_quadratic[i] == bool(descriptor.is_quadratic)
+    assert shapes[-1] == "unknown_shape"
+    assert n_nodes[-1] == -1
+    assert element_types.shape_codes([11, 17, 18, 9]).tolist() == [1, 0, 2, 3]
@@ -40,6 +40,32 @@ def test_create_field_from_helper_vector(server_type):
     assert np.allclose(field_a.data, data)
 
 
+def test_float32_field(server_type):
+    data = np.random.random((10, 3)).astype(np.float32)
+    field = dpf.core.field_from_array(data, server=server_type)
+    assert field.dtype is np.float32
+    assert field.data.dtype == np.float32
+    assert field.get_entity_data(2).dtype == np.float32
+    assert np.allclose(field.data, data)
+    with field.as_local_field() as f:
+        assert f.data.dtype == np.float32
+        f.append([1., 2., 3.], 11)
+    assert np.allclose(field.get_entity_data(10), [1., 2., 3.])
+    # float32 data is a copy, editing it in place must not be silently lost
+    with pytest.raises(ValueError):
+        field.data[0] = [4., 5., 6.]
+    with field.data_view() as view:
+        view[0] = [4., 5., 6.]
+    assert np.allclose(field.get_entity_data(0), [4., 5., 6.])
+    field.dtype = np.float64
+    assert field.data.dtype == np.float64
+    dpf.core.settings.set_float32_fields(True)
+    try:
+        assert dpf.core.Field(server=server_type).dtype is np.float32
+    finally:
+        dpf.core.settings.set_float32_fields(False)
+
+
 def test_set_get_data_from_list_of_list(server_type):
     data = [[1., 2., 3.], [4., 5., 6.]]
     field = dpf.core.Field(server=server_type)
@@ -54,6 +80,118 @@ def test_append_scalar_data(server_type):
     assert np.allclose(field.data, list(range(0, 10)))
 
 
+def test_append_many_field(server_type):
+    field = dpf.core.fields_factory.create_3d_vector_field(2, server=server_type)
+    field.append([1.0, 2.0, 3.0], 1)
+    field.append_many(np.array([2, 3]), np.array([[4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]))
+    assert np.allclose(field.data, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+    assert np.allclose(field.scoping.ids, [1, 2, 3])
+
+    field = dpf.core.fields_factory.create_3d_vector_field(
+        2, location=dpf.core.locations.elemental_nodal, server=server_type
+    )
+    field.append_many([1, 2], np.arange(9.0), data_pointer=[0, 6])
+    assert np.allclose(field._data_pointer, [0, 6])
+    assert np.allclose(field.get_entity_data(0), [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    assert np.allclose(field.get_entity_data(1), [[6.0, 7.0, 8.0]])
+
+
+def test_append_many_field_keeps_existing_data(server_type, monkeypatch):
+    field = dpf.core.fields_factory.create_3d_vector_field(4, server=server_type)
+    field.append_many([1, 2], np.ones((2, 3)))
+
+    def fail(self, *args, **kwargs):
+        raise AssertionError("The existing data of the field was transferred.")
+
+    monkeypatch.setattr(dpf.core.Field, "_get_data", fail)
+    monkeypatch.setattr(dpf.core.Field, "_set_data", fail)
+    field.append_many([3, 4], 2.0 * np.ones((2, 3)))
+    monkeypatch.undo()
+    assert np.allclose(field.data, [[1.0] * 3, [1.0] * 3, [2.0] * 3, [2.0] * 3])
+    assert np.allclose(field.scoping.ids, [1, 2, 3, 4])
+
+
+def test_local_field_append_many():
+    num_entities = 100
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(num_entities)
+    data = np.random.rand(num_entities, 3)
+    with field_to_local.as_local_field() as f:
+        f.append_many(np.arange(1, num_entities + 1), data)
+    assert np.allclose(field_to_local.data, data)
+    assert np.allclose(field_to_local.scoping.ids, range(1, num_entities + 1))
+
+
+def test_local_field_data_copies():
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(2)
+    with field_to_local.as_local_field() as f:
+        f.append([1.0, 2.0, 3.0], 1)
+        data = f.data
+        entity_data = f.get_entity_data(0)
+        data[0] = [0.0, 0.0, 0.0]
+        entity_data[0] = [0.0, 0.0, 0.0]
+        f.append([4.0, 5.0, 6.0], 2)
+        assert np.allclose(f.get_entity_data(0), [[1.0, 2.0, 3.0]])
+        with f.data_view() as view:
+            view[1] = [7.0, 8.0, 9.0]
+    assert np.allclose(field_to_local.data, [[1.0, 2.0, 3.0], [7.0, 8.0, 9.0]])
+
+
+def test_data_view_field(server_type):
+    field = dpf.core.fields_factory.create_3d_vector_field(200, server=server_type)
+    field.scoping.ids = range(1, 201)
+    field.data = np.arange(600, dtype=float).reshape(200, 3)
+    with field.data_view() as data:
+        data[3] = [-1., -2., -3.]
+        data[150, 2] = 0.5
+    expected = np.arange(600, dtype=float).reshape(200, 3)
+    expected[3] = [-1., -2., -3.]
+    expected[150, 2] = 0.5
+    assert np.allclose(field.data, expected)
+    with field.data_view() as data:
+        data *= 2.
+    assert np.allclose(field.data, expected * 2.)
+
+
+def test_iter_write_chunks_field(server_type):
+    field = dpf.core.fields_factory.create_3d_vector_field(25, server=server_type)
+    field.scoping.ids = range(1, 26)
+    field.data = np.arange(75, dtype=float).reshape(25, 3)
+    chunks = list(field.iter_chunks(10))
+    assert [len(ids) for ids, data in chunks] == [10, 10, 5]
+    assert np.allclose(np.concatenate([ids for ids, data in chunks]), range(1, 26))
+    assert np.allclose(np.concatenate([data for ids, data in chunks]), field.data)
+
+    copy = dpf.core.fields_factory.create_3d_vector_field(25, server=server_type)
+    copy.write_chunks((ids, 2. * data) for ids, data in field.iter_chunks(10))
+    assert np.allclose(copy.scoping.ids, range(1, 26))
+    assert np.allclose(copy.data, 2. * field.data)
+
+    field = dpf.core.fields_factory.create_3d_vector_field(
+        2, location=dpf.core.locations.elemental_nodal, server=server_type
+    )
+    field.write_chunks([([1, 2], np.arange(9.0), [0, 6])])
+    assert np.allclose(field.get_entity_data(0), [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    assert np.allclose(field.get_entity_data(1), [[6.0, 7.0, 8.0]])
+
+
+def test_to_mesh_array_field(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    mesh = model.metadata.meshed_region
+    scoping = dpf.core.Scoping(ids=list(range(1, 21)), location=dpf.core.locations.nodal)
+    fc = model.results.displacement([1, 2], scoping).outputs.fields_container()
+    array = fc[0].to_mesh_array(mesh)
+    n_nodes = mesh.nodes.n_nodes
+    assert array.shape == (n_nodes, 3)
+    ind, mask = mesh.nodes.map_scoping(fc[0].scoping)
+    assert np.allclose(array[ind], fc[0].data[mask])
+    assert np.isnan(array).sum() == 3 * (n_nodes - 20)
+
+    arrays = fc.to_mesh_array(mesh, fill=0.0)
+    assert arrays.shape == (2, n_nodes, 3)
+    assert np.allclose(arrays[0], np.nan_to_num(array))
+    assert len(mesh.nodes._scoping_maps._maps) == 1
+
+
 @pytest.mark.skipif(not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_3_0,
                     reason='Connecting data from different servers is '
                            'supported starting server version 3.0')
@@ -657,6 +795,24 @@ def test_local_get_entity_data():
         assert hasattr(f, "_is_set") is False
 
 
+def test_local_field_numpy_storage():
+    num_entities = 100
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, location=dpf.core.locations.elemental_nodal
+    )
+    with field_to_local.as_local_field() as f:
+        for i in range(1, num_entities + 1):
+            f.append(np.array([[0.1 * i, 0.2 * i, 0.3 * i]] * (1 + i % 2)), i)
+        assert isinstance(f._data_copy, np.ndarray)
+        assert f._data_copy.dtype == np.float64
+        assert f._data_copy.size >= f.size
+        assert f.data.shape == (f.size // 3, 3)
+        assert np.shares_memory(f.data, f._data_copy)
+        assert np.allclose(f.get_entity_data(1), [[0.2, 0.4, 0.6]] * 2)
+    assert len(field_to_local._data_pointer) == num_entities
+    assert np.allclose(field_to_local.get_entity_data(1), [[0.2, 0.4, 0.6]] * 2)
+
+
 def test_local_elemental_nodal_get_entity_data():
     num_entities = 100
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(
@@ -131,6 +131,71 @@ def test_set_get_field_fields_container_new_label_default_value(server_type):
         assert fc.get_label_space(i) == {"time": i + 1, "complex": 0, "shape": 3}
 
 
+def test_label_space_table_fields_container(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex"]
+    for i in range(0, 10):
+        fc.add_field({"time": i + 1, "complex": 0}, Field(nentities=1, server=server_type))
+        assert len(fc.get_fields({"time": i + 1})) == 1
+        assert fc.get_label_space(i) == {"time": i + 1, "complex": 0}
+    field = Field(nentities=1, server=server_type)
+    field.append([1.0, 2.0, 3.0], 1)
+    fc.add_field({"time": 3, "complex": 0}, field)
+    assert len(fc) == 10
+    assert np.allclose(fc.get_field({"time": 3}).data, field.data)
+    fc.add_field({"time": 3, "complex": 1}, field)
+    assert len(fc.get_fields({"time": 3})) == 2
+    assert len(fc.get_fields({"complex": 1})) == 1
+    fc2 = FieldsContainer(fields_container=fc, server=server_type)
+    assert fc2.get_label_space(10) == {"time": 3, "complex": 1}
+
+
+def test_label_space_table_invalidated_fields_container(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time"]
+    for i in range(0, 3):
+        fc.add_field({"time": i + 1}, Field(nentities=1, server=server_type))
+    assert fc.get_label_space(2) == {"time": 3}
+    fc.add_label("complex", 0)
+    assert fc.get_label_space(2) == {"time": 3, "complex": 0}
+    field = Field(nentities=2, server=server_type)
+    field.append([1.0, 2.0, 3.0], 1)
+    field.append([4.0, 5.0, 6.0], 2)
+    fc.add_field({"time": 3, "complex": 0}, field)
+    assert len(fc) == 3
+    assert fc.get_field({"time": 3}).scoping.size == 2
+    fc.add_field({"time": 1, "complex": 1}, Field(nentities=1, server=server_type))
+    assert fc.get_label_space(3) == {"time": 1, "complex": 1}
+    assert len(fc.get_fields({"time": 1})) == 2
+    other = FieldsContainer(fields_container=fc, server=server_type)
+    assert len(other.get_fields({"time": 2})) == 1
+    fc.add_field({"time": 2, "complex": 1}, Field(nentities=1, server=server_type))
+    assert len(other.get_fields({"time": 2})) == 2
+    assert other.get_label_space(4) == {"time": 2, "complex": 1}
+
+
+def test_lazy_view_fields_container(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time"]
+    for i in range(0, 5):
+        field = Field(nentities=1, server=server_type)
+        field.append([float(i), 0.0, 0.0], 1)
+        fc.add_field({"time": i + 1}, field)
+    view = fc.lazy_view(cache_size=2)
+    assert len(view) == 5
+    handles = list(view)
+    assert [h.label_space for h in handles] == [{"time": i + 1} for i in range(5)]
+    assert len(view._cache) == 0
+    for i, handle in enumerate(handles):
+        assert np.allclose(handle.data, [[float(i), 0.0, 0.0]])
+        assert handle.location == dpf.locations.nodal
+    assert len(view._cache) == 2
+    handle = view.get_fields({"time": 5})[0]
+    assert handle.index == 4
+    assert handle.data is handles[4].data
+    assert np.allclose(handle.scoping.ids, [1])
+
+
 def test_get_item_field_fields_container(server_type):
     fc = FieldsContainer(server=server_type)
     fc.labels = ["time", "complex"]
@@ -292,6 +357,38 @@ def test_get_field_by_time_id(server_type):
     assert np.allclose(f1.data, field_to_check.data)
 
 
+def test_to_array_fields_container(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex"]
+    f1 = Field(3, server=server_type)
+    f1.append_many([1, 2, 3], [[1.0, 1.1, 1.2], [2.0, 2.1, 2.2], [3.0, 3.1, 3.2]])
+    fc.add_field({"time": 1, "complex": 0}, f1)
+    f2 = Field(2, server=server_type)
+    f2.append_many([3, 5], [[30.0, 30.1, 30.2], [50.0, 50.1, 50.2]])
+    fc.add_field({"time": 2, "complex": 0}, f2)
+    fc.add_field({"time": 1, "complex": 1}, f2)
+
+    arr = fc.to_array(labels={"complex": 0})
+    assert arr.shape == (2, 4, 3)
+    assert np.allclose(arr[0, :3], f1.data)
+    assert np.all(np.isnan(arr[0, 3]))
+    assert np.all(np.isnan(arr[1, :2]))
+    assert np.allclose(arr[1, 2:], f2.data)
+
+    scop = dpf.Scoping(ids=[5, 1, 9], server=server_type)
+    arr = fc.to_array(align_on=scop)
+    assert arr.shape == (3, 3, 3)
+    assert np.allclose(arr[:, 0, 0], [np.nan, 50.0, 50.0], equal_nan=True)
+    assert np.allclose(arr[:, 1, 0], [1.0, np.nan, np.nan], equal_nan=True)
+    assert np.all(np.isnan(arr[:, 2]))
+
+    # a field without entities keeps its number of components
+    fc.add_field({"time": 3, "complex": 0}, Field(0, server=server_type))
+    arr = fc.to_array(labels={"complex": 0})
+    assert arr.shape == (3, 4, 3)
+    assert np.all(np.isnan(arr[2]))
+
+
 def test_collection_update_support():
     # set time_freq_support
     fc = FieldsContainer()
@@ -320,6 +417,46 @@ def test_deep_copy_over_time_fields_container(velocity_acceleration):
     assert tf.time_frequencies.scoping.ids == copy.time_frequencies.scoping.ids
 
 
+def test_deep_copy_shared_supports_fields_container(velocity_acceleration):
+    model = dpf.Model(velocity_acceleration)
+    stress = model.results.stress(time_scoping=[1, 2, 3])
+    fc = stress.outputs.fields_container()
+    copy = fc.deep_copy(max_workers=4)
+
+    idenfc = dpf.operators.logic.identical_fc(fc, copy)
+    assert idenfc.outputs.boolean()
+    assert copy.get_label_space(2) == fc.get_label_space(2)
+    mesh = fc[0].meshed_region
+    n_sets = fc[0].time_freq_support.n_sets
+    for f in copy:
+        assert f.meshed_region.nodes.n_nodes == mesh.nodes.n_nodes
+        assert f.time_freq_support.n_sets == n_sets
+    # the mesh and the time frequency support shared by the fields are copied once
+    assert fc._holds_same_data(fc[0].meshed_region, fc[2].meshed_region)
+    for f in copy:
+        assert copy._holds_same_data(f.meshed_region, copy[0].meshed_region)
+        assert copy._holds_same_data(f.time_freq_support, copy[0].time_freq_support)
+    assert not copy._holds_same_data(copy[0].meshed_region, mesh)
+
+    sequential = fc.deep_copy(max_workers=1)
+    for f, f_copy in zip(fc, sequential):
+        assert np.allclose(f.data, f_copy.data)
+
+
+def test_deep_copy_legacy_grpc_fields_container(server_type_legacy_grpc):
+    fc = FieldsContainer(server=server_type_legacy_grpc)
+    fc.labels = ["time"]
+    for i in range(1, 4):
+        field = Field(nentities=1, server=server_type_legacy_grpc)
+        field.append([float(i), 0.0, 0.0], 1)
+        fc.add_field({"time": i}, field)
+    copy = fc.deep_copy(server=server_type_legacy_grpc, max_workers=4)
+    for i, (f, f_copy) in enumerate(zip(fc, copy)):
+        assert copy.get_label_space(i) == {"time": i + 1}
+        assert np.allclose(f.data, f_copy.data)
+    # legacy gRPC servers cannot tell whether two references hold the same data
+    assert not fc._holds_same_data(fc[0], fc[0])
+
 @pytest.mark.skipif(not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_3_0,
                     reason='Bug in server version lower than 3.0')
 def test_light_copy(server_type):
@@ -43,6 +43,59 @@ def test_vtk_grid_from_model(simple_bar_model):
     assert all(grid.celltypes == vtk.VTK_HEXAHEDRON)
 
 
+def test_vtk_grid_topology_cache(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    grid = mesh.grid
+    topology = mesh._vtk_topology[True]
+    coordinates = mesh.nodes.coordinates_field
+    deformed = mesh._as_vtk(mesh.deform_by(coordinates, 2.0))
+    assert mesh._vtk_topology[True] is topology
+    assert np.allclose(deformed.points, 3.0 * grid.points)
+    assert np.allclose(deformed.celltypes, grid.celltypes)
+    assert deformed.n_cells == grid.n_cells
+
+    mesh.nodes._clear_cache()
+    assert mesh._full_grid is None
+    assert mesh._vtk_topology[True] is topology
+    mesh.elements._clear_cache()
+    assert not mesh._vtk_topology
+
+
+def test_meshed_region_skin_cache(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    skin = mesh.skin
+    assert mesh.skin is skin
+    assert 0 < skin.elements.n_elements < mesh.elements.n_elements
+    _, node_indices, element_indices = mesh._get_skin()
+    assert np.array_equal(mesh.nodes.scoping.ids[node_indices], skin.nodes.scoping.ids)
+    assert len(element_indices) == skin.elements.n_elements
+    assert np.all((element_indices >= 0) & (element_indices < mesh.elements.n_elements))
+
+    mesh.nodes._clear_cache()
+    assert mesh.skin is not skin
+
+
+def test_meshed_region_skin_element_ids(server_type):
+    # element IDs which are not the element indices plus one
+    mesh = dpf.core.MeshedRegion(num_nodes=5, num_elements=2, server=server_type)
+    for i, coordinates in enumerate(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [1.0, 1.0, 1.0]]
+    ):
+        mesh.nodes.add_node(11 + i, coordinates)
+    mesh.elements.add_solid_element(20, [0, 1, 2, 3])
+    mesh.elements.add_solid_element(1, [1, 2, 3, 4])
+    skin = mesh.skin
+    _, _, element_indices = mesh._get_skin()
+    assert np.array_equal(np.bincount(element_indices), [3, 3])
+    for index, element_index in enumerate(element_indices):
+        skin_node_ids = skin.elements.element_by_index(index).node_ids
+        element_node_ids = mesh.elements.element_by_index(element_index).node_ids
+        assert set(skin_node_ids) <= set(element_node_ids)
+    skin, node_indices, _ = mesh._get_skin()
+    with pytest.raises(dpf.core.errors.DpfValueError):
+        mesh._skin_element_indices(skin, node_indices, 1 - element_indices)
+
+
 def test_meshed_region_available_property_fields(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     properties = ["connectivity", "elprops", "eltype", "apdl_element_type", "mat"]
@@ -93,6 +146,22 @@ def test_get_element_meshedregion(simple_bar_model):
     assert node.coordinates == [0.1, 1.6, 0.1]
 
 
+def test_elements_arrays_meshedregion(allkindofcomplexity, server_type):
+    mesh = dpf.core.Model(allkindofcomplexity, server=server_type).metadata.meshed_region
+    elements = mesh.elements
+    assert elements is mesh.elements
+    assert np.allclose(elements.ids, elements.scoping.ids)
+    assert np.allclose(elements.types, elements.element_types_field.data)
+    connectivities = elements.connectivities_field
+    for index in [0, len(elements) // 2, len(elements) - 1]:
+        el = elements.element_by_index(index)
+        assert el.id == elements.ids[index]
+        assert el.type == elements.types[index]
+        assert np.allclose(el.connectivity, connectivities.get_entity_data(index))
+        assert el.node_ids == [mesh.nodes.ids[i] for i in el.connectivity]
+        assert elements.element_by_id(el.id).index == index
+
+
 def test_get_coordinates_field_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     nodescoping = mesh.nodes.scoping
@@ -231,6 +300,21 @@ def test_get_nodes_meshedregion(simple_bar_model):
     assert node.coordinates != None
 
 
+def test_nodes_arrays_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    nodes = mesh.nodes
+    assert nodes is mesh.nodes
+    assert np.allclose(nodes.ids, mesh.nodes.scoping.ids)
+    assert nodes.coordinates.shape == (nodes.n_nodes, 3)
+    assert np.allclose(nodes.coordinates, nodes.coordinates_field.data)
+    for i, node in enumerate(nodes):
+        assert node.index == i
+        assert node.id == nodes.ids[i]
+    node = nodes.node_by_id(int(nodes.ids[5]))
+    assert node.index == 5
+    assert np.allclose(node.coordinates, nodes.coordinates[5])
+
+
 def test_get_elements_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     el = mesh.elements.element_by_id(1)
@@ -312,6 +396,19 @@ def test_id_indeces_mapping_on_elements_2(allkindofcomplexity, server_type):
     assert mapping[4520] == 2011
 
 
+def test_map_scoping_nodes_elements(allkindofcomplexity, server_type):
+    mesh = dpf.core.Model(allkindofcomplexity, server=server_type).metadata.meshed_region
+    for entities, location in [(mesh.nodes, dpf.core.locations.nodal),
+                               (mesh.elements, dpf.core.locations.elemental)]:
+        ids = list(entities.scoping.ids[::-3]) + [0, int(max(entities.scoping.ids)) + 1]
+        scop = dpf.core.Scoping(location=location, server=server_type)
+        scop.ids = ids
+        ind, mask = entities.map_scoping(scop)
+        assert mask.tolist() == [True] * (len(ids) - 2) + [False, False]
+        assert np.allclose(entities.scoping.ids[ind], ids[:-2])
+        assert np.allclose(ind, [entities.mapping_id_to_index[i] for i in ids[:-2]])
+
+
 def test_named_selection_mesh(allkindofcomplexity, server_type):
     model = dpf.core.Model(allkindofcomplexity, server=server_type)
     mesh = model.metadata.meshed_region
@@ -625,3 +722,24 @@ def test_semi_parabolic_meshed_region(server_type, allkindofcomplexity):
     has_semi_par = False
     el = mesh.elements[0]
     assert dpf.core.element_types.descriptor(el.type).n_nodes != len(el.connectivity)
+
+
+@pytest.mark.skipif(
+    not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_3_0,
+    reason="Requires server version higher than 3.0",
+)
+def test_mesh_deep_copy_properties_and_named_selections(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    mesh = model.metadata.meshed_region
+    copy = mesh.deep_copy()
+    assert np.array_equal(copy.nodes.scoping.ids, mesh.nodes.scoping.ids)
+    assert np.array_equal(copy.elements.scoping.ids, mesh.elements.scoping.ids)
+    assert copy.available_named_selections == mesh.available_named_selections
+    for name in mesh.available_named_selections:
+        assert np.allclose(copy.named_selection(name).ids, mesh.named_selection(name).ids)
+    for name in ["mat", "connectivity"]:
+        assert np.allclose(copy.property_field(name).data, mesh.property_field(name).data)
+    assert np.allclose(
+        copy.elements.connectivities_field._data_pointer,
+        mesh.elements.connectivities_field._data_pointer,
+    )
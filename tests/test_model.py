@@ -1,4 +1,5 @@
 import functools
+import os
 
 import numpy as np
 import pytest
@@ -191,6 +192,56 @@ def test_result_time_scoping(plate_msup):
     )
 
 
+def test_result_field_data_cache(plate_msup, tmpdir):
+    cache = dpf.core.settings.enable_field_data_cache(str(tmpdir), max_size=2**30)
+    try:
+        model = dpf.core.Model(plate_msup)
+        fc = model.results.stress.on_time_scoping([1, 2, 3]).eval()
+        assert cache.hits == 0
+        assert cache.size > 0
+        fc_cached = model.results.stress.on_time_scoping([1, 2, 3]).eval()
+        assert cache.hits == 1
+        assert len(fc_cached) == 3
+        for field, field_cached in zip(fc, fc_cached):
+            assert np.allclose(field.data, field_cached.data)
+            assert np.allclose(field.scoping.ids, field_cached.scoping.ids)
+            assert field_cached.meshed_region.nodes.n_nodes == field.meshed_region.nodes.n_nodes
+        assert np.allclose(fc.time_freq_support.time_frequencies.data,
+                           fc_cached.time_freq_support.time_frequencies.data)
+        model.results.stress.on_time_scoping([1, 2]).eval()
+        assert cache.hits == 1
+        # outputs requested directly from operators keep their supports and are not cached
+        op = model.results.stress.on_time_scoping([1, 2, 3])()
+        fc_op = op.outputs.fields_container()
+        assert cache.hits == 1
+        assert fc_op[0].meshed_region.nodes.n_nodes == fc[0].meshed_region.nodes.n_nodes
+        fc_op = op.get_output(0, dpf.core.types.fields_container, use_cache=True)
+        assert cache.hits == 2
+        assert np.allclose(fc_op[0].data, fc[0].data)
+        # scopings are hashed when the output is requested, not when they are connected
+        time_scoping = dpf.core.Scoping(ids=[1, 2, 3], location=dpf.core.locations.time_freq)
+        op = dpf.core.operators.result.stress(
+            time_scoping=time_scoping, data_sources=model.metadata.data_sources
+        )
+        assert len(op.get_output(0, dpf.core.types.fields_container, use_cache=True)) == 3
+        time_scoping.ids = [1, 2]
+        assert len(op.get_output(0, dpf.core.types.fields_container, use_cache=True)) == 2
+
+        cache.max_size = 0
+        model.results.stress.on_time_scoping([1]).eval()
+        assert cache.size == 0
+    finally:
+        dpf.core.settings.disable_field_data_cache()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_field_data_cache_default_path(tmpdir, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    cache = dpf.core.field_data_cache.FieldDataCache()
+    assert cache.path.startswith(str(tmpdir))
+    assert os.stat(cache.path).st_mode & 0o777 == 0o700
+
+
 def test_result_split_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
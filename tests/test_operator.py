@@ -1239,3 +1239,21 @@ def test_delete_auto_operator(server_type):
     op = None
     gc.collect()
     assert op_ref() is None
+
+
+def test_lazy_operators_package():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from ansys.dpf import core as dpf\n"
+        "assert 'ansys.dpf.core.operators.result' not in sys.modules\n"
+        "assert 'result' in dir(dpf.operators)\n"
+        "assert 'displacement' in dir(dpf.operators.result)\n"
+        "assert 'ansys.dpf.core.operators.result.displacement' not in sys.modules\n"
+        "from ansys.dpf.core.operators.result.stress import stress\n"
+        "assert dpf.operators.result.stress is stress\n"
+        "assert isinstance(dpf.operators.result.displacement, type)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
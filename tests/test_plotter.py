@@ -611,3 +611,30 @@ def test_plot_warped_mesh(multishells):
                                                      mesh=meshes_cont)
     disp_fc = disp_op.outputs.fields_container()
     meshes_cont.plot(disp_fc, deform_by=disp_result, scale_factor=scale_factor)
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="This test requires pyvista")
+def test_animate_fields_container(plate_msup, tmpdir):
+    model = core.Model(plate_msup)
+    mesh = model.metadata.meshed_region
+    disp = model.results.displacement.on_time_scoping([1, 2, 3, 4]).eval()
+    plotter = Plotter(mesh)
+    with pytest.raises(dpf_errors.FieldContainerPlottingError):
+        plotter.plot_contour(disp, off_screen=True)
+    gif = os.path.join(str(tmpdir), "displacement.gif")
+    plotter.animate(disp, deform_by=disp, scale_factor=100.0, save_as=gif)
+    assert os.path.exists(gif)
+    assert mesh.grid.n_points == mesh.nodes.n_nodes
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="This test requires pyvista")
+def test_plot_skin_only(simple_bar):
+    model = core.Model(simple_bar)
+    mesh = model.metadata.meshed_region
+    field = model.results.displacement().outputs.fields_container()[0]
+    mesh.plot(field, skin_only=True, off_screen=True)
+    skin = mesh.skin
+    pl = DpfPlotter()
+    pl.add_field(field, mesh, deform_by=field, scale_factor=10.0, skin_only=True)
+    assert mesh.skin is skin
+    assert pl._internal_plotter._plotter.mesh.n_cells == skin.elements.n_elements
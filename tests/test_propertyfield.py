@@ -83,6 +83,17 @@ def check_on_property_field_from_simplebar(prop_field):
     assert np.allclose(prop_field.scoping.ids[201], 202)
 
 
+def test_append_many_property_field(server_type):
+    pfield = core.PropertyField(1, core.natures.scalar, core.locations.elemental,
+                                server=server_type)
+    pfield.append([1, 2], 1)
+    pfield.append_many(np.array([2, 3]), [np.array([3, 4, 5]), np.array([6])])
+    assert np.allclose(pfield.data, [1, 2, 3, 4, 5, 6])
+    assert np.allclose(pfield.scoping.ids, [1, 2, 3])
+    assert np.allclose(pfield.get_entity_data(1), [3, 4, 5])
+    assert np.allclose(pfield.get_entity_data(2), [6])
+
+
 def test_getoutput_property_field_operator(property_field):
     check_on_property_field_from_simplebar(property_field)
 
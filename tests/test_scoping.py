@@ -279,6 +279,80 @@ def test_auto_delete_scoping_local():
         assert s[0] == 1
 
 
+def test_index_many_id_many_scoping(server_type):
+    scop = Scoping(server=server_type)
+    scop.ids = [10, 2, 7, 100000]
+    assert np.allclose(scop.index_many([7, 3, 100000]), [2, -1, 3])
+    assert np.allclose(scop.id_many([3, 0]), [100000, 10])
+    with scop.as_local_scoping() as loc:
+        assert isinstance(loc._get_ids(True), np.ndarray)
+        assert loc._get_ids(True).dtype == np.int32
+        assert np.allclose(loc.index_many([7, 3, 100000]), [2, -1, 3])
+        loc.set_id(1, 3)
+        loc.append(2)
+        assert np.allclose(loc.index_many([2, 3, 10]), [4, 1, 0])
+        assert np.allclose(loc.id_many([4, 1]), [2, 3])
+    assert np.allclose(scop.ids, [10, 3, 7, 100000, 2])
+
+
+def test_set_operations_scoping_modified_through_other_reference(server_type):
+    scop = Scoping(server=server_type, ids=[5, 1, 8, 3], location="Nodal")
+    assert np.allclose(scop.intersection([1, 3]).ids, [1, 3])
+    other = Scoping(scoping=scop, server=server_type)
+    other.set_id(0, 7)
+    assert np.allclose(scop.difference([1]).ids, [7, 8, 3])
+    other.ids = [2, 4]
+    assert np.allclose(scop.union([4, 6]).ids, [2, 4, 6])
+
+
+def test_set_operations_scoping_on_server(server_type_remote_process, monkeypatch):
+    monkeypatch.setattr(dpf.core.scoping, "_SERVER_SET_OPERATIONS_MIN_SIZE", 0)
+    scop = Scoping(server=server_type_remote_process, ids=[5, 1, 8, 3], location="Nodal")
+    other = Scoping(server=server_type_remote_process, ids=[3, 7, 5], location="Nodal")
+    if not scop._uses_server_for(other):
+        pytest.skip("Set operations are computed on the server for remote servers only.")
+    assert sorted(scop.intersection(other).ids) == [3, 5]
+    assert sorted(scop.difference(other).ids) == [1, 8]
+    assert sorted(scop.union(other).ids) == [1, 3, 5, 7, 8]
+
+
+def test_local_scoping_interleaved_set_and_index(server_type):
+    scop = Scoping(server=server_type, ids=range(1, 101))
+    with scop.as_local_scoping() as loc:
+        loc.index_many([1])
+        id_index = loc._get_id_index()
+        for i in range(50):
+            loc.set_id(i, 1000 + i)
+            loc.append(2000 + i)
+            assert loc._get_index(1000 + i) == i
+            assert loc._get_index(2000 + i) == 100 + i
+        assert loc._get_id_index() is id_index
+        assert np.allclose(loc.index_many([1, 51, 1049, 2049]), [-1, 50, 49, 149])
+
+
+def test_local_scoping_ids_read_only(server_type):
+    scop = Scoping(server=server_type, ids=[1, 2, 3])
+    with scop.as_local_scoping() as loc:
+        ids = loc._get_ids(True)
+        with pytest.raises(ValueError):
+            ids[0] = 5
+        loc.set_id(0, 5)
+        assert loc._get_index(5) == 0
+        assert np.allclose(loc._get_ids(True), [5, 2, 3])
+
+
+def test_set_operations_scoping(server_type):
+    scop = Scoping(server=server_type, ids=[5, 1, 8, 3, 1], location="Nodal")
+    other = Scoping(server=server_type, ids=[3, 7, 5], location="Nodal")
+    assert scop.isin(other).tolist() == [True, False, False, True, False]
+    assert np.allclose(scop.unique().ids, [5, 1, 8, 3])
+    assert np.allclose(scop.intersection(other).ids, [5, 3])
+    assert np.allclose(scop.difference(other).ids, [1, 8, 1])
+    assert np.allclose(scop.unique().union(other).ids, [5, 1, 8, 3, 7])
+    assert np.allclose(scop.intersection([8, 9]).ids, [8])
+    assert scop.intersection(other).location == "Nodal"
+
+
 @conftest.raises_for_servers_version_under("4.0")
 def test_mutable_ids_data(server_clayer):
     scop = Scoping(server=server_clayer)